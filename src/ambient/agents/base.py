@@ -2,7 +2,8 @@
 
 All specialist agents inherit from SpecialistAgent and implement:
 - _build_system_prompt(): Domain-specific system prompt
-- propose(): Generate proposals from repo context
+- propose(): Generate proposals from repo context (build_messages() and
+  parse_response() are the request/response halves)
 - refine(): Optionally refine proposals after cross-pollination
 """
 
@@ -11,6 +12,7 @@ from __future__ import annotations
 import json
 import re
 from abc import ABC, abstractmethod
+from typing import Any
 
 from ..config import KimiConfig
 from ..kimi_client import KimiClient
@@ -41,16 +43,21 @@ class SpecialistAgent(ABC):
         Returns:
             List of proposals (may be empty if no issues found)
         """
-        prompt = self._format_prompt(context)
-
         response = await self.kimi_client.chat_completion(
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt},
-            ],
+            messages=self.build_messages(context),
             temperature=0.2,  # Low temperature for consistency
         )
+        return self.parse_response(response)
+
+    def build_messages(self, context: RepoContext) -> list[dict[str, str]]:
+        """Return the chat messages propose() sends for this context."""
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": self._prompt_for(context)},
+        ]
 
+    def parse_response(self, response: dict[str, Any]) -> list[Proposal]:
+        """Turn a chat completion response into proposals."""
         content = response["choices"][0]["message"]["content"]
         return self._parse_proposals(content)
 
@@ -79,6 +86,18 @@ class SpecialistAgent(ABC):
         agent_name = self.__class__.__name__
         return [p for p in all_proposals if p.agent == agent_name]
 
+    def _prompt_for(self, context: RepoContext) -> str:
+        """Return the user prompt, sharing one formatted copy across agents.
+
+        The default prompt depends only on the context, so it is memoized on
+        the context itself. Agents that override _format_prompt skip the memo.
+        """
+        if type(self)._format_prompt is not SpecialistAgent._format_prompt:
+            return self._format_prompt(context)
+        if context.prepared_prompt is None:
+            context.prepared_prompt = self._format_prompt(context)
+        return context.prepared_prompt
+
     def _format_prompt(self, context: RepoContext) -> str:
         """
         Format repository context into a prompt for the agent.
@@ -16,6 +16,7 @@ import shlex
 import sys
 from collections import deque
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -278,7 +279,13 @@ def run_once(
         task_spec={"goal": "Manual quality scan", "trigger": "cli"},
     )
 
-    result = asyncio.run(coordinator.run_once(event))
+    async def _run_once() -> dict[str, Any]:
+        try:
+            return await coordinator.run_once(event)
+        finally:
+            await coordinator.kimi_client.aclose()
+
+    result = asyncio.run(_run_once())
 
     # Display results
     click.echo()
@@ -617,7 +624,9 @@ monitoring:
     - __pycache__
     - .git
   debounce_seconds: 5
+  debounce_max_entries: 4096
   check_interval_seconds: 300
+  backend: auto
 
 agents:
   enabled:
@@ -626,6 +635,8 @@ agents:
     - StyleEnforcer
     - PerformanceOptimizer
     - TestEnhancer
+  max_concurrency: 0
+  timeout_seconds: 0
 
 risk_policy:
   auto_apply:
@@ -661,6 +672,8 @@ review_worktree:
   branch_prefix: ambient/review
   max_parallel: 4
   keep_worktrees: true
+  emit_patch_files: true
+  pool_size: 0
 
 git:
   commit_on_success: false
@@ -671,6 +684,7 @@ telemetry:
   log_path: .ambient/telemetry.jsonl
   include_diffs: false
   retention_days: 30
+  level: verbose
 """
 
     config_path.write_text(default_config)
@@ -0,0 +1,233 @@
+"""Concurrency primitives shared by the coordinator and clients."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from types import TracebackType
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# A sample only counts as slow when it exceeds the window's p95 by this factor.
+_SLOW_MARGIN = 1.2
+
+
+class AdaptiveSemaphore:
+    """Async semaphore whose permit limit can be changed while in use.
+
+    Shrinking never revokes permits already held; it only delays new
+    acquisitions until enough holders release. Waiters are served FIFO.
+    """
+
+    def __init__(self, limit: int, *, ceiling: int | None = None, floor: int = 1) -> None:
+        self._ceiling = max(1, ceiling if ceiling is not None else limit)
+        self._floor = max(1, min(floor, self._ceiling))
+        self._limit = self._clamp(limit)
+        self._in_use = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def _clamp(self, limit: int) -> int:
+        return min(max(int(limit), self._floor), self._ceiling)
+
+    async def acquire(self) -> None:
+        if self._in_use < self._limit and not self._waiters:
+            self._in_use += 1
+            return
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted a permit but cancelled before resuming: hand it on.
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(fut)
+            raise
+
+    def release(self) -> None:
+        if self._in_use <= 0:
+            raise ValueError("AdaptiveSemaphore released too many times")
+        self._in_use -= 1
+        self._wake()
+
+    def resize(self, limit: int) -> int:
+        """Set a new permit limit (clamped to [floor, ceiling]); returns the applied limit."""
+        self._limit = self._clamp(limit)
+        self._wake()
+        return self._limit
+
+    def set_ceiling(self, ceiling: int) -> int:
+        """Move the upper bound (never below the floor) and re-clamp the limit."""
+        self._ceiling = max(self._floor, int(ceiling))
+        return self.resize(self._limit)
+
+    def shrink(self) -> int:
+        """Multiplicative decrease: halve the limit."""
+        return self.resize(self._limit // 2)
+
+    def grow(self) -> int:
+        """Additive increase: one more permit."""
+        return self.resize(self._limit + 1)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_use < self._limit:
+            fut = self._waiters.popleft()
+            if fut.done():
+                continue
+            self._in_use += 1
+            fut.set_result(None)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+class LatencyAIMD:
+    """AIMD controller driving an AdaptiveSemaphore from observed latencies.
+
+    Halves the limit after ``slow_streak`` consecutive observations more than
+    20% above the window's p95, and adds one permit after ``fast_streak`` consecutive
+    successful observations below the p50.
+    """
+
+    def __init__(
+        self,
+        semaphore: AdaptiveSemaphore,
+        *,
+        window: int = 50,
+        min_samples: int = 10,
+        slow_streak: int = 3,
+        fast_streak: int = 10,
+    ) -> None:
+        self.semaphore = semaphore
+        self._durations: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._slow_needed = slow_streak
+        self._fast_needed = fast_streak
+        self._slow = 0
+        self._fast = 0
+
+    def observe(self, duration_s: float, ok: bool) -> None:
+        if len(self._durations) >= self._min_samples:
+            ordered = sorted(self._durations)
+            p50 = ordered[len(ordered) // 2]
+            p95 = ordered[min(len(ordered) - 1, (len(ordered) * 95) // 100)]
+
+            if p95 <= 0.0:
+                # All-zero window (e.g. verification with no checks): no signal.
+                # A window of identical non-zero samples needs no special case:
+                # none of them clears the slow margin or falls below p50.
+                self._slow = 0
+                self._fast = 0
+            else:
+                self._slow = self._slow + 1 if duration_s > p95 * _SLOW_MARGIN else 0
+                self._fast = self._fast + 1 if ok and duration_s < p50 else 0
+
+            if self._slow >= self._slow_needed:
+                self.semaphore.shrink()
+                self._slow = 0
+                self._fast = 0
+            elif self._fast >= self._fast_needed:
+                self.semaphore.grow()
+                self._fast = 0
+
+        self._durations.append(duration_s)
+
+
+# Initial slot count for an unbounded ring (maxsize <= 0); it grows on demand.
+_UNBOUNDED_RING_CAPACITY = 1024
+
+
+class EventRing(Generic[T]):
+    """Bounded single-producer/single-consumer FIFO for use on one event loop.
+
+    A preallocated power-of-two slot array indexed by free-running head/tail
+    counters; ``put_nowait`` only wakes the consumer when it is parked in
+    ``get``. Mirrors the ``asyncio.Queue`` subset the coordinator uses, raising
+    ``asyncio.QueueFull`` when full. Not thread-safe: producers on other threads
+    must hop onto the loop first (e.g. via ``call_soon_threadsafe``).
+
+    As with ``asyncio.Queue``, ``maxsize <= 0`` means unbounded: the slot array
+    then starts small and doubles whenever it fills.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = int(maxsize)
+        capacity = 1
+        while capacity < (self.maxsize if self.maxsize > 0 else _UNBOUNDED_RING_CAPACITY):
+            capacity <<= 1
+        self._mask = capacity - 1
+        self._slots: list[T | None] = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._waiter: asyncio.Future[None] | None = None
+
+    def qsize(self) -> int:
+        return self._tail - self._head
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self._tail - self._head
+
+    def put_nowait(self, item: T) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        if self._tail - self._head > self._mask:
+            self._grow()
+        self._slots[self._tail & self._mask] = item
+        self._tail += 1
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _grow(self) -> None:
+        # Unbounded rings only: unroll the live items into a twice-as-large array.
+        size = self._tail - self._head
+        slots: list[T | None] = [self._slots[(self._head + i) & self._mask] for i in range(size)]
+        slots.extend([None] * (len(self._slots) * 2 - size))
+        self._slots = slots
+        self._mask = len(slots) - 1
+        self._head = 0
+        self._tail = size
+
+    def get_nowait(self) -> T:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        index = self._head & self._mask
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head += 1
+        return item  # type: ignore[return-value]
+
+    async def get(self) -> T:
+        while self.empty():
+            if self._waiter is not None and not self._waiter.done():
+                raise RuntimeError("EventRing supports a single consumer")
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self.get_nowait()
@@ -42,9 +42,24 @@ class MonitoringConfig(BaseModel):
     ignore_patterns: list[str] = Field(
         default_factory=lambda: ["*.pyc", "__pycache__", ".git"]
     )
+    # Changes are emitted as one event once no file has changed for this long.
     debounce_seconds: int = 5
+    # Distinct paths held in one debounced burst; reaching it flushes early.
+    debounce_max_entries: int = 4096
     check_interval_seconds: int = 300
+    # Pending events held before new ones are dropped; 0 or less means unbounded.
     max_queue_size: int = 1000
+    # File watcher: watchfiles (async, optional extra), watchdog (observer thread),
+    # or auto (watchfiles when installed, else watchdog).
+    backend: str = "auto"
+
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, v: str) -> str:
+        v = v.strip().lower()
+        if v not in {"auto", "watchdog", "watchfiles"}:
+            raise ValueError("backend must be 'auto', 'watchdog', or 'watchfiles'")
+        return v
 
 
 class AgentSettings(BaseModel):
@@ -110,6 +125,11 @@ class AgentsConfig(BaseModel):
         default_factory=PerformanceOptimizerSettings
     )
     TestEnhancer: TestEnhancerSettings = Field(default_factory=TestEnhancerSettings)
+    # Agents proposing at once; 0 runs every enabled agent concurrently.
+    max_concurrency: int = 0
+    # Per-call cap on propose()/refine(); 0 allows one Kimi request's full retry
+    # budget (AMBIENT_RETRY_MAX attempts x (kimi.timeout_seconds + 120s Retry-After)).
+    timeout_seconds: float = 0.0
 
 
 class RiskPolicyConfig(BaseModel):
@@ -120,6 +140,15 @@ class RiskPolicyConfig(BaseModel):
     file_change_limit: int = 10
     loc_change_limit: int = 500
 
+    def fingerprint(self) -> tuple[Any, ...]:
+        """Hashable snapshot of the policy; changes whenever any setting changes."""
+        return (
+            tuple(self.auto_apply),
+            tuple(self.require_approval),
+            self.file_change_limit,
+            self.loc_change_limit,
+        )
+
 
 class SandboxResourcesConfig(BaseModel):
     """Sandbox resource limits."""
@@ -212,6 +241,11 @@ class ReviewWorktreeConfig(BaseModel):
     branch_prefix: str = "ambient/review"
     max_parallel: int = 4
     keep_worktrees: bool = True
+    # Write each candidate's staged diff to <base_dir>/<run_id>/patches/.
+    emit_patch_files: bool = True
+    # Reusable worktree slots; 0 creates a fresh worktree per candidate. Only used
+    # with git.commit_on_success, since a recycled slot discards uncommitted output.
+    pool_size: int = 0
 
 
 class WebhookApprovalConfig(BaseModel):
@@ -235,6 +269,17 @@ class TelemetryConfig(BaseModel):
     log_path: str = ".ambient/telemetry.jsonl"
     include_diffs: bool = False
     retention_days: int = 30
+    # Minimum event level to record: verbose (everything), standard, or critical
+    # (errors, failures, backoff and the auto-apply kill switch only).
+    level: str = "verbose"
+
+    @field_validator("level")
+    @classmethod
+    def validate_level(cls, v: str) -> str:
+        v = v.strip().lower()
+        if v not in {"verbose", "standard", "critical"}:
+            raise ValueError("level must be 'verbose', 'standard', or 'critical'")
+        return v
 
 
 class ControlPlaneConfig(BaseModel):
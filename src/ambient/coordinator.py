@@ -15,13 +15,22 @@ from __future__ import annotations
 
 import asyncio
 import fnmatch
+import importlib.util
+import itertools
+import os
+import re
+import secrets
 import signal
+import string
+import threading
 import time
-import uuid
-from collections import deque
-from hashlib import sha256
+from collections import Counter, OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from hashlib import blake2b, sha256
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
@@ -35,37 +44,224 @@ from .agents import (
     TestEnhancer,
 )
 from .approval import AlwaysRejectHandler, ApprovalHandler
+from .concurrency import AdaptiveSemaphore, EventRing, LatencyAIMD
 from .config import AmbientConfig
 from .cross_pollination import advanced_cross_pollinate
 from .kimi_client import KimiClient
-from .risk import assess_risk, sort_by_risk_priority
+from .risk import assess_risk_cached, sort_by_risk_priority, trivially_auto_approves
 from .salvaged.git_ops import git_commit, git_has_staged_changes, git_is_clean
 from .salvaged.redaction import redact_text
-from .salvaged.telemetry import TelemetrySink, prune_telemetry_file
-from .types import AmbientEvent, Proposal
+from .salvaged.telemetry import (
+    TelemetryLevel,
+    TelemetrySink,
+    bind_run_id,
+    prune_telemetry_file,
+)
+from .types import AmbientEvent, ApplyOutcome, ErrorCapture, Proposal, VerificationResult
 from .workspace import Workspace
 from .worktrees import ReviewCandidate, ReviewWorktreeManager
 
+# Map agent names (as used in config) to classes
+_AGENT_CLASSES: dict[str, type[SpecialistAgent]] = {
+    "SecurityGuardian": SecurityGuardian,
+    "RefactorArchitect": RefactorArchitect,
+    "StyleEnforcer": StyleEnforcer,
+    "PerformanceOptimizer": PerformanceOptimizer,
+    "TestEnhancer": TestEnhancer,
+}
+
+# Task specs are constant per trigger and only ever serialized into the repo
+# pack, so events share these instead of allocating a dict per event.
+_FILE_CHANGE_TASK_SPEC: dict[str, Any] = {
+    "goal": "Continuous code quality monitoring",
+    "trigger": "file_change",
+}
+_PERIODIC_TASK_SPEC: dict[str, Any] = {"goal": "Periodic quality scan", "trigger": "periodic"}
+_MANUAL_TASK_SPEC: dict[str, Any] = {"goal": "Periodic quality scan", "trigger": "manual"}
+
+# Watcher events handed to the loop per batch, at most.
+_EVENT_BATCH_MAX = 64
+
+# A continuous stream of changes is flushed after this many debounce windows.
+_DEBOUNCE_MAX_DELAY_FACTOR = 3
+
+# Content digests remembered to suppress saves that did not change a file, and the
+# largest file worth hashing (bigger files always count as changed).
+_CONTENT_HASH_MAX_ENTRIES = 2048
+_CONTENT_HASH_MAX_BYTES = 1 << 20
+
+# A recorded (size, mtime) only vouches for a file's content if the mtime was
+# already this old when the file was hashed; a write landing in the same
+# timestamp tick could otherwise go unnoticed.
+_CONTENT_STAT_RACY_NS = 2_000_000_000
+
+# (size, mtime_ns, stat_trusted, digest) of a file's content.
+_ContentSignature = tuple[int, int, bool, bytes]
+
+# Run ids are 12 hex digits: 8 from a process-wide counter seeded from the clock
+# (256 ids per second of start time), so ids within a process stay ordered, then 4
+# random per-process digits so processes started in the same second do not share
+# a sequence in one telemetry file or in review branch names.
+_RUN_IDS = itertools.count((int(time.time()) & 0xFFFFFF) << 8)
+_RUN_ID_SALT = f"{secrets.randbits(16):04x}"
+
+
+def _next_run_id() -> str:
+    return f"{next(_RUN_IDS) & 0xFFFFFFFF:08x}{_RUN_ID_SALT}"
+
+
+_T = TypeVar("_T")
+
+
+class _OutcomeWindow:
+    """Last ``maxlen`` success/failure outcomes with an O(1) running failure count."""
+
+    __slots__ = ("_items", "failures")
+
+    def __init__(self, maxlen: int) -> None:
+        self._items: deque[bool] = deque(maxlen=maxlen)
+        self.failures = 0
+
+    def append(self, ok: bool) -> None:
+        items = self._items
+        if len(items) == items.maxlen and not items[0]:
+            self.failures -= 1
+        items.append(ok)
+        if not ok:
+            self.failures += 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile glob patterns into one alternation regex (None if there are none)."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def _fallback_commit_subject(*, title: str, agent: str) -> str:
+    return f"ambient: {title} ({agent})"
+
+
+def _compile_commit_subject(template: str) -> Callable[..., str]:
+    """Pre-parse the commit subject template into a formatter.
+
+    Templates using only plain ``{title}``/``{agent}`` fields become a join over
+    the parsed (literal, field) pairs; anything fancier (format specs,
+    conversions, indexing, attribute access) keeps ``str.format`` and falls back
+    to the default subject whenever formatting a commit fails, as before.
+    Templates that do not parse always use the default subject.
+    """
+    try:
+        parts = list(string.Formatter().parse(template))
+    except ValueError:
+        return _fallback_commit_subject
+
+    if not all(
+        field is None or (field in ("title", "agent") and not spec and conversion is None)
+        for _, field, spec, conversion in parts
+    ):
+
+        def _formatted(*, title: str, agent: str) -> str:
+            try:
+                return template.format(title=title, agent=agent)
+            except Exception:
+                return _fallback_commit_subject(title=title, agent=agent)
+
+        return _formatted
+
+    pieces = tuple((literal, field) for literal, field, _, _ in parts)
+
+    def _subject(*, title: str, agent: str) -> str:
+        values = {"title": title, "agent": agent}
+        return "".join(
+            [literal + values[field] if field else literal for literal, field in pieces]
+        )
+
+    return _subject
+
+
+def _outcome_lists(
+    applied: list[ApplyOutcome], failed: list[ApplyOutcome]
+) -> dict[str, list[dict[str, Any]]]:
+    """Convert internal outcomes to the dict lists returned by the coordinator API."""
+    return {
+        "applied": [o.to_dict() for o in applied],
+        "failed": [o.to_dict() for o in failed],
+    }
+
+
+def _error_payload(proposal: Proposal, error: BaseException) -> dict[str, Any]:
+    return {"proposal_title": proposal.title, "error": redact_text(str(error), max_len=200)}
+
+
+def _verify_failed_payload(proposal: Proposal, verify_result: VerificationResult) -> dict[str, Any]:
+    """Summarize failed verification checks for telemetry (redacted, bounded)."""
+    return {
+        "proposal_title": proposal.title,
+        "results": [
+            {
+                "name": r.get("name"),
+                "ok": r.get("ok"),
+                "exit_code": r.get("exit_code"),
+                "duration_s": r.get("duration_s"),
+                "message": redact_text((r.get("stderr") or r.get("stdout") or ""), max_len=200)
+                if not r.get("ok")
+                else "",
+            }
+            for r in verify_result.results
+        ],
+    }
+
 
 class AmbientEventHandler(FileSystemEventHandler):
     """File system event handler that enqueues changes."""
 
     def __init__(
         self,
-        event_queue: asyncio.Queue[AmbientEvent],
+        event_queue: asyncio.Queue[AmbientEvent] | EventRing[AmbientEvent],
         loop: asyncio.AbstractEventLoop,
         repo_root: Path,
         ignore_patterns: list[str] | None = None,
         telemetry_sink: TelemetrySink | None = None,
-        debounce_seconds: int = 5,
+        debounce_seconds: float = 5,
+        debounce_max_entries: int = 4096,
+        batch_window_seconds: float = 0.05,
+        drop_summary_seconds: float = 60.0,
     ):
         self.event_queue = event_queue
         self.loop = loop
         self.repo_root = Path(repo_root).resolve()
+        self._repo_root_prefix = str(self.repo_root).rstrip(os.sep) + os.sep
         self.ignore_patterns = ignore_patterns or []
+        self._ignore_re = _compile_globs(self.ignore_patterns)
         self.telemetry_sink = telemetry_sink
         self.debounce_seconds = debounce_seconds
-        self._last_event_by_path: dict[str, float] = {}
+        self.debounce_max_entries = max(1, debounce_max_entries)
+        # Trailing-edge debounce: admitted changes collect here (rel path ->
+        # (event_type, absolute path), most recently changed last) and are emitted
+        # as one event once debounce_seconds pass without a new change. A steady
+        # stream is still flushed after _DEBOUNCE_MAX_DELAY_FACTOR windows.
+        self._pending: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._pending_since = 0.0
+        self._pending_handle: asyncio.TimerHandle | None = None
+        # Bounded LRU of rel path -> (size, mtime_ns, stat_trusted, digest) of the
+        # content last emitted for it.
+        self._content_hashes: OrderedDict[str, _ContentSignature] = OrderedDict()
+        # Events collected on the watchdog thread until the window elapses or the
+        # batch fills, then handed to the loop with one call_soon_threadsafe.
+        self.batch_window_seconds = batch_window_seconds
+        self._batch: list[tuple[str, str]] = []
+        self._batch_lock = threading.Lock()
+        self._batch_timer: threading.Timer | None = None
+        # Dropped events are counted per reason and logged as one
+        # event_dropped_summary per window instead of one record per drop.
+        self.drop_summary_seconds = drop_summary_seconds
+        self._drop_counts: Counter[str] = Counter()
+        self._drop_samples: dict[str, str] = {}
+        self._drop_summary_handle: asyncio.TimerHandle | None = None
 
         # Defense-in-depth ignores so we don't self-trigger or watch secrets.
         self._always_ignore_components = {
@@ -76,85 +272,245 @@ class AmbientEventHandler(FileSystemEventHandler):
             ".pytest_cache",
             "__pycache__",
         }
+        self._dot_segment = os.sep + "."
 
     def on_any_event(self, event: FileSystemEvent) -> None:
-        """Handle any filesystem event."""
+        """Buffer a filesystem event; batches are filtered on the coordinator loop."""
         # Ignore directory events and non-modify events
         if event.is_directory:
             return
 
-        # Resolve path relative to repo_root (best-effort).
+        item = (event.event_type, os.fsdecode(event.src_path))
+        with self._batch_lock:
+            self._batch.append(item)
+            pending = len(self._batch)
+            if pending == 1 and self.batch_window_seconds > 0:
+                self._batch_timer = threading.Timer(self.batch_window_seconds, self.flush)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+        if pending >= _EVENT_BATCH_MAX or self.batch_window_seconds <= 0:
+            self.flush()
+
+    def process_changes(self, changes: Iterable[tuple[str, str]]) -> None:
+        """Filter, debounce and enqueue (event_type, path) pairs already on the loop."""
+        self._process_batch(list(changes))
+
+    def flush(self) -> None:
+        """Hand buffered events to the coordinator loop in one thread-safe call."""
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+            timer, self._batch_timer = self._batch_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not batch:
+            return
         try:
-            src_abs = Path(str(event.src_path)).resolve()
-            rel = str(src_abs.relative_to(self.repo_root))
-        except Exception:
-            # Ignore events outside repo root or invalid paths.
+            self.loop.call_soon_threadsafe(self._process_batch, batch)
+        except RuntimeError:
+            # Loop already closed during shutdown; nothing left to deliver to.
+            pass
+
+    def _process_batch(self, batch: list[tuple[str, str]]) -> None:
+        """Filter a batch of (event_type, src_path) on the loop and debounce the rest."""
+        if self.debounce_seconds <= 0:
+            # No debounce: every admitted change is its own event.
+            for event_type, src in batch:
+                admitted = self._admit(event_type, src)
+                if admitted is not None:
+                    rel, src_abs = admitted
+                    self._enqueue({rel: (event_type, src_abs)})
             return
 
-        # Always ignore certain directories/components.
-        parts = Path(rel).parts
-        if any(p in self._always_ignore_components for p in parts):
-            if self.telemetry_sink:
-                self.telemetry_sink.log(
-                    "monitor",
-                    "event_dropped",
-                    {"reason": "always_ignore", "path": rel, "event_type": event.event_type},
-                )
+        pending = self._pending
+        for event_type, src in batch:
+            admitted = self._admit(event_type, src)
+            if admitted is None:
+                continue
+            rel, src_abs = admitted
+            if not pending:
+                self._pending_since = time.monotonic()
+            pending[rel] = (event_type, src_abs)
+            pending.move_to_end(rel)
+            if len(pending) >= self.debounce_max_entries:
+                self.flush_pending()
+
+        if pending:
+            # Restart the quiet period, unless the burst has run past its cap.
+            deadline = self._pending_since + self.debounce_seconds * _DEBOUNCE_MAX_DELAY_FACTOR
+            delay = min(self.debounce_seconds, max(0.0, deadline - time.monotonic()))
+            if self._pending_handle is not None:
+                self._pending_handle.cancel()
+            self._pending_handle = self.loop.call_later(delay, self.flush_pending)
+
+    def flush_pending(self) -> None:
+        """Emit the debounced changes collected so far as a single event."""
+        handle, self._pending_handle = self._pending_handle, None
+        if handle is not None:
+            handle.cancel()
+        if not self._pending:
             return
+        changes, self._pending = self._pending, OrderedDict()
+        self._enqueue(changes)
 
-        # User-configured ignore patterns (glob-style).
-        for pat in self.ignore_patterns:
-            if fnmatch.fnmatch(rel, pat) or fnmatch.fnmatch(Path(rel).name, pat):
-                if self.telemetry_sink:
-                    self.telemetry_sink.log(
-                        "monitor",
-                        "event_dropped",
-                        {"reason": "ignore_pattern", "pattern": pat, "path": rel, "event_type": event.event_type},
-                    )
-                return
+    def _content_signature(self, rel: str, src_abs: str) -> _ContentSignature | None:
+        """Signature of the file's current content, or None if it cannot be hashed.
 
-        # Simple debouncing
-        current_time = time.time()
-        last = self._last_event_by_path.get(rel, 0.0)
-        if current_time - last < self.debounce_seconds:
+        The file is only read when its size or mtime differs from what was recorded
+        (or the recorded stat was too fresh to trust).
+        """
+        try:
+            st = os.stat(src_abs)
+        except OSError:
+            return None
+        if st.st_size > _CONTENT_HASH_MAX_BYTES:
+            return None
+        prev = self._content_hashes.get(rel)
+        if (
+            prev is not None
+            and prev[2]
+            and prev[0] == st.st_size
+            and prev[1] == st.st_mtime_ns
+        ):
+            return prev
+        try:
+            with open(src_abs, "rb") as f:
+                data = f.read(_CONTENT_HASH_MAX_BYTES + 1)
+        except OSError:
+            return None
+        if len(data) > _CONTENT_HASH_MAX_BYTES:
+            return None
+        trusted = st.st_mtime_ns < time.time_ns() - _CONTENT_STAT_RACY_NS
+        return (st.st_size, st.st_mtime_ns, trusted, blake2b(data, digest_size=16).digest())
+
+    def _remember_content(self, rel: str, signature: _ContentSignature | None) -> None:
+        hashes = self._content_hashes
+        if signature is None:
+            # Deleted, unreadable or too large: nothing to compare against later.
+            hashes.pop(rel, None)
             return
-
-        self._last_event_by_path[rel] = current_time
-
-        # Create ambient event
+        hashes[rel] = signature
+        hashes.move_to_end(rel)
+        if len(hashes) > _CONTENT_HASH_MAX_ENTRIES:
+            hashes.popitem(last=False)
+
+    def _enqueue(self, changes: dict[str, tuple[str, str]]) -> None:
+        """Enqueue one file_change event for ``changes``; the latest change leads.
+
+        Paths whose content is byte-for-byte what was last emitted (touch-saves,
+        write-and-rename of identical content) are left out. New digests are only
+        recorded once the event is queued, so a dropped event is not suppressed
+        as unchanged later.
+        """
+        hashes = self._content_hashes
+        signatures: dict[str, _ContentSignature | None] = {}
+        rel_paths: list[str] = []
+        for rel, (_, src_abs) in changes.items():
+            signature = self._content_signature(rel, src_abs)
+            prev = hashes.get(rel)
+            if signature is not None and prev is not None and prev[3] == signature[3]:
+                # Same content: refreshing the stat is safe whether or not we enqueue.
+                self._remember_content(rel, signature)
+                continue
+            signatures[rel] = signature
+            rel_paths.append(rel)
+        if not rel_paths:
+            if self.telemetry_sink:
+                self._count_drop("unchanged_content", next(iter(changes)))
+            return
+        rel = rel_paths[-1]
+        event_type, src_abs = changes[rel]
         ambient_event = AmbientEvent(
             type="file_change",
             data={
-                "event_type": event.event_type,
-                "src_path": str(src_abs),
+                "event_type": event_type,
+                "src_path": src_abs,
                 "rel_path": rel,
-                "timestamp": current_time,
-            },
-            task_spec={
-                "goal": "Continuous code quality monitoring",
-                "trigger": "file_change",
+                "rel_paths": rel_paths,
+                "timestamp": time.time(),
             },
+            task_spec=_FILE_CHANGE_TASK_SPEC,
         )
+        try:
+            self.event_queue.put_nowait(ambient_event)
+        except asyncio.QueueFull:
+            if self.telemetry_sink:
+                self._count_drop("queue_full", rel)
+            return
+        for changed_rel, signature in signatures.items():
+            self._remember_content(changed_rel, signature)
+        if self.telemetry_sink:
+            self.telemetry_sink.log(
+                "monitor",
+                "event_enqueued",
+                {"path": rel, "paths": len(rel_paths), "event_type": event_type},
+                level=TelemetryLevel.VERBOSE,
+            )
 
-        def _put_nowait() -> None:
+    def _admit(self, event_type: str, src: str) -> tuple[str, str] | None:
+        """Return (rel_path, absolute path) for ``src`` unless it is ignored."""
+        # Path relative to repo_root. Watchdog reports absolute paths under the watched
+        # root, so a prefix slice avoids a resolve() (stat/readlink walk) per event;
+        # anything else (symlinked roots, relative paths) takes the slow path.
+        if src.startswith(self._repo_root_prefix):
+            src_abs = src
+            rel = src[len(self._repo_root_prefix) :]
+        else:
             try:
-                self.event_queue.put_nowait(ambient_event)
-                if self.telemetry_sink:
-                    self.telemetry_sink.log(
-                        "monitor",
-                        "event_enqueued",
-                        {"path": rel, "event_type": event.event_type},
-                    )
-            except asyncio.QueueFull:
+                resolved = Path(src).resolve()
+                rel = str(resolved.relative_to(self.repo_root))
+            except Exception:
+                # Ignore events outside repo root or invalid paths.
+                return None
+            src_abs = str(resolved)
+
+        # Always ignore certain directories/components. Each one is a dot-directory
+        # or __pycache__, so ordinary source paths are cleared by two substring
+        # scans without splitting the path.
+        if (
+            rel[:1] == "." or self._dot_segment in rel or "__pycache__" in rel
+        ) and not self._always_ignore_components.isdisjoint(rel.split(os.sep)):
+            if self.telemetry_sink:
+                self._count_drop("always_ignore", rel)
+            return None
+
+        # User-configured ignore patterns (glob-style), matched against the
+        # repo-relative path and the basename.
+        if self._ignore_re is not None:
+            name = rel.rpartition(os.sep)[2]
+            if self._ignore_re.match(rel) or self._ignore_re.match(name):
                 if self.telemetry_sink:
-                    self.telemetry_sink.log(
-                        "monitor",
-                        "event_dropped",
-                        {"reason": "queue_full", "path": rel, "event_type": event.event_type},
-                    )
+                    self._count_drop("ignore_pattern", rel)
+                return None
+
+        return rel, src_abs
 
-        # Enqueue in the coordinator loop (thread-safe).
-        self.loop.call_soon_threadsafe(_put_nowait)
+    def _count_drop(self, reason: str, rel: str) -> None:
+        """Count a dropped event; the first drop in a window schedules its summary."""
+        if not self._drop_counts:
+            self._drop_summary_handle = self.loop.call_later(
+                self.drop_summary_seconds, self.flush_drop_summary
+            )
+        self._drop_counts[reason] += 1
+        self._drop_samples.setdefault(reason, rel)
+
+    def flush_drop_summary(self) -> None:
+        """Log counted drops as one event_dropped_summary record and reset the window."""
+        handle, self._drop_summary_handle = self._drop_summary_handle, None
+        if handle is not None:
+            handle.cancel()
+        if not self._drop_counts or self.telemetry_sink is None:
+            return
+        counts, self._drop_counts = self._drop_counts, Counter()
+        samples, self._drop_samples = self._drop_samples, {}
+        self.telemetry_sink.log(
+            "monitor",
+            "event_dropped_summary",
+            {
+                "window_seconds": self.drop_summary_seconds,
+                "counts": dict(counts),
+                "sample_paths": samples,
+            },
+        )
 
 
 class AmbientCoordinator:
@@ -175,11 +531,28 @@ class AmbientCoordinator:
         self.telemetry = TelemetrySink(
             enabled=self.config.telemetry.enabled,
             path=self.repo_path / self.config.telemetry.log_path,
+            min_level=TelemetryLevel[self.config.telemetry.level.upper()],
         )
-        self.event_queue: asyncio.Queue[AmbientEvent] = asyncio.Queue(
-            maxsize=self.config.monitoring.max_queue_size
+        # Only touched from the loop (watcher batches hop over via call_soon_threadsafe).
+        self.event_queue: EventRing[AmbientEvent] = EventRing(
+            self.config.monitoring.max_queue_size
         )
         self.write_lock = asyncio.Lock()
+        # Resolve the commit subject template once; an invalid template falls back
+        # to the default format for every proposal instead of failing per commit.
+        self._format_commit_subject = _compile_commit_subject(
+            self.config.git.commit_message_template
+        )
+        # Git subprocess work for review worktrees (commits) runs here, off the event loop.
+        self._git_pool = ThreadPoolExecutor(
+            max_workers=max(1, int(self.config.review_worktree.max_parallel)),
+            thread_name_prefix="ambient-git",
+        )
+        # Review apply/verify slots persist across runs so the AIMD controller can
+        # back off on slow verifications; the configured max_parallel is the ceiling.
+        max_parallel = max(1, int(self.config.review_worktree.max_parallel))
+        self._review_slots = AdaptiveSemaphore(max_parallel, ceiling=max_parallel)
+        self._review_slots_aimd = LatencyAIMD(self._review_slots)
         self.workspace = Workspace(
             self.repo_path,
             self.config.sandbox.image,
@@ -195,6 +568,8 @@ class AmbientCoordinator:
             sandbox_repo_mount_mode=self.config.sandbox.repo_mount_mode,
             verification_timeout_seconds=self.config.verification.timeout_seconds,
         )
+        # Review worktree workspaces, reused until their candidate is removed.
+        self._workspace_cache: dict[Path, Workspace] = {}
         self.review_manager = ReviewWorktreeManager(
             repo_path=self.repo_path,
             base_dir=self.repo_path / self.config.review_worktree.base_dir,
@@ -203,15 +578,14 @@ class AmbientCoordinator:
         self.kimi_client = KimiClient(self.config.kimi)
         self.agents: list[SpecialistAgent] = []
         self._running = False
+        # Set by stop()/signals so the main loop wakes immediately instead of polling.
+        self._stop_event = asyncio.Event()
 
         # Control-plane state (in-memory, resets on restart).
         self._proposal_timestamps: deque[float] = deque()
-        self._apply_outcomes: deque[bool] = deque(
-            maxlen=max(1, int(self.config.control_plane.failure_rate_window))
-        )
-        self._verify_outcomes: deque[bool] = deque(
-            maxlen=max(1, int(self.config.control_plane.failure_rate_window))
-        )
+        failure_window = max(1, int(self.config.control_plane.failure_rate_window))
+        self._apply_outcomes = _OutcomeWindow(failure_window)
+        self._verify_outcomes = _OutcomeWindow(failure_window)
         self._backoff_seconds: int = 0
         self._backoff_until: float = 0.0
 
@@ -224,9 +598,16 @@ class AmbientCoordinator:
             self.approval_handler = approval_handler
 
         self._periodic_task: asyncio.Task[None] | None = None
+        self._watch_task: asyncio.Task[None] | None = None
 
     def _workspace_for_path(self, repo_path: Path) -> Workspace:
-        """Create a workspace bound to a specific path with current sandbox policy."""
+        """Return the workspace bound to a path, creating it with current sandbox policy."""
+        workspace = self._workspace_cache.get(repo_path)
+        if workspace is None:
+            workspace = self._workspace_cache[repo_path] = self._create_workspace(repo_path)
+        return workspace
+
+    def _create_workspace(self, repo_path: Path) -> Workspace:
         return Workspace(
             repo_path,
             self.config.sandbox.image,
@@ -245,46 +626,42 @@ class AmbientCoordinator:
 
     def _init_agents(self) -> None:
         """Initialize specialist agents based on config."""
-        self.agents = []
-
-        enabled_agents = self.config.agents.enabled
-
-        # Map agent names to classes
-        agent_classes: dict[str, type[Any]] = {
-            "SecurityGuardian": SecurityGuardian,
-            "RefactorArchitect": RefactorArchitect,
-            "StyleEnforcer": StyleEnforcer,
-            "PerformanceOptimizer": PerformanceOptimizer,
-            "TestEnhancer": TestEnhancer,
-        }
-
-        # Instantiate enabled agents
-        for agent_name in enabled_agents:
-            if agent_name in agent_classes:
-                agent_class = agent_classes[agent_name]
-                agent = cast(SpecialistAgent, agent_class(self.config.kimi, kimi_client=self.kimi_client))
-                self.agents.append(agent)
+        self.agents = [
+            _AGENT_CLASSES[agent_name](self.config.kimi, kimi_client=self.kimi_client)
+            for agent_name in self.config.agents.enabled
+            if agent_name in _AGENT_CLASSES
+        ]
 
     async def start(self) -> None:
         """Start ambient monitoring loop."""
         self._running = True
+        self._stop_event.clear()
         self._init_agents()
 
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             try:
-                loop.add_signal_handler(sig, lambda: setattr(self, "_running", False))
+                loop.add_signal_handler(sig, self._request_stop)
             except (NotImplementedError, RuntimeError):
                 # Not supported on some platforms / event loops.
                 pass
 
         # Start filesystem watcher
         observer: Any | None = None
+        event_handler: AmbientEventHandler | None = None
         if self.telemetry.enabled:
             prune_telemetry_file(self.telemetry.path, self.config.telemetry.retention_days)
 
         if self.config.monitoring.enabled:
-            observer = Observer()
+            backend = self.config.monitoring.backend
+            watchfiles_installed = importlib.util.find_spec("watchfiles") is not None
+            if backend == "auto":
+                backend = "watchfiles" if watchfiles_installed else "watchdog"
+            elif backend == "watchfiles" and not watchfiles_installed:
+                raise RuntimeError(
+                    "monitoring.backend 'watchfiles' requires the watchfiles package "
+                    "(pip install 'ambient-swarm[watchfiles]')"
+                )
             event_handler = AmbientEventHandler(
                 self.event_queue,
                 loop=loop,
@@ -292,34 +669,54 @@ class AmbientCoordinator:
                 ignore_patterns=self.config.monitoring.ignore_patterns,
                 telemetry_sink=self.telemetry if self.telemetry.enabled else None,
                 debounce_seconds=self.config.monitoring.debounce_seconds,
+                debounce_max_entries=self.config.monitoring.debounce_max_entries,
             )
 
-            for watch_path in self.config.monitoring.watch_paths:
-                full_path = self.repo_path / watch_path
-                if full_path.exists():
+            watch_paths = [
+                full_path
+                for full_path in (self.repo_path / p for p in self.config.monitoring.watch_paths)
+                if full_path.exists()
+            ]
+            if backend == "watchfiles":
+                self._watch_task = asyncio.create_task(
+                    self._watch_loop(event_handler, watch_paths)
+                )
+            else:
+                observer = Observer()
+                for full_path in watch_paths:
                     observer.schedule(event_handler, str(full_path), recursive=True)
-
-            observer.start()
+                observer.start()
 
             # Periodic scan loop
             self._periodic_task = asyncio.create_task(self._periodic_scan_loop())
 
+        # Open the model connection while waiting for the first event.
+        warmup = asyncio.create_task(self.kimi_client.warmup())
+
+        # Race queue reads against the stop signal; a pending get survives backoff
+        # waits and is only replaced once it has delivered an event.
+        stop_wait = asyncio.create_task(self._stop_event.wait())
+        get_task: asyncio.Task[AmbientEvent] | None = None
         try:
             # Main event loop
             while self._running:
                 now = time.time()
                 if now < self._backoff_until:
-                    await asyncio.sleep(min(1.0, self._backoff_until - now))
+                    await asyncio.wait({stop_wait}, timeout=self._backoff_until - now)
                     continue
-                try:
-                    # Wait for event with timeout to allow clean shutdown
-                    event = await asyncio.wait_for(
-                        self.event_queue.get(), timeout=1.0
-                    )
+                if get_task is None:
+                    get_task = asyncio.create_task(self.event_queue.get())
+                await asyncio.wait({get_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                if get_task.done():
+                    event = get_task.result()
+                    get_task = None
                     await self._handle_event(event)
-                except TimeoutError:
-                    continue
         finally:
+            stop_wait.cancel()
+            warmup.cancel()
+            if get_task is not None:
+                get_task.cancel()
+
             if self._periodic_task:
                 self._periodic_task.cancel()
                 try:
@@ -327,9 +724,44 @@ class AmbientCoordinator:
                 except asyncio.CancelledError:
                     pass
 
+            if self._watch_task:
+                self._watch_task.cancel()
+                try:
+                    await self._watch_task
+                except asyncio.CancelledError:
+                    pass
+
             if observer is not None:
                 observer.stop()
                 observer.join()
+            if event_handler is not None:
+                event_handler.flush_drop_summary()
+
+            await self.kimi_client.aclose()
+
+            # Drain buffered telemetry without blocking the event loop.
+            await asyncio.to_thread(self.telemetry.flush)
+
+    async def _watch_loop(self, handler: AmbientEventHandler, paths: list[Path]) -> None:
+        """Feed watchfiles change batches through the handler on the event loop.
+
+        watchfiles coalesces kernel notifications in native code and yields whole
+        batches, so there is no observer thread or per-event loop hop. Ignore
+        rules, debouncing and telemetry still come from ``handler``.
+        """
+        if not paths:
+            return
+        from watchfiles import Change, awatch
+
+        names = {Change.added: "created", Change.modified: "modified", Change.deleted: "deleted"}
+        step_ms = max(1, int(handler.batch_window_seconds * 1000))
+        async for changes in awatch(
+            *paths,
+            debounce=step_ms * 2,
+            step=step_ms,
+            stop_event=self._stop_event,
+        ):
+            handler.process_changes((names[change], path) for change, path in changes)
 
     async def _periodic_scan_loop(self) -> None:
         """Enqueue periodic_scan events on an interval while running."""
@@ -339,7 +771,7 @@ class AmbientCoordinator:
             ev = AmbientEvent(
                 type="periodic_scan",
                 data={"timestamp": time.time(), "trigger": "timer"},
-                task_spec={"goal": "Periodic quality scan", "trigger": "periodic"},
+                task_spec=_PERIODIC_TASK_SPEC,
             )
             try:
                 self.event_queue.put_nowait(ev)
@@ -350,7 +782,11 @@ class AmbientCoordinator:
 
     async def stop(self) -> None:
         """Stop ambient monitoring."""
+        self._request_stop()
+
+    def _request_stop(self) -> None:
         self._running = False
+        self._stop_event.set()
 
     async def run_once(self, event: AmbientEvent | None = None) -> dict[str, Any]:
         """
@@ -366,7 +802,7 @@ class AmbientCoordinator:
             event = AmbientEvent(
                 type="periodic_scan",
                 data={"timestamp": time.time()},
-                task_spec={"goal": "Periodic quality scan", "trigger": "manual"},
+                task_spec=_MANUAL_TASK_SPEC,
             )
 
         self._init_agents()
@@ -379,29 +815,31 @@ class AmbientCoordinator:
         Returns:
             Dict with cycle results (proposals, applications, verifications)
         """
-        run_id = str(uuid.uuid4())[:8]
+        run_id = _next_run_id()
+        # Every task the cycle spawns inherits the binding, so emit() needs no run id.
+        with bind_run_id(run_id):
+            return await self._run_cycle(event, run_id)
 
+    async def _run_cycle(self, event: AmbientEvent, run_id: str) -> dict[str, Any]:
         # Log cycle start
-        self.telemetry.log(
-            run_id,
+        self.telemetry.emit(
             "cycle_started",
             {"event_type": event.type, "event_data": event.data, "queue_depth": self.event_queue.qsize()},
         )
 
         try:
             if self.config.control_plane.paused:
-                self.telemetry.log(run_id, "cycle_completed", {"status": "paused"})
+                self.telemetry.emit("cycle_completed", {"status": "paused"})
                 return {"run_id": run_id, "status": "paused"}
 
             # 1. Build full context
             context = await self.workspace.build_context(event)
 
             # 2. Spawn swarm in parallel
-            proposals = await self._generate_proposals(context, run_id)
+            proposals = await self._generate_proposals(context)
 
             if not proposals:
-                self.telemetry.log(
-                    run_id,
+                self.telemetry.emit(
                     "cycle_completed",
                     {"status": "no_proposals", "proposals_count": 0},
                 )
@@ -422,8 +860,7 @@ class AmbientCoordinator:
                 while self._proposal_timestamps and self._proposal_timestamps[0] < cutoff:
                     self._proposal_timestamps.popleft()
                 if len(self._proposal_timestamps) > max_ph:
-                    self.telemetry.log(
-                        run_id,
+                    self.telemetry.emit(
                         "control_plane_throttled",
                         {"max_proposals_per_hour": max_ph, "current_window": len(self._proposal_timestamps)},
                     )
@@ -436,7 +873,7 @@ class AmbientCoordinator:
                     }
 
             # 3. Cross-pollination (agents refine based on each other's work)
-            refined = await self._cross_pollinate(proposals, context, run_id)
+            refined = await self._cross_pollinate(proposals, context)
 
             # 4. Risk-based sorting
             sorted_proposals = sort_by_risk_priority(refined)
@@ -448,8 +885,7 @@ class AmbientCoordinator:
                 sorted_proposals, run_id, dry_run
             )
 
-            self.telemetry.log(
-                run_id,
+            self.telemetry.emit(
                 "cycle_completed",
                 {
                     "status": "success",
@@ -474,28 +910,30 @@ class AmbientCoordinator:
             )
             if self._backoff_seconds:
                 self._backoff_until = time.time() + self._backoff_seconds
-            self.telemetry.log(
-                run_id,
+            self.telemetry.emit(
                 "cycle_completed",
                 {"status": "error", "error": redact_text(str(e), max_len=200)},
+                level=TelemetryLevel.CRITICAL,
             )
             return {
                 "run_id": run_id,
                 "status": "error",
                 "error": str(e),
             }
+        finally:
+            # Land the whole run's events on disk before returning to the caller.
+            if self.telemetry.enabled:
+                await asyncio.to_thread(self.telemetry.flush)
 
     async def _generate_proposals(
         self,
         context: Any,
-        run_id: str,
     ) -> list[Proposal]:
         """
         Generate proposals from all agents in parallel.
 
         Args:
             context: Repository context
-            run_id: Unique run identifier
 
         Returns:
             List of proposals from all agents
@@ -504,49 +942,99 @@ class AmbientCoordinator:
             # No agents configured
             return []
 
-        # Run all agents in parallel
-        proposal_lists: list[list[Proposal] | BaseException] = await asyncio.gather(
-            *[agent.propose(context) for agent in self.agents], return_exceptions=True
-        )
+        timeout = self._agent_timeout()
+        slots = self._agent_slots()
 
-        # Flatten and log
-        proposals: list[Proposal] = []
-        for i, result in enumerate(proposal_lists):
-            if isinstance(result, BaseException):
-                agent_name = self.agents[i].__class__.__name__
-                self.telemetry.log(
-                    run_id,
+        async def _safe_propose(
+            index: int, agent: SpecialistAgent
+        ) -> tuple[int, list[Proposal] | Exception]:
+            # A failing or slow agent must not take down the rest of the group.
+            try:
+                return index, await self._call_agent(partial(agent.propose, context), slots)
+            except Exception as e:
+                return index, e
+
+        # Log each agent's results as it finishes; the returned list keeps agent order.
+        per_agent: list[list[Proposal]] = [[] for _ in self.agents]
+        pending = [_safe_propose(i, agent) for i, agent in enumerate(self.agents)]
+        for next_done in asyncio.as_completed(pending):
+            i, result = await next_done
+            if isinstance(result, TimeoutError):
+                self._log_agent_timeout(self.agents[i], "propose", timeout)
+            elif isinstance(result, Exception):
+                self.telemetry.emit(
                     "agent_error",
-                    {"agent": agent_name, "error": str(result)},
+                    {"agent": self.agents[i].__class__.__name__, "error": str(result)},
+                    level=TelemetryLevel.CRITICAL,
                 )
             elif result:
-                proposals.extend(result)
-                for proposal in result:
-                    data: dict[str, Any] = {
-                        "agent": proposal.agent,
-                        "title": proposal.title,
-                        "risk_level": proposal.risk_level,
-                        "files_touched": proposal.files_touched,
-                        "estimated_loc_change": proposal.estimated_loc_change,
-                    }
-                    if self.config.telemetry.include_diffs:
-                        diff = proposal.diff or ""
-                        data["diff_sha256"] = sha256(diff.encode("utf-8", errors="replace")).hexdigest()
-                        data["diff_len"] = len(diff)
-                        data["diff_excerpt"] = redact_text(diff, max_len=2000)
-                    self.telemetry.log(
-                        run_id,
-                        "proposal",
-                        data,
-                    )
+                per_agent[i] = result
+                self.telemetry.emit(
+                    "proposals",
+                    partial(self._proposals_payload, self.agents[i].__class__.__name__, result),
+                )
 
+        proposals = [proposal for result in per_agent for proposal in result]
         return proposals
 
+    def _agent_timeout(self) -> float:
+        timeout = float(self.config.agents.timeout_seconds)
+        # An agent call is a chat_completion with retries and Retry-After sleeps, so
+        # the fallback is its whole retry budget rather than one request timeout.
+        return timeout if timeout > 0 else self.kimi_client.retry_budget_seconds()
+
+    def _agent_slots(self) -> asyncio.Semaphore | None:
+        limit = int(self.config.agents.max_concurrency)
+        return asyncio.Semaphore(limit) if limit > 0 else None
+
+    async def _call_agent(
+        self, call: Callable[[], Awaitable[_T]], slots: asyncio.Semaphore | None
+    ) -> _T:
+        """Run one agent call under the shared slot limit and per-call timeout.
+
+        The timeout covers the agent call only, not time spent waiting for a slot.
+        """
+        timeout = self._agent_timeout()
+        if slots is None:
+            return await asyncio.wait_for(call(), timeout=timeout)
+        async with slots:
+            return await asyncio.wait_for(call(), timeout=timeout)
+
+    def _log_agent_timeout(self, agent: SpecialistAgent, phase: str, timeout: float) -> None:
+        self.telemetry.emit(
+            "agent_timeout",
+            {"agent": agent.__class__.__name__, "phase": phase, "timeout_seconds": timeout},
+            level=TelemetryLevel.CRITICAL,
+        )
+
+    def _proposals_payload(self, agent_name: str, proposals: list[Proposal]) -> dict[str, Any]:
+        """One record per agent: the count plus a summary of each proposal."""
+        return {
+            "agent": agent_name,
+            "count": len(proposals),
+            "items": [self._proposal_payload(proposal) for proposal in proposals],
+        }
+
+    def _proposal_payload(self, proposal: Proposal) -> dict[str, Any]:
+        """Build the telemetry payload for a proposal (only called when recorded)."""
+        data: dict[str, Any] = {
+            "agent": proposal.agent,
+            "title": proposal.title,
+            "risk_level": proposal.risk_level,
+            "files_touched": proposal.files_touched,
+            "estimated_loc_change": proposal.estimated_loc_change,
+        }
+        if self.config.telemetry.include_diffs:
+            diff = proposal.diff or ""
+            data["diff_sha256"] = sha256(diff.encode("utf-8", errors="replace")).hexdigest()
+            data["diff_len"] = len(diff)
+            data["diff_excerpt"] = redact_text(diff, max_len=2000)
+        return data
+
     async def _cross_pollinate(
         self,
         proposals: list[Proposal],
         context: Any,
-        run_id: str,
     ) -> list[Proposal]:
         """
         Cross-pollination: agents refine proposals after seeing each other's work.
@@ -557,7 +1045,6 @@ class AmbientCoordinator:
         Args:
             proposals: Initial proposals from all agents
             context: Repository context
-            run_id: Unique run identifier
 
         Returns:
             Refined list of proposals
@@ -565,24 +1052,44 @@ class AmbientCoordinator:
         if not self.agents:
             return proposals
 
-        # Round 1: independent refinement by each specialist.
+        # Round 1: independent refinement by each specialist. The default refine()
+        # just keeps an agent's own proposals, so it is applied inline; only agents
+        # overriding refine() are awaited, and only when proposals came from more
+        # than one agent (otherwise there is no other agent's work to react to).
+        coordinated = len(proposals) > 1 and len({p.agent for p in proposals}) > 1
+        refiners: list[SpecialistAgent] = []
+        refined_lists: list[list[Proposal]] = []
+        for agent in self.agents:
+            if coordinated and getattr(type(agent), "refine", None) is not SpecialistAgent.refine:
+                refiners.append(agent)
+            else:
+                agent_name = agent.__class__.__name__
+                refined_lists.append([p for p in proposals if p.agent == agent_name])
+
+        slots = self._agent_slots()
         refined_results: list[list[Proposal] | BaseException] = await asyncio.gather(
-            *[agent.refine(proposals, context) for agent in self.agents],
+            *[
+                self._call_agent(partial(agent.refine, proposals, context), slots)
+                for agent in refiners
+            ],
             return_exceptions=True,
         )
 
-        refined_lists: list[list[Proposal]] = []
         agent_errors = 0
-        for i, result in enumerate(refined_results):
+        for agent, result in zip(refiners, refined_results, strict=True):
+            if isinstance(result, TimeoutError):
+                agent_errors += 1
+                self._log_agent_timeout(agent, "refine", self._agent_timeout())
+                continue
             if isinstance(result, BaseException):
                 agent_errors += 1
-                self.telemetry.log(
-                    run_id,
+                self.telemetry.emit(
                     "cross_pollination_agent_error",
                     {
-                        "agent": self.agents[i].__class__.__name__,
+                        "agent": agent.__class__.__name__,
                         "error": redact_text(str(result), max_len=200),
                     },
+                    level=TelemetryLevel.CRITICAL,
                 )
                 continue
             refined_lists.append(result)
@@ -590,13 +1097,13 @@ class AmbientCoordinator:
         # Rounds 2-4: deterministic dedupe/conflict-resolution/ranking.
         decision = advanced_cross_pollinate(proposals, refined_lists)
 
-        self.telemetry.log(
-            run_id,
+        self.telemetry.emit(
             "cross_pollination",
             {
                 "original_count": len(proposals),
                 "refined_count": len(decision.proposals),
                 "agent_errors": agent_errors,
+                "refine_calls": len(refiners),
                 **decision.metadata,
             },
         )
@@ -620,87 +1127,120 @@ class AmbientCoordinator:
         Returns:
             Dict with "applied" and "failed" lists
         """
-        applied: list[dict[str, Any]] = []
-        failed: list[dict[str, Any]] = []
+        applied: list[ApplyOutcome] = []
+        failed: list[ApplyOutcome] = []
 
         # Kill-switch: disable auto-apply if failure rate exceeds threshold.
         if self.config.control_plane.disable_auto_apply_on_failure_rate:
             threshold = float(self.config.control_plane.failure_rate_threshold)
             min_failures = int(self.config.control_plane.min_failures_before_disable)
-            recent = list(self._verify_outcomes) + list(self._apply_outcomes)
-            failures = sum(1 for ok in recent if not ok)
-            if failures >= min_failures and recent:
-                rate = failures / len(recent)
+            window = len(self._verify_outcomes) + len(self._apply_outcomes)
+            failures = self._verify_outcomes.failures + self._apply_outcomes.failures
+            if failures >= min_failures and window:
+                rate = failures / window
                 if rate > threshold:
-                    self.telemetry.log(
-                        run_id,
+                    self.telemetry.emit(
                         "control_plane_auto_apply_disabled",
-                        {"failure_rate": rate, "threshold": threshold, "window": len(recent)},
+                        {"failure_rate": rate, "threshold": threshold, "window": window},
+                        level=TelemetryLevel.CRITICAL,
                     )
                     for proposal in proposals:
                         failed.append(
-                            {
-                                "proposal": proposal,
-                                "reason": "auto_apply_disabled",
-                                "details": "Auto-apply disabled due to elevated failure rate",
-                            }
+                            ApplyOutcome(
+                                kind="failed",
+                                proposal=proposal,
+                                reason="auto_apply_disabled",
+                                details="Auto-apply disabled due to elevated failure rate",
+                            )
                         )
-                    return {"applied": applied, "failed": failed}
+                    return _outcome_lists(applied, failed)
 
         # In dry-run mode, mark all proposals as rejected without applying
         if dry_run:
             for proposal in proposals:
-                self.telemetry.log(
-                    run_id,
+                self.telemetry.emit(
                     "dry_run_skip",
                     {"proposal_title": proposal.title},
+                    level=TelemetryLevel.VERBOSE,
                 )
                 failed.append(
-                    {
-                        "proposal": proposal,
-                        "reason": "dry_run",
-                        "details": "Skipped in dry-run mode",
-                    }
+                    ApplyOutcome(
+                        kind="failed",
+                        proposal=proposal,
+                        reason="dry_run",
+                        details="Skipped in dry-run mode",
+                    )
                 )
-            return {"applied": applied, "failed": failed}
+            return _outcome_lists(applied, failed)
 
         if self.config.review_worktree.enabled:
             return await self._apply_proposals_review_worktrees(proposals, run_id)
 
-        for proposal in proposals:
+        # Start the first git status off-loop so it overlaps risk scoring below.
+        loop = asyncio.get_running_loop()
+        clean_probe: asyncio.Future[bool] | None = None
+        if (
+            proposals
+            and self.config.git.require_clean_before_apply
+            and time.time() >= self._backoff_until
+        ):
+            clean_probe = loop.run_in_executor(self._git_pool, git_is_clean, self.repo_path)
+
+        # Risk depends only on each proposal and the policy, so score the batch
+        # up front (full scoring only if the fast path finds a risk factor).
+        policy = self.config.risk_policy
+        assessments = [
+            None
+            if trivially_auto_approves(proposal, policy)
+            else assess_risk_cached(proposal, policy, self.repo_path)
+            for proposal in proposals
+        ]
+        # Cached worktree cleanliness; None means unknown and forces a git status.
+        # Only our own applies mutate the tree, so it is reset after each one.
+        worktree_clean: bool | None = None
+
+        for position, proposal in enumerate(proposals):
+            if time.time() < self._backoff_until:
+                failed.extend(self._backoff_skips(proposals[position:]))
+                break
+
             if self.config.git.require_clean_before_apply:
                 try:
-                    if not git_is_clean(self.repo_path):
-                        self.telemetry.log(
-                            run_id,
+                    if worktree_clean is None:
+                        probe, clean_probe = clean_probe, None
+                        worktree_clean = await (
+                            probe
+                            or loop.run_in_executor(self._git_pool, git_is_clean, self.repo_path)
+                        )
+                    if not worktree_clean:
+                        self.telemetry.emit(
                             "git_dirty_worktree",
                             {"proposal_title": proposal.title},
                         )
                         failed.append(
-                            {
-                                "proposal": proposal,
-                                "reason": "dirty_worktree",
-                                "details": "Repository has uncommitted changes",
-                            }
+                            ApplyOutcome(
+                                kind="failed",
+                                proposal=proposal,
+                                reason="dirty_worktree",
+                                details="Repository has uncommitted changes",
+                            )
                         )
                         continue
                 except Exception as e:
                     failed.append(
-                        {
-                            "proposal": proposal,
-                            "reason": "git_status_failed",
-                            "details": str(e),
-                        }
+                        ApplyOutcome(
+                            kind="failed",
+                            proposal=proposal,
+                            reason="git_status_failed",
+                            error=ErrorCapture.from_exception(e),
+                        )
                     )
                     continue
 
-            # Risk assessment
-            risk_assessment = assess_risk(proposal, self.config.risk_policy, self.repo_path)
-
             # Check if approval required
-            if risk_assessment["requires_approval"]:
-                self.telemetry.log(
-                    run_id,
+            risk_assessment = assessments[position]
+            if risk_assessment is not None and risk_assessment["requires_approval"]:
+                self.telemetry.emit(
                     "risk_gate_triggered",
                     {
                         "proposal_title": proposal.title,
@@ -718,22 +1258,21 @@ class AmbientCoordinator:
                 )
 
                 if not approved:
-                    self.telemetry.log(
-                        run_id,
+                    self.telemetry.emit(
                         "approval_rejected",
                         {"proposal_title": proposal.title},
                     )
                     failed.append(
-                        {
-                            "proposal": proposal,
-                            "reason": "approval_rejected",
-                            "details": "User rejected the proposal",
-                        }
+                        ApplyOutcome(
+                            kind="failed",
+                            proposal=proposal,
+                            reason="approval_rejected",
+                            details="User rejected the proposal",
+                        )
                     )
                     continue
 
-                self.telemetry.log(
-                    run_id,
+                self.telemetry.emit(
                     "approval_granted",
                     {"proposal_title": proposal.title},
                 )
@@ -741,6 +1280,8 @@ class AmbientCoordinator:
             # Apply atomically (single-writer)
             async with self.write_lock:
                 result = await self.workspace.apply_patch(proposal)
+                if result.ok:
+                    worktree_clean = None
 
                 if not result.ok:
                     self._apply_outcomes.append(False)
@@ -750,26 +1291,26 @@ class AmbientCoordinator:
                     )
                     if self._backoff_seconds:
                         self._backoff_until = time.time() + self._backoff_seconds
-                    self.telemetry.log(
-                        run_id,
+                    self.telemetry.emit(
                         "apply_failed",
                         {
                             "proposal_title": proposal.title,
                             "stderr_head": redact_text(result.stderr, max_len=200),
                         },
+                        level=TelemetryLevel.CRITICAL,
                     )
                     failed.append(
-                        {
-                            "proposal": proposal,
-                            "reason": "patch_failed",
-                            "details": result.stderr,
-                        }
+                        ApplyOutcome(
+                            kind="failed",
+                            proposal=proposal,
+                            reason="patch_failed",
+                            details=result.stderr,
+                        )
                     )
                     continue
 
                 self._apply_outcomes.append(True)
-                self.telemetry.log(
-                    run_id,
+                self.telemetry.emit(
                     "apply_succeeded",
                     {"proposal_title": proposal.title, "risk_level": proposal.risk_level},
                 )
@@ -787,37 +1328,23 @@ class AmbientCoordinator:
                     )
                     if self._backoff_seconds:
                         self._backoff_until = time.time() + self._backoff_seconds
-                    self.telemetry.log(
-                        run_id,
+                    self.telemetry.emit(
                         "verify_failed",
-                        {
-                            "proposal_title": proposal.title,
-                            "results": [
-                                {
-                                    "name": r.get("name"),
-                                    "ok": r.get("ok"),
-                                    "exit_code": r.get("exit_code"),
-                                    "duration_s": r.get("duration_s"),
-                                    "message": redact_text((r.get("stderr") or r.get("stdout") or ""), max_len=200)
-                                    if not r.get("ok")
-                                    else "",
-                                }
-                                for r in verify_result.results
-                            ],
-                        },
+                        partial(_verify_failed_payload, proposal, verify_result),
+                        level=TelemetryLevel.CRITICAL,
                     )
                     failed.append(
-                        {
-                            "proposal": proposal,
-                            "reason": "verification_failed",
-                            "details": verify_result.results,
-                        }
+                        ApplyOutcome(
+                            kind="failed",
+                            proposal=proposal,
+                            reason="verification_failed",
+                            details=verify_result.results,
+                        )
                     )
                     continue
 
                 self._verify_outcomes.append(True)
-                self.telemetry.log(
-                    run_id,
+                self.telemetry.emit(
                     "verify_succeeded",
                     {"proposal_title": proposal.title},
                 )
@@ -825,61 +1352,42 @@ class AmbientCoordinator:
                 # Commit (optional)
                 if self.config.git.commit_on_success:
                     try:
-                        if git_has_staged_changes(self.repo_path):
-                            try:
-                                subject = self.config.git.commit_message_template.format(
-                                    title=proposal.title, agent=proposal.agent
-                                )
-                            except Exception:
-                                subject = f"ambient: {proposal.title} ({proposal.agent})"
-
-                            body_lines = [
-                                f"run_id: {run_id}",
-                                f"risk_level: {proposal.risk_level}",
-                                f"tags: {', '.join(proposal.tags) if proposal.tags else ''}",
-                                "files_touched:",
-                                *[f"- {p}" for p in proposal.files_touched],
-                            ]
-                            message = subject + "\n\n" + "\n".join(body_lines) + "\n"
-
-                            self.telemetry.log(
-                                run_id,
-                                "git_commit_started",
-                                {"proposal_title": proposal.title, "subject": subject},
-                            )
-                            git_commit(
-                                self.repo_path,
-                                message,
-                                author_name=self.config.git.commit_author_name,
-                                author_email=self.config.git.commit_author_email,
-                            )
-                            self.telemetry.log(
-                                run_id,
-                                "git_commit_succeeded",
-                                {"proposal_title": proposal.title, "subject": subject},
-                            )
+                        body_lines = [
+                            f"run_id: {run_id}",
+                            f"risk_level: {proposal.risk_level}",
+                            f"tags: {proposal.tags_csv}",
+                            "files_touched:",
+                        ]
+                        if proposal.files_block:
+                            body_lines.append(proposal.files_block)
+                        if await self._maybe_commit(
+                            self.repo_path,
+                            proposal,
+                            body_lines,
+                            has_staged=result.has_staged_changes,
+                        ):
                             self._backoff_seconds = 0
                             self._backoff_until = 0.0
                     except Exception as e:
                         # Commit failure: rollback to avoid leaving partial/staged state.
                         await self.workspace.rollback()
-                        self.telemetry.log(
-                            run_id,
+                        self.telemetry.emit(
                             "git_commit_failed",
-                            {"proposal_title": proposal.title, "error": redact_text(str(e), max_len=200)},
+                            partial(_error_payload, proposal, e),
+                            level=TelemetryLevel.CRITICAL,
                         )
                         failed.append(
-                            {
-                                "proposal": proposal,
-                                "reason": "git_commit_failed",
-                                "details": str(e),
-                            }
+                            ApplyOutcome(
+                                kind="failed",
+                                proposal=proposal,
+                                reason="git_commit_failed",
+                                error=ErrorCapture.from_exception(e),
+                            )
                         )
                         continue
 
                 # Success!
-                self.telemetry.log(
-                    run_id,
+                self.telemetry.emit(
                     "apply_success",
                     {
                         "proposal_title": proposal.title,
@@ -888,14 +1396,15 @@ class AmbientCoordinator:
                     },
                 )
                 applied.append(
-                    {
-                        "proposal": proposal,
-                        "stat": result.stat,
-                        "verification": verify_result,
-                    }
+                    ApplyOutcome(
+                        kind="applied",
+                        proposal=proposal,
+                        stat=result.stat,
+                        verification=verify_result,
+                    )
                 )
 
-        return {"applied": applied, "failed": failed}
+        return _outcome_lists(applied, failed)
 
     async def _apply_proposals_review_worktrees(
         self,
@@ -903,15 +1412,24 @@ class AmbientCoordinator:
         run_id: str,
     ) -> dict[str, list[dict[str, Any]]]:
         """Apply proposals in dedicated review worktrees and emit per-proposal diffs."""
-        applied: list[dict[str, Any]] = []
-        failed: list[dict[str, Any]] = []
+        applied: list[ApplyOutcome] = []
+        failed: list[ApplyOutcome] = []
 
-        queue: list[tuple[Proposal, ReviewCandidate]] = []
+        # Approvals stay serial (they may prompt the user); only proposals that clear
+        # the gate move on to worktree creation.
+        admitted: list[tuple[int, Proposal]] = []
         for idx, proposal in enumerate(proposals, start=1):
-            risk_assessment = assess_risk(proposal, self.config.risk_policy, self.repo_path)
-            if risk_assessment["requires_approval"]:
-                self.telemetry.log(
-                    run_id,
+            if time.time() < self._backoff_until:
+                failed.extend(self._backoff_skips(proposals[idx - 1 :]))
+                break
+
+            risk_assessment = (
+                None
+                if trivially_auto_approves(proposal, self.config.risk_policy)
+                else assess_risk_cached(proposal, self.config.risk_policy, self.repo_path)
+            )
+            if risk_assessment is not None and risk_assessment["requires_approval"]:
+                self.telemetry.emit(
                     "risk_gate_triggered",
                     {
                         "proposal_title": proposal.title,
@@ -927,168 +1445,297 @@ class AmbientCoordinator:
                 )
                 if not approved:
                     failed.append(
-                        {
-                            "proposal": proposal,
-                            "reason": "approval_rejected",
-                            "details": "User rejected the proposal",
-                        }
+                        ApplyOutcome(
+                            kind="failed",
+                            proposal=proposal,
+                            reason="approval_rejected",
+                            details="User rejected the proposal",
+                        )
                     )
                     continue
 
+            admitted.append((idx, proposal))
+
+        loop = asyncio.get_running_loop()
+        # A recycled slot is reset with checkout -f and clean, so only pool when the
+        # reviewed change is committed to its branch; otherwise the next candidate
+        # would wipe it from the worktree the outcome points at.
+        pool_size = (
+            int(self.config.review_worktree.pool_size)
+            if self.config.git.commit_on_success
+            else 0
+        )
+        if pool_size > 0 and admitted:
             try:
-                candidate = self.review_manager.create_candidate(run_id, idx, proposal.title)
+                await loop.run_in_executor(
+                    self._git_pool, self.review_manager.warm_pool, pool_size
+                )
             except Exception as e:
+                # Candidates fall back to fresh worktrees.
+                self.telemetry.emit(
+                    "review_pool_warm_failed",
+                    {"error": redact_text(str(e), max_len=200)},
+                    level=TelemetryLevel.CRITICAL,
+                )
+
+        # `git worktree add` is serialized by the manager (concurrent adds race on
+        # .git/worktrees/), so candidates are created back to back in one executor
+        # hop rather than fanned out across the git pool.
+        def _create_all() -> list[ReviewCandidate | Exception]:
+            out: list[ReviewCandidate | Exception] = []
+            for idx, proposal in admitted:
+                try:
+                    out.append(self.review_manager.create_candidate(run_id, idx, proposal.title))
+                except Exception as e:
+                    out.append(e)
+            return out
+
+        created = await loop.run_in_executor(self._git_pool, _create_all) if admitted else []
+
+        queue: list[tuple[Proposal, ReviewCandidate]] = []
+        for (_, proposal), candidate in zip(admitted, created, strict=True):
+            if isinstance(candidate, Exception):
                 failed.append(
-                    {
-                        "proposal": proposal,
-                        "reason": "review_worktree_failed",
-                        "details": str(e),
-                    }
+                    ApplyOutcome(
+                        kind="failed",
+                        proposal=proposal,
+                        reason="review_worktree_failed",
+                        error=ErrorCapture.from_exception(candidate),
+                    )
                 )
                 continue
 
+            # Build the workspace now so workers don't pay for it inside the semaphore.
+            self._workspace_for_path(candidate.worktree_path)
             queue.append((proposal, candidate))
 
         if not queue:
-            return {"applied": applied, "failed": failed}
-
-        max_parallel = max(1, int(self.config.review_worktree.max_parallel))
-        semaphore = asyncio.Semaphore(max_parallel)
+            return _outcome_lists(applied, failed)
 
         async def _worker(
             proposal: Proposal, candidate: ReviewCandidate
-        ) -> tuple[str, dict[str, Any]]:
-            async with semaphore:
+        ) -> ApplyOutcome:
+            async with self._review_slots:
                 workspace = self._workspace_for_path(candidate.worktree_path)
                 result = await workspace.apply_patch(proposal)
                 if not result.ok:
                     self._apply_outcomes.append(False)
-                    return (
-                        "failed",
-                        {
-                            "proposal": proposal,
-                            "reason": "patch_failed",
-                            "details": result.stderr,
-                            "review_branch": candidate.branch,
-                            "review_worktree": str(candidate.worktree_path),
-                        },
+                    return ApplyOutcome(
+                        kind="failed",
+                        proposal=proposal,
+                        reason="patch_failed",
+                        details=result.stderr,
+                        review_branch=candidate.branch,
+                        review_worktree=str(candidate.worktree_path),
                     )
 
                 self._apply_outcomes.append(True)
-                verify_result = await workspace.verify_changes()
+                verify_result = await workspace.verify_changes(rollback_on_failure=True)
+                self._review_slots_aimd.observe(verify_result.duration_s, verify_result.ok)
                 if not verify_result.ok:
-                    await workspace.rollback()
                     self._verify_outcomes.append(False)
-                    return (
-                        "failed",
-                        {
-                            "proposal": proposal,
-                            "reason": "verification_failed",
-                            "details": verify_result.results,
-                            "review_branch": candidate.branch,
-                            "review_worktree": str(candidate.worktree_path),
-                        },
+                    return ApplyOutcome(
+                        kind="failed",
+                        proposal=proposal,
+                        reason="verification_failed",
+                        details=verify_result.results,
+                        review_branch=candidate.branch,
+                        review_worktree=str(candidate.worktree_path),
                     )
 
                 self._verify_outcomes.append(True)
-                patch_text = await workspace.get_staged_diff()
-                candidate.patch_path.parent.mkdir(parents=True, exist_ok=True)
-                candidate.patch_path.write_text(patch_text, encoding="utf-8")
+                patch_path: str | None = None
+                if self.config.review_worktree.emit_patch_files:
+                    patch_text = await workspace.get_staged_diff()
+                    # The patches dir is created with the candidate; write off the event loop.
+                    await asyncio.to_thread(
+                        candidate.patch_path.write_bytes, patch_text.encode("utf-8")
+                    )
+                    patch_path = str(candidate.patch_path)
 
-                if self.config.git.commit_on_success:
-                    try:
-                        if git_has_staged_changes(candidate.worktree_path):
-                            try:
-                                subject = self.config.git.commit_message_template.format(
-                                    title=proposal.title, agent=proposal.agent
-                                )
-                            except Exception:
-                                subject = f"ambient: {proposal.title} ({proposal.agent})"
-                            message = (
-                                subject
-                                + "\n\n"
-                                + f"run_id: {run_id}\n"
-                                + f"risk_level: {proposal.risk_level}\n"
-                            )
-                            git_commit(
-                                candidate.worktree_path,
-                                message,
-                                author_name=self.config.git.commit_author_name,
-                                author_email=self.config.git.commit_author_email,
-                            )
-                    except Exception as e:
-                        return (
-                            "failed",
-                            {
-                                "proposal": proposal,
-                                "reason": "git_commit_failed",
-                                "details": str(e),
-                                "review_branch": candidate.branch,
-                                "review_worktree": str(candidate.worktree_path),
-                                "patch_path": str(candidate.patch_path),
-                            },
-                        )
+            # Commit outside the semaphore: commits touch independent worktrees, so the
+            # slot is released for the next apply/verify while git runs in the pool.
+            if self.config.git.commit_on_success:
+                try:
+                    await self._maybe_commit(
+                        candidate.worktree_path,
+                        proposal,
+                        (f"run_id: {run_id}", f"risk_level: {proposal.risk_level}"),
+                        executor=self._git_pool,
+                        has_staged=result.has_staged_changes,
+                    )
+                except Exception as e:
+                    return ApplyOutcome(
+                        kind="failed",
+                        proposal=proposal,
+                        reason="git_commit_failed",
+                        error=ErrorCapture.from_exception(e),
+                        review_branch=candidate.branch,
+                        review_worktree=str(candidate.worktree_path),
+                        patch_path=patch_path,
+                    )
 
-                return (
-                    "applied",
-                    {
-                        "proposal": proposal,
-                        "stat": result.stat,
-                        "verification": verify_result,
-                        "review_branch": candidate.branch,
-                        "review_worktree": str(candidate.worktree_path),
-                        "patch_path": str(candidate.patch_path),
-                    },
-                )
+            return ApplyOutcome(
+                kind="applied",
+                proposal=proposal,
+                stat=result.stat,
+                verification=verify_result,
+                review_branch=candidate.branch,
+                review_worktree=str(candidate.worktree_path),
+                patch_path=patch_path,
+            )
 
-        worker_results = await asyncio.gather(
-            *[_worker(p, c) for p, c in queue],
-            return_exceptions=True,
-        )
+        teardowns: list[asyncio.Future[None]] = []
 
-        for i, item in enumerate(worker_results):
-            proposal, candidate = queue[i]
-            if isinstance(item, BaseException):
+        def _on_done(
+            proposal: Proposal, candidate: ReviewCandidate, task: asyncio.Task[ApplyOutcome]
+        ) -> None:
+            # Runs as soon as this worker finishes: record the outcome and start
+            # tearing the candidate down without waiting for slower workers.
+            error = asyncio.CancelledError() if task.cancelled() else task.exception()
+            if error is not None:
                 failed.append(
-                    {
-                        "proposal": proposal,
-                        "reason": "review_processing_failed",
-                        "details": str(item),
-                        "review_branch": candidate.branch,
-                        "review_worktree": str(candidate.worktree_path),
-                    }
+                    ApplyOutcome(
+                        kind="failed",
+                        proposal=proposal,
+                        reason="review_processing_failed",
+                        error=ErrorCapture.from_exception(error),
+                        review_branch=candidate.branch,
+                        review_worktree=str(candidate.worktree_path),
+                    )
                 )
-                if not self.config.review_worktree.keep_worktrees:
-                    self.review_manager.remove_candidate(candidate)
-                continue
-
-            kind, payload = item
-            if kind == "applied":
-                applied.append(payload)
             else:
-                failed.append(payload)
-                self.telemetry.log(
-                    run_id,
-                    "review_candidate_failed",
-                    {
-                        "proposal_title": proposal.title,
-                        "reason": payload.get("reason", "unknown"),
-                        "review_branch": payload.get("review_branch"),
-                    },
-                )
+                item = task.result()
+                if item.kind == "applied":
+                    applied.append(item)
+                else:
+                    failed.append(item)
+                    self.telemetry.emit(
+                        "review_candidate_failed",
+                        {
+                            "proposal_title": proposal.title,
+                            "reason": item.reason or "unknown",
+                            "review_branch": item.review_branch,
+                        },
+                        level=TelemetryLevel.CRITICAL,
+                    )
+            teardowns.append(self._release_review_candidate(candidate))
 
-            if not self.config.review_worktree.keep_worktrees:
-                self.review_manager.remove_candidate(candidate)
+        tasks: list[asyncio.Task[ApplyOutcome]] = []
+        for proposal, candidate in queue:
+            task = asyncio.create_task(_worker(proposal, candidate))
+            task.add_done_callback(partial(_on_done, proposal, candidate))
+            tasks.append(task)
+        queue.clear()
 
-        self.telemetry.log(
-            run_id,
+        try:
+            await asyncio.wait(tasks)
+        except BaseException:
+            # Unlike gather, wait() leaves its tasks running when we are cancelled:
+            # stop the workers and finish their teardown before propagating.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*teardowns, return_exceptions=True)
+            raise
+        del tasks
+        # Teardown is best-effort; git failures there never fail the batch.
+        await asyncio.gather(*teardowns, return_exceptions=True)
+
+        self.telemetry.emit(
             "review_worktree_batch_completed",
             {
                 "applied_count": len(applied),
                 "failed_count": len(failed),
-                "max_parallel": max_parallel,
+                "max_parallel": self._review_slots.limit,
                 "keep_worktrees": self.config.review_worktree.keep_worktrees,
             },
         )
 
-        return {"applied": applied, "failed": failed}
+        return _outcome_lists(applied, failed)
+
+    async def _maybe_commit(
+        self,
+        repo_path: Path,
+        proposal: Proposal,
+        body_lines: Sequence[str],
+        executor: Executor | None = None,
+        has_staged: bool | None = None,
+    ) -> bool:
+        """
+        Commit staged changes for an applied proposal.
+
+        Git runs in ``executor`` (default loop executor if None). Exceptions from
+        git propagate so callers can roll back. ``has_staged`` is the apply result's
+        view of the index; the index is only re-checked when it is unknown.
+
+        Returns:
+            True if a commit was created, False if nothing was staged
+        """
+        loop = asyncio.get_running_loop()
+        if has_staged is None:
+            has_staged = await loop.run_in_executor(executor, git_has_staged_changes, repo_path)
+        if not has_staged:
+            return False
+
+        subject = self._format_commit_subject(title=proposal.title, agent=proposal.agent)
+        message = "\n".join((subject, "", *body_lines, ""))
+        self.telemetry.emit(
+            "git_commit_started",
+            {"proposal_title": proposal.title, "subject": subject},
+            level=TelemetryLevel.VERBOSE,
+        )
+        await loop.run_in_executor(
+            executor,
+            partial(
+                git_commit,
+                repo_path,
+                message,
+                author_name=self.config.git.commit_author_name,
+                author_email=self.config.git.commit_author_email,
+            ),
+        )
+        self.telemetry.emit(
+            "git_commit_succeeded",
+            {"proposal_title": proposal.title, "subject": subject},
+        )
+        return True
+
+    def _backoff_skips(self, remaining: list[Proposal]) -> list[ApplyOutcome]:
+        """Fail the rest of a batch once backoff is engaged, logging a single event."""
+        self.telemetry.emit(
+            "backoff_engaged",
+            {
+                "skipped_count": len(remaining),
+                "backoff_seconds": self._backoff_seconds,
+                "retry_in_s": round(max(0.0, self._backoff_until - time.time()), 3),
+            },
+            level=TelemetryLevel.CRITICAL,
+        )
+        details = f"Skipped while backing off ({self._backoff_seconds}s)"
+        return [
+            ApplyOutcome(
+                kind="failed",
+                proposal=proposal,
+                reason="backoff_engaged",
+                details=details,
+            )
+            for proposal in remaining
+        ]
+
+    def _release_review_candidate(self, candidate: ReviewCandidate) -> asyncio.Future[None]:
+        """Finish a candidate: recycle a pooled slot, else drop its workspace and worktree.
+
+        Pooled slots keep their cached workspace for the next candidate. The git
+        teardown runs in the git pool; the returned future completes when it is done.
+        """
+        if not candidate.pooled:
+            self._workspace_cache.pop(candidate.worktree_path, None)
+        return asyncio.get_running_loop().run_in_executor(
+            self._git_pool,
+            partial(
+                self.review_manager.release_candidate,
+                candidate,
+                keep_branch=self.config.review_worktree.keep_worktrees,
+            ),
+        )
@@ -7,7 +7,7 @@ single-machine ambient loop.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from hashlib import sha256
+from hashlib import blake2b
 from typing import Any
 
 from .types import Proposal
@@ -39,10 +39,12 @@ def advanced_cross_pollinate(
     round1 = _flatten_or_fallback(base_proposals, refined_lists)
     round2 = _dedupe(round1)
     clusters = _conflict_clusters(round2)
-    round3 = _select_cluster_winners(clusters)
+    # Scores are needed by both the winner pick and the final ranking; compute once.
+    scores = {id(p): _proposal_score(p) for p in round2}
+    round3 = _select_cluster_winners(clusters, scores)
     round4 = sorted(
         round3,
-        key=lambda p: (-_proposal_score(p), p.agent.lower(), p.title.lower()),
+        key=lambda p: (-scores[id(p)], p.agent.lower(), p.title.lower()),
     )
 
     metadata = {
@@ -65,18 +67,21 @@ def _flatten_or_fallback(
 
 def _dedupe(proposals: list[Proposal]) -> list[Proposal]:
     """Deduplicate by normalized title+files+diff hash."""
-    seen: set[str] = set()
+    seen: set[tuple[str, str, tuple[str, ...], bytes]] = set()
     out: list[Proposal] = []
 
     for proposal in proposals:
-        digest = sha256((proposal.diff or "").encode("utf-8", errors="replace")).hexdigest()
-        key = "|".join(
-            [
-                proposal.agent.lower(),
-                proposal.title.strip().lower(),
-                ",".join(sorted(proposal.files_touched)),
-                digest,
-            ]
+        # Tuple key with a raw digest: no joined string or hex encoding per proposal.
+        digest = b""
+        if proposal.diff:
+            digest = blake2b(
+                proposal.diff.encode("utf-8", errors="replace"), digest_size=16
+            ).digest()
+        key = (
+            proposal.agent.lower(),
+            proposal.title.strip().lower(),
+            tuple(sorted(proposal.files_touched)),
+            digest,
         )
         if key in seen:
             continue
@@ -90,55 +95,63 @@ def _conflict_clusters(proposals: list[Proposal]) -> list[list[Proposal]]:
     if not proposals:
         return []
 
-    n = len(proposals)
-    adj: list[set[int]] = [set() for _ in range(n)]
-    file_sets = [set(p.files_touched) for p in proposals]
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            if file_sets[i] & file_sets[j]:
-                adj[i].add(j)
-                adj[j].add(i)
-
-    seen: set[int] = set()
-    clusters: list[list[Proposal]] = []
+    if all(len(p.files_touched) <= 1 for p in proposals):
+        # Common case: single-file proposals conflict only on that exact file.
+        groups: dict[object, list[Proposal]] = {}
+        for i, proposal in enumerate(proposals):
+            key: object = proposal.files_touched[0] if proposal.files_touched else i
+            groups.setdefault(key, []).append(proposal)
+        return list(groups.values())
+
+    # Union proposals that share a file via a file -> first-index map, so the
+    # cost is linear in files touched rather than quadratic in proposals.
+    parent = list(range(len(proposals)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    first_by_file: dict[str, int] = {}
+    for i, proposal in enumerate(proposals):
+        for path in proposal.files_touched:
+            j = first_by_file.setdefault(path, i)
+            if j != i:
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[max(ri, rj)] = min(ri, rj)
+
+    # Components come out ordered by their lowest index, members in input order.
+    components: dict[int, list[Proposal]] = {}
+    for i, proposal in enumerate(proposals):
+        components.setdefault(find(i), []).append(proposal)
+    return list(components.values())
+
+
+def _select_cluster_winners(
+    clusters: list[list[Proposal]], scores: dict[int, int]
+) -> list[Proposal]:
+    """Pick the highest-scoring proposal per conflict cluster.
 
-    for i in range(n):
-        if i in seen:
-            continue
-        stack = [i]
-        component: list[int] = []
-        seen.add(i)
-        while stack:
-            cur = stack.pop()
-            component.append(cur)
-            for nxt in adj[cur]:
-                if nxt in seen:
-                    continue
-                seen.add(nxt)
-                stack.append(nxt)
-        clusters.append([proposals[idx] for idx in component])
-
-    return clusters
-
-
-def _select_cluster_winners(clusters: list[list[Proposal]]) -> list[Proposal]:
-    """Pick the highest-scoring proposal per conflict cluster."""
+    ``scores`` maps ``id(proposal)`` to a precomputed ``_proposal_score``.
+    """
     winners: list[Proposal] = []
     for cluster in clusters:
         if len(cluster) == 1:
             winners.append(cluster[0])
             continue
-        ranked = sorted(
-            cluster,
-            key=lambda p: (
-                -_proposal_score(p),
-                abs(p.estimated_loc_change),
-                p.agent.lower(),
-                p.title.lower(),
-            ),
+        winners.append(
+            min(
+                cluster,
+                key=lambda p: (
+                    -scores[id(p)],
+                    abs(p.estimated_loc_change),
+                    p.agent.lower(),
+                    p.title.lower(),
+                ),
+            )
         )
-        winners.append(ranked[0])
     return winners
 
 
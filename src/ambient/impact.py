@@ -6,23 +6,38 @@ adjacent modules and likely tests.
 
 from __future__ import annotations
 
+import ast
+import os
 import re
+import threading
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
 _DIFF_PATH_RE = re.compile(r"^\+\+\+ b/(.+)$", re.MULTILINE)
-_IMPORT_RE = re.compile(
-    r"^\s*(?:from\s+([\w\.]+)\s+import\s+|import\s+([\w\.,\s]+))",
-    re.MULTILINE,
-)
 
+# Parsed imports per repo: rel path -> (mtime_ns, size, imports). A file is only
+# re-read when its stat signature changes, so repeated calls cost one stat per file.
+_ImportEntry = tuple[int, int, frozenset[str]]
+_IMPORT_CACHE: dict[str, dict[str, _ImportEntry]] = {}
+_IMPORT_CACHE_LOCK = threading.Lock()
 
-def extract_changed_paths(event_rel_path: str | None, current_diff: str) -> list[str]:
+# Dotted module names as nested dicts; a node's _TRIE_PATH entry is the file
+# defining that module. Module name parts are never empty, so "" cannot clash.
+_ModuleTrie = dict[str, Any]
+_TRIE_PATH = ""
+
+
+def extract_changed_paths(
+    event_rel_path: str | Sequence[str] | None, current_diff: str
+) -> list[str]:
     """Extract changed repo-relative paths from event metadata and git diff."""
     seen: set[str] = set()
     ordered: list[str] = []
 
-    if event_rel_path:
-        p = event_rel_path.strip()
+    event_paths = [event_rel_path] if isinstance(event_rel_path, str) else event_rel_path or []
+    for event_path in event_paths:
+        p = event_path.strip()
         if p and p not in seen:
             seen.add(p)
             ordered.append(p)
@@ -55,26 +70,46 @@ def compute_impact_radius(
     changed = [p for p in changed_paths if p in tree_set]
     if not changed:
         return []
+    if not any(p.endswith(".py") for p in changed):
+        # Only Python files get neighbors, so skip indexing the tree entirely.
+        return list(dict.fromkeys(changed))[: max(1, max_files)]
 
     module_by_path: dict[str, str] = {}
-    path_by_module: dict[str, str] = {}
+    module_trie: _ModuleTrie = {}
+    # Real test files indexed by the module stem they cover (test_x.py / x_test.py).
+    tests_by_stem: dict[str, list[str]] = {}
     for p in normalized_tree:
         if not p.endswith(".py"):
             continue
+        name = p.rpartition("/")[2][:-3]
+        if name.startswith("test_"):
+            tests_by_stem.setdefault(name[5:], []).append(p)
+        elif name.endswith("_test"):
+            tests_by_stem.setdefault(name[:-5], []).append(p)
         module = _module_name_from_path(p)
         if not module:
             continue
         module_by_path[p] = module
-        path_by_module[module] = p
+        node = module_trie
+        for part in module.split("."):
+            node = node.setdefault(part, {})
+        node[_TRIE_PATH] = p
+
+    imports_by_path = _cached_imports(repo_path, list(module_by_path))
+
+    # The same modules (os, typing, the package root) are imported from many
+    # files; resolve each distinct name once.
+    resolved: dict[str, str | None] = {}
 
-    imports_by_path: dict[str, set[str]] = {}
-    for p in module_by_path:
-        imports_by_path[p] = _parse_python_imports(repo_path / p)
+    def resolve(module: str) -> str | None:
+        if module not in resolved:
+            resolved[module] = _resolve_module_to_path(module, module_trie)
+        return resolved[module]
 
     importers_by_path: dict[str, set[str]] = {p: set() for p in module_by_path}
     for path, imports in imports_by_path.items():
         for imported_mod in imports:
-            imported_path = _resolve_module_to_path(imported_mod, path_by_module)
+            imported_path = resolve(imported_mod)
             if imported_path:
                 importers_by_path.setdefault(imported_path, set()).add(path)
 
@@ -95,19 +130,44 @@ def compute_impact_radius(
 
         # Direct dependencies and reverse dependencies.
         for imported_mod in sorted(imports_by_path.get(path, set())):
-            dep = _resolve_module_to_path(imported_mod, path_by_module)
+            dep = resolve(imported_mod)
             if dep:
                 add_path(dep)
         for importer in sorted(importers_by_path.get(path, set())):
             add_path(importer)
 
         # Likely tests touching the changed module.
-        for test_path in _candidate_test_paths(path):
+        for test_path in tests_by_stem.get(_module_stem(path), ()):
             add_path(test_path)
 
     return ordered[: max(1, max_files)]
 
 
+def _cached_imports(repo_path: Path, paths: list[str]) -> dict[str, frozenset[str]]:
+    """Imports for each of ``paths``, re-parsing only files whose stat changed."""
+    key = os.path.abspath(repo_path)
+    with _IMPORT_CACHE_LOCK:
+        previous = _IMPORT_CACHE.get(key, {})
+
+    current: dict[str, _ImportEntry] = {}
+    for p in paths:
+        full = repo_path / p
+        try:
+            st = full.stat()
+        except OSError:
+            current[p] = (-1, -1, frozenset())
+            continue
+        entry = previous.get(p)
+        if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            entry = (st.st_mtime_ns, st.st_size, frozenset(_parse_python_imports(full)))
+        current[p] = entry
+
+    # Only files still in the tree are kept, so deleted files drop out.
+    with _IMPORT_CACHE_LOCK:
+        _IMPORT_CACHE[key] = current
+    return {p: entry[2] for p, entry in current.items()}
+
+
 def _module_name_from_path(path: str) -> str:
     if not path.endswith(".py"):
         return ""
@@ -124,53 +184,38 @@ def _parse_python_imports(path: Path) -> set[str]:
     except Exception:
         return set()
 
+    try:
+        tree = ast.parse(text, filename=str(path))
+    except (SyntaxError, ValueError):
+        return set()
+
+    # Absolute imports only; strings and comments never reach the AST.
     imports: set[str] = set()
-    for m in _IMPORT_RE.finditer(text):
-        from_mod = (m.group(1) or "").strip()
-        import_mods = (m.group(2) or "").strip()
-        if from_mod:
-            imports.add(from_mod)
-            continue
-        if import_mods:
-            for part in import_mods.split(","):
-                mod = part.strip().split(" as ", 1)[0].strip()
-                if mod:
-                    imports.add(mod)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            imports.add(node.module)
     return imports
 
 
-def _resolve_module_to_path(module: str, path_by_module: dict[str, str]) -> str | None:
-    if module in path_by_module:
-        return path_by_module[module]
-
-    # Handle "import pkg.sub.mod" when only parent is directly tracked.
-    parts = module.split(".")
-    for i in range(len(parts), 0, -1):
-        candidate = ".".join(parts[:i])
-        if candidate in path_by_module:
-            return path_by_module[candidate]
-    return None
+def _resolve_module_to_path(module: str, trie: _ModuleTrie) -> str | None:
+    # Longest tracked prefix wins, so "import pkg.sub.mod" resolves to pkg/sub.py
+    # when only the parent is tracked.
+    found: str | None = None
+    node = trie
+    for part in module.split("."):
+        child = node.get(part)
+        if child is None:
+            break
+        node = child
+        found = node.get(_TRIE_PATH, found)
+    return found
 
 
-def _candidate_test_paths(path: str) -> list[str]:
-    p = Path(path)
-    stem = p.stem
-
+def _module_stem(path: str) -> str:
+    parent, _, name = path.rpartition("/")
+    stem = name[:-3] if name.endswith(".py") else name
     if stem == "__init__":
-        stem = p.parent.name
-
-    candidates = [
-        f"tests/test_{stem}.py",
-        f"tests/{p.parent}/test_{stem}.py",
-        f"test/test_{stem}.py",
-    ]
-
-    # Normalize any duplicate slashes.
-    normalized: list[str] = []
-    seen: set[str] = set()
-    for c in candidates:
-        n = str(Path(c))
-        if n not in seen:
-            seen.add(n)
-            normalized.append(n)
-    return normalized
+        stem = parent.rpartition("/")[2]
+    return stem
@@ -6,31 +6,208 @@ Provides robust communication with Kimi K2.5 via OpenAI-compatible API.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import json
 import os
 import random
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
+from types import TracebackType
 from typing import Any, cast
 
 import httpx
 
+from .concurrency import AdaptiveSemaphore
 from .config import KimiConfig
 
+# HTTP/2 lets concurrent agent requests multiplex over one connection; httpx
+# only supports it when the optional h2 package is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Retry delays use full jitter: uniform over [0, min(cap, base * 2**attempt)], so
+# clients throttled together do not retry together.
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_CAP_SECONDS = 30.0
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Responses and transport failures worth retrying: throttling, gateway errors,
+# and connections dropped mid-response (RemoteProtocolError is not a NetworkError).
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_EXCEPTIONS = (httpx.NetworkError, httpx.TimeoutException, httpx.RemoteProtocolError)
+
+# Upper bound on a server-requested Retry-After wait.
+_RETRY_AFTER_MAX_SECONDS = 120.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    return random.uniform(0, min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * (1 << attempt)))
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Honor a numeric Retry-After header (plus a little jitter), else back off."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = -1.0
+        if seconds >= 0:
+            return min(seconds, _RETRY_AFTER_MAX_SECONDS) + random.uniform(0, 0.25)
+    return _backoff_delay(attempt)
+
+
+_SSE_DATA_PREFIX = b"data: "
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
+_SSE_DONE = b"[DONE]"
+
+
+def _parse_sse_line(line: bytes) -> tuple[bool, dict[str, Any] | None]:
+    """Decode one SSE line into ``(done, chunk)``; blank and malformed lines give no chunk."""
+    line = line.strip()
+    if not line:
+        return False, None
+    if line.startswith(_SSE_DATA_PREFIX):
+        line = line[_SSE_DATA_PREFIX_LEN:]
+    if line == _SSE_DONE:
+        return True, None
+    try:
+        return False, json.loads(line)
+    except ValueError:
+        # Skip malformed lines
+        return False, None
+
 
 class KimiClient:
     """
     Async HTTP client for Kimi K2.5 with retry/backoff logic.
 
     Features:
-    - Exponential backoff with jitter for rate limits
+    - Exponential backoff with full jitter for rate limits and network errors
     - Concurrency limiting via semaphore
+    - One pooled keep-alive connection set shared by every request
     - Streaming support for progressive responses
     - Automatic retry on transient failures
     """
 
     def __init__(self, config: KimiConfig):
         self.config = config
-        self.semaphore = asyncio.Semaphore(config.max_concurrency)
+        # Resizable at runtime via set_max_concurrency(); in-flight calls keep their slots.
+        self.semaphore = AdaptiveSemaphore(config.max_concurrency)
         self.retry_max = int(os.getenv("AMBIENT_RETRY_MAX", "6"))
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+
+    def set_max_concurrency(self, limit: int) -> int:
+        """Change how many requests may be in flight; returns the applied limit.
+
+        Lowering the limit never cancels running requests, it only delays new
+        ones. The connection pool keeps the size it was created with.
+        """
+        self.semaphore.set_ceiling(limit)
+        return self.semaphore.resize(limit)
+
+    def retry_budget_seconds(self) -> float:
+        """Worst-case time one ``chat_completion`` can take once it holds a slot.
+
+        Every attempt may run to the request timeout and then wait out the largest
+        honored Retry-After.
+        """
+        return self.retry_max * (float(self.config.timeout_seconds) + _RETRY_AFTER_MAX_SECONDS)
+
+    def _client(self) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use.
+
+        httpx clients are bound to the event loop they first ran on, so a new
+        pool is created if the client is used from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._http_loop is not loop:
+            limit = max(1, int(self.config.max_concurrency))
+            self._http = httpx.AsyncClient(
+                timeout=self.config.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=limit * 2,
+                    max_keepalive_connections=limit,
+                ),
+                http2=_HTTP2_AVAILABLE,
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def warmup(self) -> None:
+        """Open a pooled connection ahead of the first completion request.
+
+        Best effort: failures are ignored and surface on the real request.
+        """
+        if os.getenv("AMBIENT_DISABLE_NETWORK") == "1":
+            return
+        try:
+            await self._client().get(f"{self.config.base_url}/models", timeout=5.0)
+        except Exception:
+            pass
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        http, self._http, self._http_loop = self._http, None, None
+        if http is not None and not http.is_closed:
+            await http.aclose()
+
+    async def __aenter__(self) -> KimiClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def submit(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+    ) -> asyncio.Task[dict[str, Any]]:
+        """
+        Start a chat completion in the background and return its task.
+
+        Lets a caller build the next prompt while this request is in flight.
+        The request still waits for a concurrency slot inside the task. The
+        caller must keep the returned task and await (or cancel) it.
+        """
+        return asyncio.create_task(self.chat_completion(messages, temperature))
+
+    async def chat_completions(
+        self,
+        batch: Sequence[list[dict[str, str]]],
+        temperature: float | None = None,
+    ) -> list[dict[str, Any] | Exception]:
+        """
+        Run many chat completions with at most max_concurrency in flight.
+
+        A fixed pool of workers pulls requests from a queue, so a slow
+        request only holds up its own worker. Results line up with
+        ``batch``; a request that failed yields its exception instead.
+        """
+        pending: asyncio.Queue[tuple[int, list[dict[str, str]]]] = asyncio.Queue()
+        for item in enumerate(batch):
+            pending.put_nowait(item)
+        results: list[dict[str, Any] | Exception] = [
+            RuntimeError("chat completion not run")
+        ] * len(batch)
+
+        async def worker() -> None:
+            while not pending.empty():
+                index, messages = pending.get_nowait()
+                try:
+                    results[index] = await self.chat_completion(messages, temperature)
+                except Exception as e:
+                    results[index] = e
+
+        workers = min(len(batch), self.semaphore.limit)
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
 
     async def chat_completion(
         self,
@@ -48,10 +225,10 @@ class KimiClient:
             Response dict with "choices" containing the completion
 
         Retry strategy:
-        - 429 (rate limit): Exponential backoff with jitter
-        - 503/504 (server error): Exponential backoff
+        - 429 (rate limit): Retry-After if the server sent one, else backoff with jitter
+        - 500/502/503/504 (server/gateway error): Same as 429
         - 400/401/403: No retry (client error)
-        - Network errors: Retry with backoff
+        - Network, timeout and dropped-connection errors: Retry with backoff
 
         Raises:
             Exception: After max retries exceeded or on client errors
@@ -62,46 +239,44 @@ class KimiClient:
         if temperature is None:
             temperature = self.config.temperature
 
+        # Serialize once; retries resend the same bytes.
+        payload = json.dumps(
+            {"model": self.config.model_id, "messages": messages, "temperature": temperature},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
         async with self.semaphore:  # Limit concurrency
             for attempt in range(self.retry_max):
                 try:
-                    async with httpx.AsyncClient(
-                        timeout=self.config.timeout_seconds
-                    ) as client:
-                        response = await client.post(
-                            f"{self.config.base_url}/chat/completions",
-                            json={
-                                "model": self.config.model_id,
-                                "messages": messages,
-                                "temperature": temperature,
-                            },
-                        )
-
-                        if response.status_code == 200:
-                            return cast(dict[str, Any], response.json())
-
-                        # Retry on transient errors
-                        if response.status_code in [429, 503, 504]:
-                            sleep_time = (2**attempt) * 0.5  # Exponential backoff
-                            jitter = random.uniform(0, 0.1 * sleep_time)
-                            await asyncio.sleep(sleep_time + jitter)
-                            continue
-
-                        # Don't retry on client errors (or other non-transient server errors).
+                    response = await self._client().post(
+                        f"{self.config.base_url}/chat/completions",
+                        content=payload,
+                        headers=_JSON_HEADERS,
+                    )
+
+                    if response.status_code == 200:
+                        return cast(dict[str, Any], response.json())
+
+                    # Retry on transient errors
+                    if response.status_code in _RETRY_STATUSES:
+                        await asyncio.sleep(_retry_delay(response, attempt))
+                        continue
+
+                    # Don't retry on client errors (or other non-transient server errors).
+                    body = ""
+                    try:
+                        body = response.text
+                    except Exception:
                         body = ""
-                        try:
-                            body = response.text
-                        except Exception:
-                            body = ""
-                        snippet = body[:500] if body else ""
-                        raise RuntimeError(
-                            f"Kimi request failed: HTTP {response.status_code}. {snippet}"
-                        )
-
-                except (httpx.NetworkError, httpx.TimeoutException) as e:
+                    snippet = body[:500] if body else ""
+                    raise RuntimeError(
+                        f"Kimi request failed: HTTP {response.status_code}. {snippet}"
+                    )
+
+                except _RETRY_EXCEPTIONS as e:
                     if attempt < self.retry_max - 1:
-                        sleep_time = (2**attempt) * 0.5
-                        await asyncio.sleep(sleep_time)
+                        await asyncio.sleep(_backoff_delay(attempt))
                         continue
                     raise Exception(
                         f"Network error after {self.retry_max} attempts: {e}"
@@ -137,37 +312,36 @@ class KimiClient:
             temperature = self.config.temperature
 
         async with self.semaphore:
-            async with httpx.AsyncClient(
-                timeout=self.config.timeout_seconds
-            ) as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.config.base_url}/chat/completions",
-                    json={
-                        "model": self.config.model_id,
-                        "messages": messages,
-                        "temperature": temperature,
-                        "stream": True,
-                    },
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if not line.strip():
-                            continue
-                        if line.startswith("data: "):
-                            line = line[6:]  # Remove "data: " prefix
-                        if line == "[DONE]":
-                            break
-
-                        try:
-                            import json
-
-                            chunk = json.loads(line)
+            async with self._client().stream(
+                "POST",
+                f"{self.config.base_url}/chat/completions",
+                json={
+                    "model": self.config.model_id,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "stream": True,
+                },
+            ) as response:
+                response.raise_for_status()
+
+                # Split SSE lines from raw bytes; only payloads are decoded.
+                buf = bytearray()
+                async for data in response.aiter_bytes():
+                    buf += data
+                    start = 0
+                    while (nl := buf.find(b"\n", start)) != -1:
+                        line = bytes(buf[start:nl])
+                        start = nl + 1
+                        done, chunk = _parse_sse_line(line)
+                        if done:
+                            return
+                        if chunk is not None:
                             yield chunk
-                        except json.JSONDecodeError:
-                            # Skip malformed lines
-                            continue
+                    del buf[:start]
+
+                done, chunk = _parse_sse_line(bytes(buf))
+                if not done and chunk is not None:
+                    yield chunk
 
     async def health_check(self) -> bool:
         """
@@ -180,9 +354,8 @@ class KimiClient:
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.config.base_url}/models")
-                return response.status_code == 200
+            response = await self._client().get(f"{self.config.base_url}/models", timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -197,11 +370,10 @@ class KimiClient:
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.config.base_url}/models")
-                if response.status_code == 200:
-                    data = response.json()
-                    return [model["id"] for model in data.get("data", [])]
+            response = await self._client().get(f"{self.config.base_url}/models", timeout=10.0)
+            if response.status_code == 200:
+                data = response.json()
+                return [model["id"] for model in data.get("data", [])]
         except Exception:
             pass
         return []
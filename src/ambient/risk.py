@@ -9,6 +9,10 @@ Determines whether proposals require human approval based on:
 
 from __future__ import annotations
 
+import heapq
+import re
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +33,16 @@ SENSITIVE_FILE_PATTERNS = [
     "database",
     "config/production",
 ]
+# All patterns as one alternation, so each path is scanned once in C.
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_FILE_PATTERNS)))
+
+# Apply order for sort_by_risk_priority; unknown levels sort last.
+_RISK_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+# Tags that mark high-risk operations
+_HIGH_RISK_TAGS = frozenset(
+    {"security", "auth", "authentication", "payment", "billing", "database"}
+)
 
 
 def assess_risk(
@@ -50,42 +64,142 @@ def assess_risk(
         - risk_factors: list of identified risk factors
         - auto_apply_eligible: bool
     """
+    return _assess(
+        proposal.risk_level,
+        proposal.files_touched,
+        proposal.estimated_loc_change,
+        proposal.tags,
+        policy.auto_apply,
+        policy.require_approval,
+        policy.file_change_limit,
+        policy.loc_change_limit,
+    )
+
+
+def batch_assess_risk(
+    proposals: Sequence[Proposal],
+    policy: RiskPolicyConfig,
+) -> list[dict[str, Any]]:
+    """
+    Assess many proposals at once; results are aligned with ``proposals``.
+
+    Equivalent to calling assess_risk() on each proposal, but each distinct
+    path is matched against the sensitive patterns only once for the batch.
+    """
+    sensitive_paths: dict[str, bool] = {}
+    for proposal in proposals:
+        for file_path in proposal.files_touched:
+            if file_path not in sensitive_paths:
+                sensitive_paths[file_path] = _SENSITIVE_RE.search(file_path.lower()) is not None
+
+    return [
+        _assess(
+            proposal.risk_level,
+            proposal.files_touched,
+            proposal.estimated_loc_change,
+            proposal.tags,
+            policy.auto_apply,
+            policy.require_approval,
+            policy.file_change_limit,
+            policy.loc_change_limit,
+            sensitive_files=[f for f in proposal.files_touched if sensitive_paths[f]],
+        )
+        for proposal in proposals
+    ]
+
+
+def assess_risk_cached(
+    proposal: Proposal,
+    policy: RiskPolicyConfig,
+    repo_path: Path | None = None,
+) -> dict[str, Any]:
+    """
+    Memoized variant of assess_risk() for repeated proposals.
+
+    The assessment depends only on the proposal's risk level, files, LOC
+    estimate and tags plus the policy settings, so those form the cache key
+    (the diff itself is never inspected). Each call returns a fresh copy.
+    """
+    cached = _assess_memo(
+        proposal.risk_level,
+        tuple(proposal.files_touched),
+        proposal.estimated_loc_change,
+        tuple(proposal.tags),
+        policy.fingerprint(),
+    )
+    return {**cached, "risk_factors": list(cached["risk_factors"])}
+
+
+@lru_cache(maxsize=1024)
+def _assess_memo(
+    risk_level: str,
+    files_touched: tuple[str, ...],
+    estimated_loc_change: int,
+    tags: tuple[str, ...],
+    policy_key: tuple[Any, ...],
+) -> dict[str, Any]:
+    auto_apply, require_approval, file_change_limit, loc_change_limit = policy_key
+    return _assess(
+        risk_level,
+        files_touched,
+        estimated_loc_change,
+        tags,
+        auto_apply,
+        require_approval,
+        file_change_limit,
+        loc_change_limit,
+    )
+
+
+def _assess(
+    risk_level: str,
+    files_touched: Sequence[str],
+    estimated_loc_change: int,
+    tags: Sequence[str],
+    auto_apply: Sequence[str],
+    require_approval: Sequence[str],
+    file_change_limit: int,
+    loc_change_limit: int,
+    sensitive_files: list[str] | None = None,
+) -> dict[str, Any]:
     risk_factors = []
 
     # Check risk level against policy
-    risk_level_requires_approval = proposal.risk_level in policy.require_approval
+    risk_level_requires_approval = risk_level in require_approval
     if risk_level_requires_approval:
-        risk_factors.append(f"Risk level: {proposal.risk_level}")
+        risk_factors.append(f"Risk level: {risk_level}")
 
     # Check file count
-    if len(proposal.files_touched) > policy.file_change_limit:
+    if len(files_touched) > file_change_limit:
         risk_factors.append(
-            f"Too many files: {len(proposal.files_touched)} > {policy.file_change_limit}"
+            f"Too many files: {len(files_touched)} > {file_change_limit}"
         )
 
     # Check LOC change
-    if abs(proposal.estimated_loc_change) > policy.loc_change_limit:
+    if abs(estimated_loc_change) > loc_change_limit:
         risk_factors.append(
-            f"Large change: {abs(proposal.estimated_loc_change)} LOC > {policy.loc_change_limit}"
+            f"Large change: {abs(estimated_loc_change)} LOC > {loc_change_limit}"
         )
 
     # Check for sensitive file patterns
-    sensitive_files = _check_sensitive_files(proposal.files_touched)
-    if sensitive_files:
-        risk_factors.append(f"Sensitive files: {', '.join(sensitive_files)}")
+    if files_touched:
+        if sensitive_files is None:
+            sensitive_files = _check_sensitive_files(files_touched)
+        if sensitive_files:
+            risk_factors.append(f"Sensitive files: {', '.join(sensitive_files)}")
 
     # Check tags for high-risk operations
-    high_risk_tags = ["security", "auth", "authentication", "payment", "billing", "database"]
-    risky_tags = [tag for tag in proposal.tags if tag.lower() in high_risk_tags]
-    if risky_tags:
-        risk_factors.append(f"High-risk tags: {', '.join(risky_tags)}")
+    if tags:
+        risky_tags = [tag for tag in tags if tag.lower() in _HIGH_RISK_TAGS]
+        if risky_tags:
+            risk_factors.append(f"High-risk tags: {', '.join(risky_tags)}")
 
     # Determine if approval required
     requires_approval = len(risk_factors) > 0
 
     # Determine if auto-apply eligible (no risk factors AND low/medium risk level)
     auto_apply_eligible = (
-        not requires_approval and proposal.risk_level in policy.auto_apply
+        not requires_approval and risk_level in auto_apply
     )
 
     return {
@@ -96,6 +210,32 @@ def assess_risk(
     }
 
 
+def trivially_auto_approves(proposal: Proposal, policy: RiskPolicyConfig) -> bool:
+    """
+    Fast path: True if the proposal has no risk factors under the policy.
+
+    Equivalent to ``not assess_risk(proposal, policy)["requires_approval"]``,
+    but bails out at the first risk factor and never renders factor strings,
+    so routine proposals skip the full assessment.
+
+    Args:
+        proposal: Proposal to check
+        policy: Risk policy configuration
+
+    Returns:
+        True if no approval is needed
+    """
+    if proposal.risk_level in policy.require_approval:
+        return False
+    if len(proposal.files_touched) > policy.file_change_limit:
+        return False
+    if abs(proposal.estimated_loc_change) > policy.loc_change_limit:
+        return False
+    if any(tag.lower() in _HIGH_RISK_TAGS for tag in proposal.tags):
+        return False
+    return not _check_sensitive_files(proposal.files_touched)
+
+
 def requires_approval(
     proposal: Proposal,
     policy: RiskPolicyConfig,
@@ -112,11 +252,11 @@ def requires_approval(
     Returns:
         True if approval required
     """
-    assessment = assess_risk(proposal, policy, repo_path)
-    return bool(assessment.get("requires_approval", False))
+    # Only the verdict is needed, so skip rendering risk factor messages.
+    return not trivially_auto_approves(proposal, policy)
 
 
-def _check_sensitive_files(files: list[str]) -> list[str]:
+def _check_sensitive_files(files: Sequence[str]) -> list[str]:
     """
     Check if any files match sensitive patterns.
 
@@ -126,17 +266,15 @@ def _check_sensitive_files(files: list[str]) -> list[str]:
     Returns:
         List of files matching sensitive patterns
     """
-    sensitive = []
-    for file_path in files:
-        file_lower = file_path.lower()
-        for pattern in SENSITIVE_FILE_PATTERNS:
-            if pattern in file_lower:
-                sensitive.append(file_path)
-                break
-    return sensitive
+    if not files:
+        return []
+    search = _SENSITIVE_RE.search
+    return [file_path for file_path in files if search(file_path.lower())]
 
 
-def sort_by_risk_priority(proposals: list[Proposal]) -> list[Proposal]:
+def sort_by_risk_priority(
+    proposals: list[Proposal], top_k: int | None = None
+) -> list[Proposal]:
     """
     Sort proposals by risk level (critical > high > medium > low).
 
@@ -144,12 +282,19 @@ def sort_by_risk_priority(proposals: list[Proposal]) -> list[Proposal]:
 
     Args:
         proposals: List of proposals to sort
+        top_k: If set, return only the first top_k proposals of the sorted
+            order, selected with a heap instead of a full sort
 
     Returns:
-        Sorted list (highest risk first)
+        Sorted list (highest risk first); ties keep their input order
     """
-    risk_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    return sorted(proposals, key=lambda p: risk_order.get(p.risk_level, 4))
+    if top_k is not None:
+        return heapq.nsmallest(top_k, proposals, key=_risk_priority)
+    return sorted(proposals, key=_risk_priority)
+
+
+def _risk_priority(proposal: Proposal) -> int:
+    return _RISK_ORDER.get(proposal.risk_level, 4)
 
 
 def filter_by_policy(
@@ -168,18 +313,15 @@ def filter_by_policy(
     Returns:
         Filtered list of proposals
     """
-    filtered = []
-    for proposal in proposals:
-        assessment = assess_risk(proposal, policy)
-
-        if auto_apply_only:
-            if assessment["auto_apply_eligible"]:
-                filtered.append(proposal)
-        else:
-            # Include all unless explicitly filtered by some criteria
-            filtered.append(proposal)
-
-    return filtered
+    if not auto_apply_only:
+        # Include all unless explicitly filtered by some criteria
+        return list(proposals)
+    assessments = batch_assess_risk(proposals, policy)
+    return [
+        proposal
+        for proposal, assessment in zip(proposals, assessments, strict=True)
+        if assessment["auto_apply_eligible"]
+    ]
 
 
 def generate_risk_report(
@@ -4,6 +4,8 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+_HUNK_RE = re.compile(r"@@\s+-(\d+)(?:,(\d+))?\s+\+(\d+)(?:,(\d+))?\s+@@")
+
 
 class PatchApplyError(RuntimeError):
     pass
@@ -22,6 +24,39 @@ def git_reset_hard_clean(root: Path, exclude: list[str] | None = None) -> None:
     _run(root, cmd)
 
 
+def git_head_sha(root: Path) -> str:
+    """Return the commit HEAD points at, or "" if it cannot be resolved.
+
+    Reads ``.git/HEAD`` and the ref it names (loose or packed) directly, and only
+    falls back to `git rev-parse HEAD` for layouts it does not handle (linked
+    worktrees, detached gitdirs, unborn branches).
+    """
+    git_dir = root / ".git"
+    try:
+        if git_dir.is_dir():
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+            if not head.startswith("ref: "):
+                if head:
+                    return head
+            else:
+                ref = head[5:]
+                ref_path = git_dir / ref
+                if ref_path.is_file():
+                    sha = ref_path.read_text(encoding="utf-8").strip()
+                    if sha:
+                        return sha
+                packed = git_dir / "packed-refs"
+                if packed.is_file():
+                    suffix = " " + ref
+                    for line in packed.read_text(encoding="utf-8").splitlines():
+                        if line.endswith(suffix) and not line.startswith(("#", "^")):
+                            return line[: -len(suffix)]
+    except OSError:
+        pass
+    res = _run(root, ["git", "rev-parse", "HEAD"])
+    return res.stdout.strip() if res.returncode == 0 else ""
+
+
 def git_status_porcelain(root: Path) -> list[str]:
     """Return `git status --porcelain` lines (empty list means clean)."""
     res = _run(root, ["git", "status", "--porcelain"])
@@ -76,44 +111,45 @@ def git_apply_patch_atomic(root: Path, unified_diff: str) -> dict[str, Any]:
 
     def fix_hunk_counts(diff_text: str) -> str:
         lines = diff_text.splitlines()
+        n_lines = len(lines)
         out: list[str] = []
+        append = out.append
         i = 0
-        while i < len(lines):
+        while i < n_lines:
             line = lines[i]
-            if line.startswith("@@ "):
-                match = re.match(
-                    r"@@\s+-(\d+)(?:,(\d+))?\s+\+(\d+)(?:,(\d+))?\s+@@",
-                    line,
-                )
-                if not match:
-                    out.append(line)
-                    i += 1
-                    continue
-                old_start = int(match.group(1))
-                new_start = int(match.group(3))
-                old_count = 0
-                new_count = 0
-                j = i + 1
-                while j < len(lines):
-                    line_text = lines[j]
-                    if line_text.startswith("diff --git") or line_text.startswith("@@ "):
+            match = _HUNK_RE.match(line) if line[:3] == "@@ " else None
+            if match is None:
+                append(line)
+                i += 1
+                continue
+            old_start = int(match.group(1))
+            new_start = int(match.group(3))
+            old_count = 0
+            new_count = 0
+            j = i + 1
+            # Dispatch on the first character so each body line costs one slice.
+            while j < n_lines:
+                line_text = lines[j]
+                c = line_text[:1]
+                if c == "-":
+                    if line_text[:4] == "--- ":
                         break
-                    if line_text.startswith("--- ") or line_text.startswith("+++ "):
+                    old_count += 1
+                elif c == "+":
+                    if line_text[:4] == "+++ ":
                         break
-                    if line_text.startswith("-"):
-                        old_count += 1
-                    elif line_text.startswith("+"):
-                        new_count += 1
-                    else:
-                        old_count += 1
-                        new_count += 1
-                    j += 1
-                out.append(f"@@ -{old_start},{old_count} +{new_start},{new_count} @@")
-                out.extend(lines[i + 1 : j])
-                i = j
-                continue
-            out.append(line)
-            i += 1
+                    new_count += 1
+                elif (c == "@" and line_text[:3] == "@@ ") or (
+                    c == "d" and line_text[:10] == "diff --git"
+                ):
+                    break
+                else:
+                    old_count += 1
+                    new_count += 1
+                j += 1
+            append(f"@@ -{old_start},{old_count} +{new_start},{new_count} @@")
+            out.extend(lines[i + 1 : j])
+            i = j
         return "\n".join(out) + "\n"
 
     def detect_strip_level(diff_text: str) -> int:
@@ -159,7 +195,11 @@ def git_apply_patch_atomic(root: Path, unified_diff: str) -> dict[str, Any]:
         old_count = 0
 
         for line in diff_text.splitlines():
-            if line.startswith("diff --git "):
+            c = line[:1]
+            if c == " ":
+                hunk_lines.append(line)
+                continue
+            if c == "d" and line[:11] == "diff --git ":
                 if current_file and hunk_lines and current_hunks is not None:
                     current_hunks.append((old_start, old_count, hunk_lines))
                     hunk_lines = []
@@ -171,25 +211,21 @@ def git_apply_patch_atomic(root: Path, unified_diff: str) -> dict[str, Any]:
                     current_file = b_path
                     current_hunks = files.setdefault(current_file, [])
                 continue
-            if line.startswith("--- ") or line.startswith("+++ ") or line.startswith("index "):
+            if c == "-" or c == "+":
+                if line[:4] != "--- " and line[:4] != "+++ ":
+                    hunk_lines.append(line)
                 continue
-            if line.startswith("@@ "):
+            if c == "@" and line[:3] == "@@ ":
                 if current_file is None:
                     continue
                 if hunk_lines and current_hunks is not None:
                     current_hunks.append((old_start, old_count, hunk_lines))
                     hunk_lines = []
-                match = re.match(
-                    r"@@\s+-(\d+)(?:,(\d+))?\s+\+(\d+)(?:,(\d+))?\s+@@",
-                    line,
-                )
+                match = _HUNK_RE.match(line)
                 if not match:
                     continue
                 old_start = int(match.group(1))
                 old_count = int(match.group(2) or "1")
-                continue
-            if line.startswith((" ", "+", "-")):
-                hunk_lines.append(line)
 
         if current_file and hunk_lines and current_hunks is not None:
             current_hunks.append((old_start, old_count, hunk_lines))
@@ -222,16 +258,17 @@ def git_apply_patch_atomic(root: Path, unified_diff: str) -> dict[str, Any]:
                 new_lines.extend(original_lines[idx:h_start_idx])
                 idx = h_start_idx
                 for h_line in h_lines:
-                    if h_line.startswith(" "):
+                    c = h_line[:1]
+                    if c == " ":
                         if idx >= len(original_lines) or original_lines[idx].rstrip("\r\n") != h_line[1:]:
                             raise PatchApplyError("hunk context mismatch")
                         new_lines.append(original_lines[idx])
                         idx += 1
-                    elif h_line.startswith("-"):
+                    elif c == "-":
                         if idx >= len(original_lines) or original_lines[idx].rstrip("\r\n") != h_line[1:]:
                             raise PatchApplyError("hunk removal mismatch")
                         idx += 1
-                    elif h_line.startswith("+"):
+                    else:
                         new_lines.append(h_line[1:] + "\n")
             new_lines.extend(original_lines[idx:])
             file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -299,45 +336,40 @@ def git_apply_patch_atomic(root: Path, unified_diff: str) -> dict[str, Any]:
         except OSError:
             pass
 
+    def _stage_and_stat(paths: list[str]) -> str:
+        add_cmd = ["git", "add", "--"] + paths if paths else ["git", "add", "-A"]
+        c_add = _run(root, add_cmd)
+        if c_add.returncode != 0:
+            raise PatchApplyError(c_add.stderr)
+        return _run(root, ["git", "diff", "--cached", "--stat"]).stdout
+
     def apply_with_git(diff_text: str) -> dict[str, Any]:
         patch_path.write_text(diff_text, encoding="utf-8")
         strip_primary = detect_strip_level(diff_text)
         strip_levels = [strip_primary, 1 - strip_primary]
+        paths = extract_paths(diff_text)
 
         for strip in strip_levels:
+            # `git apply` is all-or-nothing, so a clean apply needs no separate
+            # --check; the reverse probe only runs once the forward apply fails.
+            c_apply = _apply_run(["git", "apply", f"-p{strip}", str(patch_path)])
+            if c_apply.returncode == 0:
+                return {"ok": True, "stat": _stage_and_stat(paths), "stderr": ""}
+
             c_rev = _apply_run(
                 ["git", "apply", "--check", "-R", f"-p{strip}", str(patch_path)]
             )
             if c_rev.returncode == 0:
-                paths = extract_paths(diff_text)
-                add_cmd = ["git", "add", "--"] + paths if paths else ["git", "add", "-A"]
-                c_add = _run(root, add_cmd)
-                if c_add.returncode != 0:
-                    raise PatchApplyError(c_add.stderr)
-                stat = _run(root, ["git", "diff", "--cached", "--stat"]).stdout
-                return {"ok": True, "stat": stat, "stderr": "", "status": "already_applied"}
-
-            c_check = _apply_run(["git", "apply", "--check", f"-p{strip}", str(patch_path)])
-            if c_check.returncode == 0:
-                c_apply = _apply_run(["git", "apply", f"-p{strip}", str(patch_path)])
-                if c_apply.returncode == 0:
-                    paths = extract_paths(diff_text)
-                    add_cmd = ["git", "add", "--"] + paths if paths else ["git", "add", "-A"]
-                    c_add = _run(root, add_cmd)
-                    if c_add.returncode != 0:
-                        raise PatchApplyError(c_add.stderr)
-                    stat = _run(root, ["git", "diff", "--cached", "--stat"]).stdout
-                    return {"ok": True, "stat": stat, "stderr": ""}
+                return {
+                    "ok": True,
+                    "stat": _stage_and_stat(paths),
+                    "stderr": "",
+                    "status": "already_applied",
+                }
 
             c_3way = _apply_run(["git", "apply", "--3way", f"-p{strip}", str(patch_path)])
             if c_3way.returncode == 0:
-                paths = extract_paths(diff_text)
-                add_cmd = ["git", "add", "--"] + paths if paths else ["git", "add", "-A"]
-                c_add = _run(root, add_cmd)
-                if c_add.returncode != 0:
-                    raise PatchApplyError(c_add.stderr)
-                stat = _run(root, ["git", "diff", "--cached", "--stat"]).stdout
-                return {"ok": True, "stat": stat, "stderr": ""}
+                return {"ok": True, "stat": _stage_and_stat(paths), "stderr": ""}
 
         try:
             paths = apply_unified_diff_fallback(diff_text)
@@ -406,11 +438,20 @@ def git_commit(
     author_name: str = "SwarmGuard Bot",
     author_email: str = "swarmguard@bot.com",
 ) -> None:
-    # Configure user for commit if needed?
-    # Assume global config or env vars set or we set local config
-    _run(root, ["git", "config", "user.email", author_email])
-    _run(root, ["git", "config", "user.name", author_name])
-
-    res = _run(root, ["git", "commit", "-m", message])
+    # Pass the identity per invocation: one process instead of three, and the
+    # repository's own config is left untouched.
+    res = _run(
+        root,
+        [
+            "git",
+            "-c",
+            f"user.name={author_name}",
+            "-c",
+            f"user.email={author_email}",
+            "commit",
+            "-m",
+            message,
+        ],
+    )
     if res.returncode != 0 and "nothing to commit" not in res.stdout:
         raise RuntimeError(f"Commit failed: {res.stderr}")
@@ -2,14 +2,42 @@ from __future__ import annotations
 
 import re
 
-_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+_PATTERNS: list[tuple[str, str]] = [
     # Common API key shapes (best-effort).
-    (re.compile(r"\bsk-[A-Za-z0-9]{16,}\b"), "sk-REDACTED"),
-    (re.compile(r"\bAKIA[0-9A-Z]{16}\b"), "AKIA_REDACTED"),
-    (re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----", re.S), "PRIVATE_KEY_REDACTED"),
-    (re.compile(r"\bghp_[A-Za-z0-9]{20,}\b"), "ghp_REDACTED"),
+    (r"\bsk-[A-Za-z0-9]{16,}\b", "sk-REDACTED"),
+    (r"\bAKIA[0-9A-Z]{16}\b", "AKIA_REDACTED"),
+    (r"-----BEGIN [A-Z ]*PRIVATE KEY-----.*?-----END [A-Z ]*PRIVATE KEY-----", "PRIVATE_KEY_REDACTED"),
+    (r"\bghp_[A-Za-z0-9]{20,}\b", "ghp_REDACTED"),
 ]
 
+# All patterns fused into one alternation so the input is scanned once; each
+# pattern is its own (only) group, so lastindex selects the replacement.
+_COMBINED = re.compile("|".join(f"({src})" for src, _ in _PATTERNS), re.S)
+_REPLACEMENTS = tuple(repl for _, repl in _PATTERNS)
+
+# Literal substrings every pattern match must contain; text holding none of them
+# (the common case) skips the regex engine entirely.
+_TRIGGERS = ("sk-", "AKIA", "-----BEGIN", "ghp_")
+
+# When only a prefix of the input is scanned, a key block may start inside the
+# prefix but end beyond it; redact everything from its header onwards.
+_UNTERMINATED_KEY = re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----.*", re.S)
+
+# Extra characters scanned past max_len, and characters discarded from the end of
+# a scanned prefix (a secret cut at the edge may be too short to match a pattern).
+_SCAN_SLACK = 256
+_CUT_GUARD = 32
+
+
+def _replacement(m: re.Match[str]) -> str:
+    return _REPLACEMENTS[(m.lastindex or 1) - 1]
+
+
+def _redact(s: str) -> str:
+    if not any(t in s for t in _TRIGGERS):
+        return s
+    return _COMBINED.sub(_replacement, s)
+
 
 def redact_text(s: str, *, max_len: int = 400) -> str:
     """Redact common secret patterns and truncate.
@@ -19,11 +47,20 @@ def redact_text(s: str, *, max_len: int = 400) -> str:
     """
     if not s:
         return ""
-    out = s
-    for pat, repl in _PATTERNS:
-        out = pat.sub(repl, out)
-    out = out.strip()
+    # Nothing past max_len survives, so scan a bounded prefix instead of the whole
+    # string; widen it only if redactions shrank the prefix below max_len.
+    window = max_len + _SCAN_SLACK
+    while True:
+        if len(s) <= window:
+            out = _redact(s).strip()
+            break
+        out = _redact(s[:window])
+        if "-----BEGIN" in out:
+            out = _UNTERMINATED_KEY.sub("PRIVATE_KEY_REDACTED", out)
+        out = out[:-_CUT_GUARD].lstrip()
+        if len(out) > max_len:
+            break
+        window *= 4
     if len(out) > max_len:
         out = out[:max_len] + "...(truncated)"
     return out
-
@@ -1,16 +1,33 @@
+import functools
+import os
 from pathlib import Path
 
 FORBIDDEN_COMPONENTS = {".git", ".env", ".ssh", ".swarmguard_secrets"}
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_root_cached(root: Path, identity: tuple[int, int]) -> Path:
+    return root.resolve()
+
+
+def _resolve_root(root: Path) -> Path:
+    # Keyed on the (device, inode) the root currently points at, so retargeting
+    # a symlinked root invalidates the cached resolution.
+    try:
+        st = os.stat(root)
+    except OSError:
+        return root.resolve()
+    return _resolve_root_cached(root, (st.st_dev, st.st_ino))
+
+
 def safe_resolve(root: Path, rel_path: str) -> Path:
     # Normalize root to avoid false "escape" on platforms where `resolve()`
     # canonicalizes paths (e.g., macOS /var -> /private/var).
-    root = root.resolve()
+    root = _resolve_root(root) if root.is_absolute() else root.resolve()
     if rel_path.startswith("/"):
         raise ValueError("Absolute paths not allowed")
     p = (root / rel_path).resolve()
-    if root != p and root not in p.parents:
+    if p.parts[: len(root.parts)] != root.parts:
         raise ValueError("Path escapes repo root")
     for part in p.parts:
         if part in FORBIDDEN_COMPONENTS:
@@ -5,40 +5,266 @@ Simplified version without Ray dependencies - writes directly to JSONL files.
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import queue
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
 DEFAULT_TELEMETRY_PATH = ".ambient/telemetry.jsonl"
 
+# Writer batching: flush after this many records or this much time, whichever first.
+_BATCH_MAX_RECORDS = 256
+_BATCH_WINDOW_SECONDS = 0.05
+
+_Record = tuple[float, str, str, dict[str, Any]]
+
+
+class TelemetryLevel(IntEnum):
+    """Event importance; a sink drops events below its minimum level."""
+
+    VERBOSE = 1
+    STANDARD = 2
+    CRITICAL = 3
+
+
+# Either a ready payload or a zero-arg supplier that is only invoked when the
+# event will actually be recorded.
+TelemetryPayload = dict[str, Any] | Callable[[], dict[str, Any]]
+
+# Run id for TelemetrySink.emit(); asyncio tasks inherit it from the task that
+# created them, so one binding covers a whole apply batch.
+_current_run_id: ContextVar[str] = ContextVar("ambient_run_id", default="")
+
+
+@contextmanager
+def bind_run_id(run_id: str) -> Iterator[None]:
+    """Make ``run_id`` the implicit run id for ``TelemetrySink.emit`` in this context."""
+    token = _current_run_id.set(run_id)
+    try:
+        yield
+    finally:
+        _current_run_id.reset(token)
+
+
+def _encode(record: _Record) -> bytes:
+    timestamp, run_id, event_type, data = record
+    entry = {
+        "timestamp": timestamp,
+        "run_id": run_id,
+        "type": event_type,
+        "data": data,
+    }
+    try:
+        line = json.dumps(entry, ensure_ascii=False)
+    except (TypeError, ValueError):
+        try:
+            line = json.dumps(entry, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            # default= only covers values; non-str keys still raise.
+            entry["data"] = {"unserializable": repr(data)}
+            line = json.dumps(entry, ensure_ascii=False, default=str)
+    return (line + "\n").encode("utf-8", errors="replace")
+
+
+def _append(path: Path, payload: bytes) -> None:
+    """Append payload to path with a single O_APPEND descriptor."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _writev_all(fd: int, chunks: list[bytes]) -> None:
+    """Write every chunk with one writev call, finishing any short write."""
+    written = os.writev(fd, chunks)
+    total = sum(len(chunk) for chunk in chunks)
+    if written < total:
+        view = memoryview(b"".join(chunks))[written:]
+        while view:
+            view = view[os.write(fd, view) :]
+
+
+class _BackgroundWriter:
+    """Single consumer thread that appends queued telemetry records to one file.
+
+    Producers (the event loop, watchdog threads) only pay for a thread-safe
+    enqueue; serialization and disk I/O happen on the writer thread. The file
+    stays open across batches and is reopened if it was unlinked (e.g. by
+    retention pruning) or a write fails.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._queue: queue.SimpleQueue[_Record | threading.Event] = queue.SimpleQueue()
+        self._start_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._fd: int | None = None
+
+    def put(self, record: _Record) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put(record)
+
+    def flush(self, timeout: float | None = 5.0) -> None:
+        """Block until every record enqueued before this call is on disk."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(
+                target=self._run,
+                name=f"telemetry-writer:{self.path.name}",
+                daemon=True,
+            )
+            thread.start()
+            self._thread = thread
+
+    def _run(self) -> None:
+        while True:
+            batch: list[bytes] = []
+            waiter: threading.Event | None = None
+            item = self._queue.get()
+            deadline = time.monotonic() + _BATCH_WINDOW_SECONDS
+            while True:
+                if isinstance(item, threading.Event):
+                    waiter = item
+                    break
+                try:
+                    batch.append(_encode(item))
+                except Exception:
+                    # Drop the record rather than lose the writer thread.
+                    pass
+                if len(batch) >= _BATCH_MAX_RECORDS:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    _writev_all(self._open(), batch)
+                except OSError:
+                    # Best-effort; telemetry should never crash the coordinator.
+                    self._close()
+            if waiter is not None:
+                waiter.set()
+
+    def _open(self) -> int:
+        fd = self._fd
+        if fd is not None and os.fstat(fd).st_nlink > 0:
+            return fd
+        self._close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        self._fd = fd
+        return fd
+
+    def _close(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+# One writer per file, so sinks sharing a path keep a single ordered stream.
+_WRITERS_BY_PATH: dict[str, _BackgroundWriter] = {}
+_WRITERS_BY_PATH_LOCK = threading.Lock()
+
+
+def _writer_for(path: Path) -> _BackgroundWriter:
+    key = os.path.abspath(path)
+    with _WRITERS_BY_PATH_LOCK:
+        writer = _WRITERS_BY_PATH.get(key)
+        if writer is None:
+            writer = _WRITERS_BY_PATH[key] = _BackgroundWriter(path)
+        return writer
+
+
+@atexit.register
+def _flush_all_writers() -> None:
+    with _WRITERS_BY_PATH_LOCK:
+        writers = list(_WRITERS_BY_PATH.values())
+    for writer in writers:
+        writer.flush(timeout=2.0)
+
 
 @dataclass(frozen=True)
 class TelemetrySink:
     """Thin wrapper around JSONL telemetry.
 
+    Records are handed to a background writer thread, so ``log`` never blocks
+    on disk. The payload's top level is copied when it is logged; nested
+    objects must not be mutated afterwards. Call ``flush`` when the file must
+    reflect everything logged so far.
+
     Event schema:
       {"timestamp": <float>, "run_id": <str>, "type": <str>, "data": <object>}
     """
 
     enabled: bool
     path: Path
+    min_level: TelemetryLevel = TelemetryLevel.VERBOSE
+    _writer: _BackgroundWriter = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_writer", _writer_for(self.path))
+
+    def enabled_for(self, level: TelemetryLevel) -> bool:
+        """Return True if events at ``level`` would be recorded."""
+        return self.enabled and level >= self.min_level
 
-    def log(self, run_id: str, event_type: str, data: dict[str, Any]) -> None:
-        if not self.enabled:
+    def log(
+        self,
+        run_id: str,
+        event_type: str,
+        data: TelemetryPayload,
+        level: TelemetryLevel = TelemetryLevel.STANDARD,
+    ) -> None:
+        if not self.enabled or level < self.min_level:
             return
 
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        entry = {
-            "timestamp": time.time(),
-            "run_id": run_id,
-            "type": event_type,
-            "data": data,
-        }
+        payload = data() if callable(data) else data
+        # Shallow snapshot so later mutation by the caller cannot race the writer.
+        self._writer.put((time.time(), run_id, event_type, dict(payload)))
+
+    def emit(
+        self,
+        event_type: str,
+        data: TelemetryPayload,
+        level: TelemetryLevel = TelemetryLevel.STANDARD,
+    ) -> None:
+        """Like ``log`` but takes the run id bound by ``bind_run_id``."""
+        self.log(_current_run_id.get(), event_type, data, level)
 
-        with open(self.path, "a") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    def flush(self, timeout: float | None = 5.0) -> None:
+        """Wait for queued records to be written to disk."""
+        self._writer.flush(timeout)
 
 
 def prune_telemetry_file(telemetry_path: Path, retention_days: int) -> None:
@@ -67,13 +293,13 @@ def log_event(
 
     Args:
         run_id: Unique identifier for this run/cycle
-        event_type: Type of event (e.g., "cycle_started", "proposal", "apply_result")
+        event_type: Type of event (e.g., "cycle_started", "proposals", "apply_result")
         data: Event-specific data
         telemetry_path: Path to telemetry file (default: .ambient/telemetry.jsonl)
 
     Event types:
         - cycle_started: Run begins
-        - proposal: Agent generated patch proposal
+        - proposals: Patch proposals generated by one agent
         - risk_trigger: Human approval required
         - apply_result: Patch application outcome
         - command_executed: Sandbox command run
@@ -83,4 +309,5 @@ def log_event(
     if telemetry_path is None:
         telemetry_path = DEFAULT_TELEMETRY_PATH
 
-    TelemetrySink(enabled=True, path=Path(telemetry_path)).log(run_id, event_type, data)
+    # One-shot helper: write synchronously rather than spinning up a writer thread.
+    _append(Path(telemetry_path), _encode((time.time(), run_id, event_type, data)))
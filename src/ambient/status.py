@@ -37,7 +37,17 @@ def compute_status(telemetry_path: Path, *, window: StatusWindow | None = None)
     events = _iter_events(telemetry_path)
     recent = [e for e in events if float(e.get("timestamp", 0.0) or 0.0) >= cutoff]
 
-    proposals = [e for e in recent if e.get("type") == "proposal"]
+    # Agents log one "proposals" record per batch; older files have one "proposal" each.
+    proposal_count = 0
+    for e in recent:
+        kind = e.get("type")
+        if kind == "proposal":
+            proposal_count += 1
+        elif kind == "proposals":
+            try:
+                proposal_count += int((e.get("data") or {}).get("count", 0))
+            except Exception:
+                pass
     apply_ok = [e for e in recent if e.get("type") == "apply_succeeded"]
     apply_fail = [e for e in recent if e.get("type") == "apply_failed"]
     verify_ok = [e for e in recent if e.get("type") == "verify_succeeded"]
@@ -81,7 +91,7 @@ def compute_status(telemetry_path: Path, *, window: StatusWindow | None = None)
     return {
         "window_seconds": window.seconds,
         "telemetry_path": str(telemetry_path),
-        "proposals_per_hour": (len(proposals) / (window.seconds / 3600.0)) if window.seconds else 0.0,
+        "proposals_per_hour": (proposal_count / (window.seconds / 3600.0)) if window.seconds else 0.0,
         "apply_success_rate": _rate(len(apply_ok), len(apply_fail)),
         "verify_success_rate": _rate(len(verify_ok), len(verify_fail)),
         "queue_depth_p95": _p(queue_depths, 95.0),
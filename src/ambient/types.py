@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from functools import cached_property
 from typing import Any
 
 
@@ -29,6 +31,18 @@ class Proposal:
                 f"Must be one of {valid_risk_levels}"
             )
 
+    # Rendered forms used in commit messages. Proposals are not mutated once
+    # generated, so these are computed at most once per proposal.
+    @cached_property
+    def files_block(self) -> str:
+        """files_touched as "- path" lines."""
+        return "\n".join(f"- {p}" for p in self.files_touched)
+
+    @cached_property
+    def tags_csv(self) -> str:
+        """tags as a comma-separated string."""
+        return ", ".join(self.tags)
+
 
 @dataclass
 class RepoContext:
@@ -41,6 +55,8 @@ class RepoContext:
     current_diff: str
     hot_paths: list[str] = field(default_factory=list)  # Files mentioned in errors
     conventions: dict[str, Any] = field(default_factory=dict)  # Extracted conventions
+    # Shared user prompt, formatted once by the first agent and reused by the rest
+    prepared_prompt: str | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass
@@ -86,3 +102,70 @@ class ApplyResult:
     stat: str  # Git diff stat
     stderr: str
     debug_bundle: dict[str, Any] = field(default_factory=dict)
+    has_staged_changes: bool | None = None  # None when unknown
+
+
+_ERROR_MESSAGE_LIMIT = 256
+
+
+@dataclass(slots=True, frozen=True)
+class ErrorCapture:
+    """Bounded summary of an exception for failure payloads."""
+
+    class_name: str
+    short_msg: str
+    truncated: bool = False
+
+    @classmethod
+    def from_exception(cls, error: BaseException) -> ErrorCapture:
+        message = str(error)
+        return cls(
+            class_name=sys.intern(type(error).__name__),
+            short_msg=message[:_ERROR_MESSAGE_LIMIT],
+            truncated=len(message) > _ERROR_MESSAGE_LIMIT,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "class_name": self.class_name,
+            "short_msg": self.short_msg,
+            "truncated": self.truncated,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class ApplyOutcome:
+    """Outcome of applying one proposal.
+
+    Used internally by the coordinator; callers receive ``to_dict()`` output.
+    When ``error`` is set, ``details`` defaults to its (bounded) message so the
+    field stays a string, and the structured capture is emitted under ``error``.
+    """
+
+    kind: str  # "applied" or "failed"
+    proposal: Proposal
+    reason: str | None = None  # Failure reason, e.g. "patch_failed"
+    details: Any = None
+    error: ErrorCapture | None = None
+    stat: str | None = None
+    verification: VerificationResult | None = None
+    review_branch: str | None = None
+    review_worktree: str | None = None
+    patch_path: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Dict form of the outcome; optional fields that were never set are omitted."""
+        out: dict[str, Any] = {"proposal": self.proposal}
+        for name in _APPLY_OUTCOME_OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                out[name] = value
+        if self.error is not None:
+            out["error"] = self.error.to_dict()
+            out.setdefault("details", self.error.short_msg)
+        return out
+
+
+_APPLY_OUTCOME_OPTIONAL_FIELDS = tuple(
+    f.name for f in fields(ApplyOutcome) if f.name not in {"kind", "proposal", "error"}
+)
@@ -13,16 +13,22 @@ import asyncio
 import json
 import os
 import shlex
+import subprocess
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
 from typing import Any
 
 from .impact import compute_impact_radius, extract_changed_paths
-from .salvaged.git_ops import git_apply_patch_atomic, git_reset_hard_clean
+from .salvaged.git_ops import git_apply_patch_atomic, git_head_sha, git_reset_hard_clean
 from .salvaged.repo_pack import build_repo_pack
 from .salvaged.safe_paths import safe_resolve
 from .salvaged.sandbox import SandboxRunner
 from .types import AmbientEvent, ApplyResult, Proposal, RepoContext, VerificationResult
 
+# Recently built contexts kept for events that see the same repo state.
+_CONTEXT_CACHE_MAX_ENTRIES = 8
+
 
 class Workspace:
     """
@@ -75,6 +81,7 @@ class Workspace:
         )
         self.verification_timeout_seconds = verification_timeout_seconds
         self._verification_checks: list[tuple[str, list[str], dict[str, str]]] = []
+        self._context_cache: OrderedDict[str, RepoContext] = OrderedDict()
         self._auto_detect_checks()
 
     def _auto_detect_checks(self) -> None:
@@ -141,20 +148,29 @@ class Workspace:
             None, git_apply_patch_atomic, self.repo_path, proposal.diff
         )
 
+        ok = result["ok"]
+        stat = result["stat"]
+        if ok:
+            self._context_cache.clear()
         return ApplyResult(
-            ok=result["ok"],
-            stat=result["stat"],
+            ok=ok,
+            stat=stat,
             stderr=result.get("stderr", ""),
             debug_bundle=result.get("debug_bundle", {}),
+            # A successful apply stages its paths and reports `git diff --cached --stat`.
+            has_staged_changes=bool(stat.strip()) if ok else None,
         )
 
-    async def verify_changes(self) -> VerificationResult:
+    async def verify_changes(self, rollback_on_failure: bool = False) -> VerificationResult:
         """
         Run quality checks in sandbox.
 
         Runs all auto-detected checks (pytest, ruff, mypy, make test, etc.)
         in parallel within the sandbox.
 
+        Args:
+            rollback_on_failure: Roll the worktree back before returning if any check fails
+
         Returns:
             VerificationResult with overall success and individual check results
         """
@@ -216,6 +232,8 @@ class Workspace:
 
         # All checks must pass
         all_ok = all(bool(r.get("ok", False)) for r in processed_results)
+        if not all_ok and rollback_on_failure:
+            await self.rollback()
 
         return VerificationResult(
             ok=all_ok, results=processed_results, duration_s=total_duration
@@ -254,7 +272,8 @@ class Workspace:
         # Get current diff
         current_diff = await self._get_current_diff()
 
-        event_rel_path = event.data.get("rel_path")
+        # Debounced watcher events carry every path changed in the burst.
+        event_rel_path = event.data.get("rel_paths") or event.data.get("rel_path")
         if not event_rel_path and event.data.get("src_path"):
             try:
                 event_rel_path = str(
@@ -265,6 +284,23 @@ class Workspace:
 
         changed_paths = extract_changed_paths(event_rel_path, current_diff)
         loop = asyncio.get_event_loop()
+
+        # Bursts and periodic scans often see the same HEAD, tree, diff and changed
+        # files; reuse the context built for that state instead of re-reading files.
+        cache_key = await loop.run_in_executor(
+            None,
+            self._context_key,
+            event,
+            tree,
+            current_diff,
+            failing_logs,
+            changed_paths,
+        )
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            self._context_cache.move_to_end(cache_key)
+            return cached
+
         impact_paths = await loop.run_in_executor(
             None,
             compute_impact_radius,
@@ -289,7 +325,7 @@ class Workspace:
         # Parse pack_json back to dict (build_repo_pack returns JSON string)
         pack = json.loads(pack_json)
 
-        return RepoContext(
+        context = RepoContext(
             task=pack["task"],
             tree=pack["tree"],
             important_files=pack["important_files"],
@@ -301,14 +337,41 @@ class Workspace:
                 "analysis_scope": "impact_radius",
             },
         )
+        self._context_cache[cache_key] = context
+        while len(self._context_cache) > _CONTEXT_CACHE_MAX_ENTRIES:
+            self._context_cache.popitem(last=False)
+        return context
+
+    def _context_key(
+        self,
+        event: AmbientEvent,
+        tree: dict[str, Any],
+        current_diff: str,
+        failing_logs: str,
+        changed_paths: list[str],
+    ) -> str:
+        """Digest of everything build_context reads; equal keys mean equal contexts."""
+        h = blake2b(digest_size=16)
+        h.update(git_head_sha(self.repo_path).encode())
+        h.update(b"\0" + json.dumps(event.task_spec, sort_keys=True, default=str).encode())
+        h.update(b"\0" + "\n".join(tree.get("files", [])).encode())
+        h.update(b"\0" + current_diff.encode())
+        h.update(b"\0" + failing_logs.encode())
+        # Untracked edits never show up in the diff, so stat the changed files too.
+        for rel in sorted(changed_paths):
+            try:
+                st = (self.repo_path / rel).stat()
+                sig = f"{st.st_mtime_ns}:{st.st_size}"
+            except OSError:
+                sig = "-"
+            h.update(f"\0{rel}:{sig}".encode())
+        return h.hexdigest()
 
     async def _build_tree(self) -> dict[str, Any]:
         """Build file tree structure."""
         loop = asyncio.get_event_loop()
 
         def _build() -> dict[str, Any]:
-            import subprocess
-
             # Use git ls-files for tracked files
             result = subprocess.run(
                 ["git", "ls-files"],
@@ -343,8 +406,6 @@ class Workspace:
         loop = asyncio.get_event_loop()
 
         def _get_diff() -> str:
-            import subprocess
-
             result = subprocess.run(
                 ["git", "diff", "HEAD"],
                 cwd=self.repo_path,
@@ -361,8 +422,6 @@ class Workspace:
         loop = asyncio.get_event_loop()
 
         def _get_diff() -> str:
-            import subprocess
-
             result = subprocess.run(
                 ["git", "diff", "--cached"],
                 cwd=self.repo_path,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,6 +18,7 @@ class ReviewCandidate:
     branch: str
     worktree_path: Path
     patch_path: Path
+    pooled: bool = False  # Worktree is a reusable pool slot, not owned by this candidate
 
 
 class ReviewWorktreeManager:
@@ -26,6 +28,38 @@ class ReviewWorktreeManager:
         self.repo_path = Path(repo_path)
         self.base_dir = Path(base_dir)
         self.branch_prefix = branch_prefix.strip().rstrip("/")
+        self._pool: list[Path] = []
+        self._pool_lock = threading.Lock()
+        # `git worktree add/remove` race on .git/worktrees/ when run concurrently
+        # ("failed to read .git/worktrees/<id>/commondir"), so they are serialized.
+        self._admin_lock = threading.Lock()
+
+    @property
+    def pool_dir(self) -> Path:
+        return self.base_dir / "pool"
+
+    def warm_pool(self, size: int) -> int:
+        """Ensure ``size`` detached worktree slots exist for reuse; returns slots available.
+
+        Slots left behind by a previous process are adopted rather than recreated.
+        """
+        with self._pool_lock:
+            known = set(self._pool)
+        for n in range(size):
+            slot = self.pool_dir / f"slot-{n:02d}"
+            if slot in known:
+                continue
+            if not (slot / ".git").exists():
+                with self._admin_lock:
+                    res = self._git(
+                        ["worktree", "add", "--detach", str(slot), "HEAD"], cwd=self.repo_path
+                    )
+                if res.returncode != 0:
+                    raise RuntimeError(f"failed to create pooled worktree: {res.stderr.strip()}")
+            with self._pool_lock:
+                self._pool.append(slot)
+        with self._pool_lock:
+            return len(self._pool)
 
     def prepare_run_dir(self, run_id: str) -> Path:
         run_dir = self.base_dir / run_id
@@ -41,22 +75,41 @@ class ReviewWorktreeManager:
         patch_path = run_dir / "patches" / f"{index:02d}-{slug}.diff"
         branch = f"{self.branch_prefix}/{run_id}/{index:02d}-{slug}"
 
-        if worktree_path.exists():
-            subprocess.run(
-                ["git", "worktree", "remove", "--force", str(worktree_path)],
+        with self._pool_lock:
+            slot = self._pool.pop() if self._pool else None
+        if slot is not None:
+            try:
+                self._reset_slot(slot, branch)
+            except RuntimeError:
+                with self._pool_lock:
+                    self._pool.append(slot)
+                raise
+            return ReviewCandidate(
+                index=index,
+                title_slug=slug,
+                branch=branch,
+                worktree_path=slot,
+                patch_path=patch_path,
+                pooled=True,
+            )
+
+        with self._admin_lock:
+            if worktree_path.exists():
+                subprocess.run(
+                    ["git", "worktree", "remove", "--force", str(worktree_path)],
+                    cwd=self.repo_path,
+                    check=False,
+                    capture_output=True,
+                    text=True,
+                )
+
+            res = subprocess.run(
+                ["git", "worktree", "add", "-b", branch, str(worktree_path), "HEAD"],
                 cwd=self.repo_path,
                 check=False,
                 capture_output=True,
                 text=True,
             )
-
-        res = subprocess.run(
-            ["git", "worktree", "add", "-b", branch, str(worktree_path), "HEAD"],
-            cwd=self.repo_path,
-            check=False,
-            capture_output=True,
-            text=True,
-        )
         if res.returncode != 0:
             raise RuntimeError(f"failed to create review worktree: {res.stderr.strip()}")
 
@@ -68,17 +121,55 @@ class ReviewWorktreeManager:
             patch_path=patch_path,
         )
 
+    def release_candidate(self, candidate: ReviewCandidate, *, keep_branch: bool) -> None:
+        """Finish with a candidate: recycle a pooled slot, otherwise remove the worktree.
+
+        The review branch is deleted unless ``keep_branch`` is set; non-pooled
+        worktrees are only removed together with their branch.
+        """
+        if not candidate.pooled:
+            if not keep_branch:
+                self.remove_candidate(candidate)
+            return
+        # Detach so the branch is no longer checked out and the slot can take another.
+        self._git(["checkout", "-q", "--detach"], cwd=candidate.worktree_path)
+        if not keep_branch:
+            self._git(["branch", "-D", candidate.branch], cwd=self.repo_path)
+        with self._pool_lock:
+            self._pool.append(candidate.worktree_path)
+
     def remove_candidate(self, candidate: ReviewCandidate) -> None:
+        with self._admin_lock:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(candidate.worktree_path)],
+                cwd=self.repo_path,
+                check=False,
+                capture_output=True,
+                text=True,
+            )
         subprocess.run(
-            ["git", "worktree", "remove", "--force", str(candidate.worktree_path)],
+            ["git", "branch", "-D", candidate.branch],
             cwd=self.repo_path,
             check=False,
             capture_output=True,
             text=True,
         )
-        subprocess.run(
-            ["git", "branch", "-D", candidate.branch],
-            cwd=self.repo_path,
+
+    def _reset_slot(self, slot: Path, branch: str) -> None:
+        """Point a pooled slot at a fresh ``branch`` from the main repo's HEAD."""
+        head = self._git(["rev-parse", "HEAD"], cwd=self.repo_path)
+        if head.returncode != 0:
+            raise RuntimeError(f"failed to resolve HEAD: {head.stderr.strip()}")
+        res = self._git(["checkout", "-q", "-f", "-B", branch, head.stdout.strip()], cwd=slot)
+        if res.returncode != 0:
+            raise RuntimeError(f"failed to reset pooled worktree: {res.stderr.strip()}")
+        self._git(["clean", "-fdq"], cwd=slot)
+
+    @staticmethod
+    def _git(args: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            ["git", *args],
+            cwd=cwd,
             check=False,
             capture_output=True,
             text=True,
@@ -1,14 +1,19 @@
 """Integration tests for full pipeline end-to-end."""
 
+import asyncio
+import json
+import subprocess
 import tempfile
 from pathlib import Path
 
 import pytest
 
+import ambient.coordinator as coordinator_mod
+from ambient.agents import SecurityGuardian
 from ambient.approval import AlwaysApproveHandler, AlwaysRejectHandler
 from ambient.config import AmbientConfig
 from ambient.coordinator import AmbientCoordinator
-from ambient.types import AmbientEvent
+from ambient.types import AmbientEvent, ApplyResult, Proposal, VerificationResult
 
 
 @pytest.fixture
@@ -54,6 +59,74 @@ def mock_config():
     return config
 
 
+def _make_proposal(
+    title: str = "Proposal A", *, agent: str = "TestAgent", path: str = "main.py"
+) -> Proposal:
+    """Build a minimal low-risk proposal touching one file."""
+    return Proposal(
+        agent=agent,
+        title=title,
+        description="desc",
+        diff="unused",
+        risk_level="low",
+        rationale="rationale",
+        files_touched=[path],
+        estimated_loc_change=1,
+    )
+
+
+class FakeWorkspace:
+    """Workspace stand-in whose patches apply and verify without touching git.
+
+    ``staged_diff=None`` makes ``get_staged_diff`` fail the test; proposals whose
+    title is in ``fail_titles`` raise from ``apply_patch``.
+    """
+
+    def __init__(self, staged_diff: str | None = "diff", fail_titles: tuple[str, ...] = ()) -> None:
+        self.staged_diff = staged_diff
+        self.fail_titles = fail_titles
+
+    async def apply_patch(self, proposal: Proposal) -> ApplyResult:
+        if proposal.title in self.fail_titles:
+            raise RuntimeError("boom")
+        return ApplyResult(ok=True, stat="1 file changed", stderr="")
+
+    async def verify_changes(self, rollback_on_failure: bool = False) -> VerificationResult:
+        return VerificationResult(ok=True, results=[], duration_s=0.01)
+
+    async def get_staged_diff(self) -> str:
+        if self.staged_diff is None:
+            raise AssertionError("staged diff should not be requested")
+        return self.staged_diff
+
+
+@pytest.fixture
+def review_coordinator(temp_git_repo):
+    """Factory for an auto-approving coordinator in review-worktree mode.
+
+    Keyword arguments override ``review_worktree`` settings; a workspace, if given,
+    is used for every candidate worktree.
+    """
+
+    def _make(workspace: FakeWorkspace | None = None, **review_options) -> AmbientCoordinator:
+        config = AmbientConfig()
+        config.agents.enabled = []
+        config.telemetry.enabled = False
+        config.review_worktree.enabled = True
+        for name, value in review_options.items():
+            setattr(config.review_worktree, name, value)
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            config,
+            AlwaysApproveHandler(config.risk_policy),
+        )
+        if workspace is not None:
+            coordinator._workspace_for_path = lambda _path: workspace  # type: ignore[method-assign]
+        return coordinator
+
+    return _make
+
+
 class TestCoordinatorInitialization:
     """Tests for coordinator initialization."""
 
@@ -69,6 +142,31 @@ class TestCoordinatorInitialization:
         assert coordinator.config == mock_config
         assert isinstance(coordinator.approval_handler, AlwaysRejectHandler)
 
+    def test_invalid_commit_template_falls_back(self, temp_git_repo, mock_config):
+        """An unusable commit template is detected once and replaced by the default format."""
+        mock_config.git.commit_message_template = "fix: {ticket}"
+        coordinator = AmbientCoordinator(temp_git_repo, mock_config)
+
+        assert coordinator._format_commit_subject(title="T", agent="A") == "ambient: T (A)"
+
+    def test_commit_template_formats_like_str_format(self, temp_git_repo, mock_config):
+        """The pre-parsed template renders the same subject as str.format."""
+        for template in ("{agent}: {title}", "fix {{x}} {title!r}", "[{agent:>6}] {title}"):
+            mock_config.git.commit_message_template = template
+            coordinator = AmbientCoordinator(temp_git_repo, mock_config)
+
+            assert coordinator._format_commit_subject(
+                title="T", agent="A"
+            ) == template.format(title="T", agent="A")
+
+    def test_indexed_commit_template_formats_per_commit(self, temp_git_repo, mock_config):
+        """Templates that index a field are formatted per commit, not rejected up front."""
+        mock_config.git.commit_message_template = "{title[0]}: {title}"
+        coordinator = AmbientCoordinator(temp_git_repo, mock_config)
+
+        assert coordinator._format_commit_subject(title="Fix bug", agent="A") == "F: Fix bug"
+        assert coordinator._format_commit_subject(title="", agent="A") == "ambient:  (A)"
+
     def test_coordinator_init_agents(self, temp_git_repo):
         """Test coordinator initializes agents from config."""
         config = AmbientConfig()
@@ -304,7 +402,7 @@ class TestApprovalIntegration:
             async def apply_patch(self, proposal: Proposal) -> ApplyResult:
                 return ApplyResult(ok=True, stat="1 file changed", stderr="")
 
-            async def verify_changes(self) -> VerificationResult:
+            async def verify_changes(self, rollback_on_failure: bool = False) -> VerificationResult:
                 return VerificationResult(ok=True, results=[], duration_s=0.01)
 
             async def get_staged_diff(self) -> str:
@@ -346,6 +444,401 @@ class TestApprovalIntegration:
             assert Path(patch_path).exists()
 
 
+    @pytest.mark.asyncio
+    async def test_review_without_patch_files_skips_staged_diff(self, review_coordinator):
+        """With emit_patch_files off, no diff is computed and no patch path is reported."""
+        coordinator = review_coordinator(FakeWorkspace(staged_diff=None), emit_patch_files=False)
+
+        result = await coordinator._apply_proposals(
+            [_make_proposal()], "nopatch-run", dry_run=False
+        )
+
+        assert len(result["applied"]) == 1
+        assert result["applied"][0].get("patch_path") is None
+        assert result["applied"][0]["review_branch"]
+
+    @pytest.mark.asyncio
+    async def test_review_worktrees_removed_when_not_kept(self, review_coordinator):
+        """Finished candidates are torn down before the batch returns."""
+        coordinator = review_coordinator(
+            FakeWorkspace(fail_titles=("Proposal B",)), keep_worktrees=False
+        )
+        proposals = [_make_proposal(f"Proposal {name}") for name in ("A", "B")]
+
+        result = await coordinator._apply_proposals(proposals, "teardown-run", dry_run=False)
+
+        assert len(result["applied"]) == 1
+        assert result["failed"][0]["reason"] == "review_processing_failed"
+        for item in result["applied"] + result["failed"]:
+            assert not Path(item["review_worktree"]).exists()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_stops_workers_and_tears_down(self, review_coordinator):
+        """Cancelling the batch cancels running workers and still releases their worktrees."""
+        started = asyncio.Event()
+        finished: list[str] = []
+
+        class HangingWorkspace(FakeWorkspace):
+            async def apply_patch(self, proposal: Proposal) -> ApplyResult:
+                started.set()
+                await asyncio.sleep(30)
+                finished.append(proposal.title)
+                return await super().apply_patch(proposal)
+
+        coordinator = review_coordinator(HangingWorkspace(), keep_worktrees=False)
+        worktrees_dir = coordinator.review_manager.base_dir / "cancel-run" / "worktrees"
+        batch = asyncio.create_task(
+            coordinator._apply_proposals([_make_proposal()], "cancel-run", dry_run=False)
+        )
+        await asyncio.wait_for(started.wait(), 5)
+
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+
+        assert finished == []
+        assert worktrees_dir.is_dir()
+        assert list(worktrees_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_parallel_review_commits_each_candidate(
+        self, temp_git_repo, review_coordinator
+    ):
+        """With commit_on_success, each review branch gets its own commit."""
+        coordinator = review_coordinator(max_parallel=1)
+        coordinator.config.git.commit_on_success = True
+
+        class StagingWorkspace(FakeWorkspace):
+            def __init__(self, path: Path) -> None:
+                super().__init__()
+                self.path = path
+
+            async def apply_patch(self, proposal: Proposal) -> ApplyResult:
+                (self.path / "main.py").write_text(f"# {proposal.title}\n")
+                subprocess.run(["git", "add", "main.py"], cwd=self.path, check=True)
+                return ApplyResult(ok=True, stat="1 file changed", stderr="")
+
+        coordinator._workspace_for_path = StagingWorkspace  # type: ignore[method-assign,assignment]
+        proposals = [_make_proposal(f"Proposal {name}") for name in ("A", "B")]
+
+        result = await coordinator._apply_proposals(proposals, "commit-run", dry_run=False)
+
+        assert len(result["applied"]) == 2
+        for item in result["applied"]:
+            subject = subprocess.run(
+                ["git", "log", "-1", "--format=%s", item["review_branch"]],
+                cwd=temp_git_repo,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            assert subject == f"ambient: {item['proposal'].title} (TestAgent)"
+            body = subprocess.run(
+                ["git", "log", "-1", "--format=%b", item["review_branch"]],
+                cwd=temp_git_repo,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            assert body == "run_id: commit-run\nrisk_level: low\n\n"
+
+    @pytest.mark.asyncio
+    async def test_pool_unused_without_commit_on_success(self, review_coordinator):
+        """Uncommitted review output keeps its own worktree instead of a recycled slot."""
+        coordinator = review_coordinator(FakeWorkspace(), max_parallel=1, pool_size=2)
+        proposals = [_make_proposal(f"Proposal {name}") for name in ("A", "B")]
+
+        result = await coordinator._apply_proposals(proposals, "nopool-run", dry_run=False)
+
+        worktrees = [Path(item["review_worktree"]) for item in result["applied"]]
+        assert len(set(worktrees)) == 2
+        assert all(path.exists() and "pool" not in path.parts for path in worktrees)
+        assert not coordinator.review_manager.pool_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_review_candidate_creation_failure_is_isolated(self, review_coordinator):
+        """A worktree that fails to create only fails its own proposal; order is kept."""
+        coordinator = review_coordinator(FakeWorkspace(), max_parallel=2)
+        create_candidate = coordinator.review_manager.create_candidate
+
+        def flaky_create(run_id: str, index: int, title: str):
+            if title == "Proposal B":
+                raise RuntimeError("worktree add failed")
+            return create_candidate(run_id, index, title)
+
+        coordinator.review_manager.create_candidate = flaky_create  # type: ignore[method-assign]
+        proposals = [_make_proposal(f"Proposal {name}") for name in ("A", "B", "C")]
+
+        result = await coordinator._apply_proposals(proposals, "create-run", dry_run=False)
+
+        assert sorted(item["review_branch"].rsplit("/", 1)[-1] for item in result["applied"]) == [
+            "01-proposal-a",
+            "03-proposal-c",
+        ]
+        assert len(result["failed"]) == 1
+        assert result["failed"][0]["reason"] == "review_worktree_failed"
+        assert result["failed"][0]["details"] == "worktree add failed"
+        assert result["failed"][0]["error"] == {
+            "class_name": "RuntimeError",
+            "short_msg": "worktree add failed",
+            "truncated": False,
+        }
+
+    @pytest.mark.asyncio
+    async def test_backoff_skips_rest_of_batch(self, temp_git_repo, mock_config):
+        """Once a failure engages backoff, remaining proposals are skipped in one step."""
+        mock_config.review_worktree.enabled = False
+        mock_config.git.require_clean_before_apply = False
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysApproveHandler(mock_config.risk_policy),
+        )
+
+        applied_titles: list[str] = []
+
+        class FailingWorkspace:
+            async def apply_patch(self, proposal: Proposal) -> ApplyResult:
+                applied_titles.append(proposal.title)
+                return ApplyResult(ok=False, stat="", stderr="does not apply")
+
+        coordinator.workspace = FailingWorkspace()  # type: ignore[assignment]
+        proposals = [_make_proposal(f"Proposal {name}") for name in ("A", "B", "C")]
+
+        result = await coordinator._apply_proposals(proposals, "backoff-run", dry_run=False)
+
+        assert applied_titles == ["Proposal A"]
+        assert [item["reason"] for item in result["failed"]] == [
+            "patch_failed",
+            "backoff_engaged",
+            "backoff_engaged",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_dirty_worktree_checked_once_per_batch(
+        self, temp_git_repo, mock_config, monkeypatch
+    ):
+        """Without an apply in between, git status runs once for the whole batch."""
+        mock_config.review_worktree.enabled = False
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysApproveHandler(mock_config.risk_policy),
+        )
+
+        calls: list[Path] = []
+
+        def dirty(root: Path) -> bool:
+            calls.append(root)
+            return False
+
+        monkeypatch.setattr(coordinator_mod, "git_is_clean", dirty)
+        proposals = [_make_proposal(f"Proposal {name}") for name in ("A", "B", "C")]
+
+        result = await coordinator._apply_proposals(proposals, "dirty-run", dry_run=False)
+
+        assert len(calls) == 1
+        assert [item["reason"] for item in result["failed"]] == ["dirty_worktree"] * 3
+
+    @pytest.mark.asyncio
+    async def test_kill_switch_counts_only_recent_outcomes(self, temp_git_repo, mock_config):
+        """Failures that aged out of the window no longer disable auto-apply."""
+        mock_config.control_plane.disable_auto_apply_on_failure_rate = True
+        mock_config.control_plane.failure_rate_window = 4
+        mock_config.control_plane.failure_rate_threshold = 0.5
+        mock_config.control_plane.min_failures_before_disable = 2
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysApproveHandler(mock_config.risk_policy),
+        )
+        proposal = _make_proposal()
+
+        for ok in (False, False, False, True):
+            coordinator._apply_outcomes.append(ok)
+        result = await coordinator._apply_proposals([proposal], "ks-run", dry_run=True)
+        assert result["failed"][0]["reason"] == "auto_apply_disabled"
+
+        for _ in range(3):
+            coordinator._apply_outcomes.append(True)
+        assert coordinator._apply_outcomes.failures == 0
+        result = await coordinator._apply_proposals([proposal], "ks-run", dry_run=True)
+        assert result["failed"][0]["reason"] == "dry_run"
+
+    @pytest.mark.asyncio
+    async def test_critical_telemetry_keeps_kill_switch_event(self, temp_git_repo, mock_config):
+        """telemetry.level=critical still records failures and the kill switch."""
+        mock_config.telemetry.enabled = True
+        mock_config.telemetry.level = "critical"
+        mock_config.control_plane.disable_auto_apply_on_failure_rate = True
+        mock_config.control_plane.failure_rate_window = 4
+        mock_config.control_plane.failure_rate_threshold = 0.5
+        mock_config.control_plane.min_failures_before_disable = 2
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysApproveHandler(mock_config.risk_policy),
+        )
+        for _ in range(3):
+            coordinator._apply_outcomes.append(False)
+
+        await coordinator._apply_proposals([_make_proposal()], "crit-run", dry_run=False)
+        coordinator.telemetry.flush()
+
+        log_path = temp_git_repo / mock_config.telemetry.log_path
+        events = [json.loads(line)["type"] for line in log_path.read_text().splitlines()]
+        assert events == ["control_plane_auto_apply_disabled"]
+
+
+class TestProposalGeneration:
+    """Tests for parallel agent proposal generation."""
+
+    @pytest.mark.asyncio
+    async def test_slow_agent_times_out_without_blocking_others(self, temp_git_repo, mock_config):
+        """A hung agent is cut off by the per-agent timeout; other agents still contribute."""
+        mock_config.agents.timeout_seconds = 0.5
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysRejectHandler(mock_config.risk_policy),
+        )
+
+        class SlowAgent:
+            async def propose(self, context):
+                await asyncio.sleep(30)
+                return []
+
+        class FastAgent:
+            async def propose(self, context):
+                return [_make_proposal("Quick fix", agent="FastAgent")]
+
+        coordinator.agents = [SlowAgent(), FastAgent()]  # type: ignore[list-item]
+
+        proposals = await coordinator._generate_proposals(None)
+
+        assert [p.title for p in proposals] == ["Quick fix"]
+
+    def test_default_agent_timeout_covers_kimi_retry_budget(
+        self, temp_git_repo, mock_config, monkeypatch
+    ):
+        """Without agents.timeout_seconds, agents get every retry plus Retry-After waits."""
+        monkeypatch.setenv("AMBIENT_RETRY_MAX", "3")
+        mock_config.kimi.timeout_seconds = 10
+        coordinator = AmbientCoordinator(temp_git_repo, mock_config)
+
+        assert coordinator._agent_timeout() == 3 * (10 + 120)
+
+        mock_config.agents.timeout_seconds = 5
+        assert coordinator._agent_timeout() == 5
+
+    @pytest.mark.asyncio
+    async def test_agent_timeout_applies_to_refine(self, temp_git_repo, mock_config):
+        """A hung refine() is cut off by agents.timeout_seconds and logged as a timeout."""
+        mock_config.agents.timeout_seconds = 0.05
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysRejectHandler(mock_config.risk_policy),
+        )
+        logged: list[tuple[str, dict]] = []
+
+        class RecordingSink:
+            def emit(self, event, data, level=None):
+                logged.append((event, data))
+
+        coordinator.telemetry = RecordingSink()  # type: ignore[assignment]
+
+        class HungRefiner(SecurityGuardian):
+            async def refine(self, proposals, context):
+                await asyncio.sleep(30)
+                return proposals
+
+        coordinator.agents = [HungRefiner(mock_config.kimi)]
+        proposals = [
+            _make_proposal("HungRefiner fix", agent="HungRefiner", path="HungRefiner.py"),
+            _make_proposal("Other fix", agent="Other", path="Other.py"),
+        ]
+
+        refined = await asyncio.wait_for(
+            coordinator._cross_pollinate(proposals, None), 5
+        )
+
+        assert refined
+        timeout = {"agent": "HungRefiner", "phase": "refine", "timeout_seconds": 0.05}
+        assert ("agent_timeout", timeout) in logged
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_agents_and_keeps_order(
+        self, temp_git_repo, mock_config
+    ):
+        """At most max_concurrency agents run at once; results stay in agent order."""
+        mock_config.agents.max_concurrency = 2
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysRejectHandler(mock_config.risk_policy),
+        )
+
+        active = 0
+        peak = 0
+
+        class Agent:
+            def __init__(self, name: str, delay: float) -> None:
+                self.name = name
+                self.delay = delay
+
+            async def propose(self, context):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(self.delay)
+                active -= 1
+                return [_make_proposal(self.name, agent=self.name)]
+
+        coordinator.agents = [  # type: ignore[list-item]
+            Agent("a", 0.05),
+            Agent("b", 0.01),
+            Agent("c", 0.02),
+            Agent("d", 0.0),
+        ]
+
+        proposals = await coordinator._generate_proposals(None)
+
+        assert peak == 2
+        assert [p.title for p in proposals] == ["a", "b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_custom_refine_only_runs_for_multi_agent_proposals(
+        self, temp_git_repo, mock_config
+    ):
+        """Overridden refine() is skipped when every proposal came from one agent."""
+        coordinator = AmbientCoordinator(
+            temp_git_repo,
+            mock_config,
+            AlwaysRejectHandler(mock_config.risk_policy),
+        )
+
+        calls: list[int] = []
+
+        class ReviewingGuardian(SecurityGuardian):
+            async def refine(self, all_proposals, context):
+                calls.append(len(all_proposals))
+                return list(all_proposals)
+
+        coordinator.agents = [ReviewingGuardian(mock_config.kimi)]
+
+        def _fix(agent: str, path: str) -> Proposal:
+            return _make_proposal(f"{agent} fix", agent=agent, path=path)
+
+        single = [_fix("StyleEnforcer", "a.py"), _fix("StyleEnforcer", "b.py")]
+        assert len(await coordinator._cross_pollinate(single, None)) == 2
+        assert calls == []
+
+        mixed = [_fix("StyleEnforcer", "a.py"), _fix("TestEnhancer", "b.py")]
+        await coordinator._cross_pollinate(mixed, None)
+        assert calls == [2]
+
+
 class TestRiskIntegration:
     """Tests for risk assessment integration."""
 
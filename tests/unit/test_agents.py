@@ -1,6 +1,6 @@
 """Unit tests for specialist agents."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -8,6 +8,7 @@ from ambient.agents import (
     PerformanceOptimizer,
     RefactorArchitect,
     SecurityGuardian,
+    SpecialistAgent,
     StyleEnforcer,
     TestEnhancer,
 )
@@ -71,6 +72,34 @@ class TestBaseAgent:
         assert "# Failing Logs / Errors" in prompt
         assert "FAILED test.py::test_func" in prompt
 
+    @pytest.mark.asyncio
+    async def test_prompt_formatted_once_per_context(self, kimi_config, mock_repo_context):
+        """Agents sharing a context reuse the first formatted prompt."""
+        client = AsyncMock()
+        client.chat_completion.return_value = {"choices": [{"message": {"content": "[]"}}]}
+        agents = [SecurityGuardian(kimi_config, client), StyleEnforcer(kimi_config, client)]
+
+        with patch.object(
+            SpecialistAgent, "_format_prompt", autospec=True, return_value="shared prompt"
+        ) as fmt:
+            for agent in agents:
+                await agent.propose(mock_repo_context)
+
+        assert fmt.call_count == 1
+        assert mock_repo_context.prepared_prompt == "shared prompt"
+        for call in client.chat_completion.await_args_list:
+            assert call.kwargs["messages"][1]["content"] == "shared prompt"
+
+    def test_build_messages_and_parse_response(self, kimi_config, mock_repo_context):
+        """The request and response halves of propose() work on their own."""
+        agent = SecurityGuardian(kimi_config)
+
+        messages = agent.build_messages(mock_repo_context)
+
+        assert [m["role"] for m in messages] == ["system", "user"]
+        assert messages[0]["content"] == agent.system_prompt
+        assert agent.parse_response({"choices": [{"message": {"content": "[]"}}]}) == []
+
     def test_parse_proposals_valid_json(self, kimi_config):
         """Test parsing valid JSON proposals."""
         agent = SecurityGuardian(kimi_config)
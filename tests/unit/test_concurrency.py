@@ -0,0 +1,167 @@
+"""Unit tests for adaptive concurrency primitives."""
+
+import asyncio
+
+import pytest
+
+from ambient.concurrency import AdaptiveSemaphore, EventRing, LatencyAIMD
+
+
+class TestAdaptiveSemaphore:
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_holders(self) -> None:
+        sem = AdaptiveSemaphore(2)
+        active = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal active, peak
+            async with sem:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+        assert sem.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_grow_admits_waiter(self) -> None:
+        sem = AdaptiveSemaphore(1, ceiling=2)
+        await sem.acquire()
+        waiter = asyncio.create_task(sem.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        assert sem.grow() == 2
+        await asyncio.wait_for(waiter, 1)
+        assert sem.in_use == 2
+
+    def test_resize_clamps_to_floor_and_ceiling(self) -> None:
+        sem = AdaptiveSemaphore(4, ceiling=4)
+        assert sem.grow() == 4
+        assert sem.shrink() == 2
+        assert sem.shrink() == 1
+        assert sem.shrink() == 1
+
+    def test_set_ceiling_allows_growth_and_clamps_limit(self) -> None:
+        sem = AdaptiveSemaphore(2)
+        assert sem.grow() == 2
+        assert sem.set_ceiling(4) == 2
+        assert sem.resize(4) == 4
+        assert sem.set_ceiling(3) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_permit(self) -> None:
+        sem = AdaptiveSemaphore(1)
+        await sem.acquire()
+        waiter = asyncio.create_task(sem.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        sem.release()
+        assert sem.in_use == 0
+        await asyncio.wait_for(sem.acquire(), 1)
+
+
+class TestLatencyAIMD:
+    def test_shrinks_after_consecutive_slow_samples(self) -> None:
+        sem = AdaptiveSemaphore(4)
+        aimd = LatencyAIMD(sem)
+        for i in range(40):
+            aimd.observe(1.0 + i / 100, True)
+        for _ in range(3):
+            aimd.observe(5.0, True)
+        assert sem.limit == 2
+
+    def test_identical_samples_do_not_shrink(self) -> None:
+        sem = AdaptiveSemaphore(8)
+        aimd = LatencyAIMD(sem)
+        for _ in range(40):
+            aimd.observe(1.0, True)
+        assert sem.limit == 8
+
+    def test_all_zero_window_is_ignored(self) -> None:
+        sem = AdaptiveSemaphore(8)
+        aimd = LatencyAIMD(sem)
+        for _ in range(40):
+            aimd.observe(0.0, True)
+        aimd.observe(0.5, True)
+        assert sem.limit == 8
+
+    def test_grows_back_after_sustained_fast_successes(self) -> None:
+        sem = AdaptiveSemaphore(4)
+        sem.resize(2)
+        aimd = LatencyAIMD(sem)
+        for i in range(10):
+            aimd.observe(1.0 + i / 10, True)
+        for _ in range(10):
+            aimd.observe(0.1, True)
+        assert sem.limit == 3
+
+    def test_failures_do_not_grow(self) -> None:
+        sem = AdaptiveSemaphore(4)
+        sem.resize(2)
+        aimd = LatencyAIMD(sem)
+        for i in range(10):
+            aimd.observe(1.0 + i / 10, True)
+        for _ in range(20):
+            aimd.observe(0.1, False)
+        assert sem.limit == 2
+
+
+class TestEventRing:
+    def test_fifo_and_capacity(self) -> None:
+        ring: EventRing[int] = EventRing(3)
+        for i in range(3):
+            ring.put_nowait(i)
+        assert ring.full()
+        with pytest.raises(asyncio.QueueFull):
+            ring.put_nowait(3)
+
+        assert ring.get_nowait() == 0
+        ring.put_nowait(3)
+        assert [ring.get_nowait() for _ in range(3)] == [1, 2, 3]
+        assert ring.empty()
+        with pytest.raises(asyncio.QueueEmpty):
+            ring.get_nowait()
+
+    @pytest.mark.parametrize("maxsize", [0, -1])
+    def test_non_positive_maxsize_is_unbounded(self, maxsize: int) -> None:
+        ring: EventRing[int] = EventRing(maxsize)
+        for i in range(10):
+            ring.put_nowait(i)
+        for i in range(10):
+            assert ring.get_nowait() == i
+        # Wrap the head around before growing so the live items are unrolled in order.
+        for i in range(3000):
+            ring.put_nowait(i)
+        assert not ring.full()
+        assert [ring.get_nowait() for _ in range(3000)] == list(range(3000))
+        assert ring.empty()
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_put(self) -> None:
+        ring: EventRing[str] = EventRing(4)
+        getter = asyncio.create_task(ring.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        ring.put_nowait("event")
+        assert await asyncio.wait_for(getter, 1) == "event"
+        assert ring.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_get_leaves_ring_usable(self) -> None:
+        ring: EventRing[str] = EventRing(4)
+        getter = asyncio.create_task(ring.get())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await getter
+
+        ring.put_nowait("after")
+        assert await asyncio.wait_for(ring.get(), 1) == "after"
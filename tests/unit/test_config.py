@@ -86,6 +86,13 @@ class TestMonitoringConfig:
         assert "*.log" in config.ignore_patterns
         assert config.debounce_seconds == 10
 
+    def test_monitoring_backend_validation(self):
+        """Only known watcher backends are accepted."""
+        assert MonitoringConfig().backend == "auto"
+        assert MonitoringConfig(backend=" WatchFiles ").backend == "watchfiles"
+        with pytest.raises(ValueError):
+            MonitoringConfig(backend="inotify")
+
 
 class TestAgentsConfig:
     """Tests for AgentsConfig."""
@@ -182,6 +189,13 @@ class TestTelemetryConfig:
         assert config.log_path == ".ambient/telemetry.jsonl"
         assert config.include_diffs is False
         assert config.retention_days == 30
+        assert config.level == "verbose"
+
+    def test_telemetry_level_validation(self):
+        """Test telemetry level is normalized and validated."""
+        assert TelemetryConfig(level=" Standard ").level == "standard"
+        with pytest.raises(ValueError):
+            TelemetryConfig(level="debug")
 
     def test_custom_telemetry_config(self):
         """Test custom telemetry configuration."""
@@ -221,6 +235,7 @@ class TestAmbientConfig:
         config = AmbientConfig()
         assert config.review_worktree.enabled is True
         assert config.review_worktree.max_parallel >= 1
+        assert config.review_worktree.pool_size == 0
 
     def test_load_from_dict(self):
         """Test loading configuration from dictionary."""
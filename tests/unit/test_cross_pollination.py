@@ -1,6 +1,6 @@
 """Unit tests for advanced cross-pollination."""
 
-from ambient.cross_pollination import advanced_cross_pollinate
+from ambient.cross_pollination import _conflict_clusters, advanced_cross_pollinate
 from ambient.types import Proposal
 
 
@@ -47,3 +47,46 @@ def test_cross_pollination_conflict_resolution_picks_one_per_cluster() -> None:
     assert "security" in titles
     assert "tests" in titles
     assert "style" not in titles
+
+
+def test_conflict_clusters_join_transitive_overlaps_in_input_order() -> None:
+    p1 = _proposal("one", ["a.py"])
+    p2 = _proposal("two", ["c.py"])
+    p3 = _proposal("three", ["b.py", "c.py"])
+    p4 = _proposal("four", ["a.py", "b.py"])
+    p5 = _proposal("five", ["d.py"])
+
+    clusters = _conflict_clusters([p1, p2, p3, p4, p5])
+
+    assert [[p.title for p in cluster] for cluster in clusters] == [
+        ["one", "two", "three", "four"],
+        ["five"],
+    ]
+
+
+def test_cross_pollination_dedupes_identical_proposals_across_lists() -> None:
+    p1 = _proposal("fix", ["b.py", "a.py"])
+    p2 = _proposal("fix", ["a.py", "b.py"])
+    p3 = _proposal("fix", ["a.py", "b.py"], agent="Other")
+
+    result = advanced_cross_pollinate([p1], [[p1], [p2, p3]])
+
+    assert result.metadata["round1_count"] == 3
+    assert result.metadata["round2_deduped_count"] == 2
+
+
+def test_conflict_clusters_group_single_file_proposals_by_file() -> None:
+    p1 = _proposal("one", ["a.py"])
+    p2 = _proposal("two", [])
+    p3 = _proposal("three", ["b.py"])
+    p4 = _proposal("four", ["a.py"])
+    p5 = _proposal("five", [])
+
+    clusters = _conflict_clusters([p1, p2, p3, p4, p5])
+
+    assert [[p.title for p in cluster] for cluster in clusters] == [
+        ["one", "four"],
+        ["two"],
+        ["three"],
+        ["five"],
+    ]
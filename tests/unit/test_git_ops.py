@@ -4,8 +4,11 @@ import subprocess
 
 import pytest
 
+from ambient.salvaged import git_ops
 from ambient.salvaged.git_ops import (
     git_apply_patch_atomic,
+    git_commit,
+    git_head_sha,
     git_reset_hard_clean,
 )
 
@@ -103,6 +106,31 @@ class TestGitApplyPatchAtomic:
         content = (git_repo / "test.py").read_text()
         assert "Hello, Universe!" in content
 
+    def test_clean_patch_skips_probe_commands(self, git_repo, monkeypatch):
+        """A patch that applies cleanly needs only apply, add and stat."""
+        calls = []
+        real_run = git_ops._run
+
+        def recording_run(root, args):
+            calls.append(args)
+            return real_run(root, args)
+
+        monkeypatch.setattr(git_ops, "_run", recording_run)
+        patch = """diff --git a/test.py b/test.py
+--- a/test.py
++++ b/test.py
+@@ -1,2 +1,2 @@
+ def hello():
+-    print('Hello, World!')
++    print('Hello, Universe!')
+"""
+        result = git_apply_patch_atomic(git_repo, patch)
+
+        assert result["ok"] is True
+        assert "status" not in result
+        assert [c[:2] for c in calls] == [["git", "apply"], ["git", "add"], ["git", "diff"]]
+        assert "--check" not in calls[0]
+
     def test_apply_patch_with_markdown_fence(self, git_repo):
         """Test applying a patch wrapped in markdown code fence."""
         patch = """```diff
@@ -178,6 +206,26 @@ class TestGitApplyPatchAtomic:
         content = (git_repo / "test.py").read_text()
         assert "Hello, Fixed!" in content
 
+    def test_python_fallback_applies_git_style_patch(self, git_repo, monkeypatch):
+        """The pure-Python fallback skips headers and applies +/- lines."""
+        monkeypatch.setenv("AMBIENT_PATCH_PREFER_FALLBACK", "1")
+        patch = """diff --git a/test.py b/test.py
+index 0000000..1111111 100644
+--- a/test.py
++++ b/test.py
+@@ -1,2 +1,3 @@
+ def hello():
+-    print('Hello, World!')
++    print('Hello, Fallback!')
++    return None
+"""
+        result = git_apply_patch_atomic(git_repo, patch)
+
+        assert result["ok"] is True
+        assert (git_repo / "test.py").read_text() == (
+            "def hello():\n    print('Hello, Fallback!')\n    return None\n"
+        )
+
     @pytest.mark.xfail(reason="File creation via /dev/null not supported in current version")
     def test_create_new_file_patch(self, git_repo):
         """Test creating a new file via patch."""
@@ -298,3 +346,69 @@ class TestGitApplyPatchAtomic:
 
         # This should fail because the file no longer matches
         assert result2["ok"] is False
+
+
+class TestGitCommit:
+    """Test git_commit."""
+
+    def test_commit_uses_author_without_writing_config(self, git_repo):
+        (git_repo / "test.py").write_text("changed\n")
+        subprocess.run(["git", "add", "test.py"], cwd=git_repo, check=True)
+
+        git_commit(git_repo, "Update test", author_name="Bot", author_email="bot@example.com")
+
+        author = subprocess.run(
+            ["git", "log", "-1", "--format=%an <%ae>|%s"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        assert author == "Bot <bot@example.com>|Update test"
+        configured = subprocess.run(
+            ["git", "config", "--local", "user.name"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert configured == "Test User"
+
+
+class TestGitHeadSha:
+    """Test reading HEAD without spawning git."""
+
+    @staticmethod
+    def _rev_parse(repo, ref="HEAD"):
+        return subprocess.run(
+            ["git", "rev-parse", ref], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    def test_matches_rev_parse_for_loose_packed_and_detached_heads(self, git_repo, monkeypatch):
+        """Loose refs, packed refs and a detached HEAD resolve without running git."""
+        expected = self._rev_parse(git_repo)
+        real_run = git_ops._run
+
+        def no_git(root, args):
+            raise AssertionError(f"unexpected git call: {args}")
+
+        monkeypatch.setattr(git_ops, "_run", no_git)
+        assert git_head_sha(git_repo) == expected
+
+        monkeypatch.setattr(git_ops, "_run", real_run)
+        subprocess.run(["git", "pack-refs", "--all"], cwd=git_repo, check=True)
+        subprocess.run(["git", "checkout", "-q", "--detach"], cwd=git_repo, check=True)
+        monkeypatch.setattr(git_ops, "_run", no_git)
+        assert git_head_sha(git_repo) == expected
+
+    def test_packed_ref(self, git_repo):
+        """A branch that only exists in packed-refs is resolved."""
+        expected = self._rev_parse(git_repo)
+        subprocess.run(["git", "pack-refs", "--all", "--prune"], cwd=git_repo, check=True)
+
+        assert git_head_sha(git_repo) == expected
+
+    def test_unborn_branch_is_empty(self, tmp_path):
+        """A repository without commits has no HEAD sha."""
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+
+        assert git_head_sha(tmp_path) == ""
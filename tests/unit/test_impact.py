@@ -18,6 +18,12 @@ def test_extract_changed_paths_uses_event_and_diff() -> None:
     assert "src/a.py" in paths
 
 
+def test_extract_changed_paths_accepts_coalesced_event_paths() -> None:
+    diff = "+++ b/src/a.py\n"
+    paths = extract_changed_paths(["src/b.py", "src/a.py"], diff)
+    assert paths == ["src/b.py", "src/a.py"]
+
+
 def test_compute_impact_radius_includes_neighbors_and_tests(tmp_path: Path) -> None:
     repo = tmp_path
     (repo / "src").mkdir()
@@ -46,3 +52,105 @@ def test_compute_impact_radius_includes_neighbors_and_tests(tmp_path: Path) -> N
     assert "src/helpers.py" in impacted
     assert "src/consumer.py" in impacted
     assert "tests/test_main.py" in impacted
+
+
+def test_compute_impact_radius_reparses_only_changed_files(tmp_path: Path, monkeypatch) -> None:
+    import ambient.impact as impact
+
+    repo = tmp_path
+    (repo / "src").mkdir()
+    (repo / "src" / "main.py").write_text("import os\n")
+    (repo / "src" / "helpers.py").write_text("def util():\n    return 1\n")
+    (repo / "src" / "consumer.py").write_text("import sys\n")
+    tree_files = ["src/main.py", "src/helpers.py", "src/consumer.py"]
+
+    parsed: list[str] = []
+    parse = impact._parse_python_imports
+
+    def _counting_parse(path: Path) -> set[str]:
+        parsed.append(path.name)
+        return parse(path)
+
+    monkeypatch.setattr(impact, "_parse_python_imports", _counting_parse)
+
+    compute_impact_radius(repo, tree_files, changed_paths=["src/main.py"])
+    assert sorted(parsed) == ["consumer.py", "helpers.py", "main.py"]
+
+    parsed.clear()
+    compute_impact_radius(repo, tree_files, changed_paths=["src/main.py"])
+    assert parsed == []
+
+    (repo / "src" / "consumer.py").write_text("from src.main import run\n")
+    impacted = compute_impact_radius(repo, tree_files, changed_paths=["src/main.py"])
+    assert parsed == ["consumer.py"]
+    assert "src/consumer.py" in impacted
+
+
+def test_compute_impact_radius_ignores_imports_in_strings_and_bad_syntax(tmp_path: Path) -> None:
+    repo = tmp_path
+    (repo / "src").mkdir()
+    (repo / "src" / "main.py").write_text("def run():\n    return 1\n")
+    (repo / "src" / "doc.py").write_text('"""\nimport src.main\n"""\nTEXT = "from src.main import run"\n')
+    (repo / "src" / "broken.py").write_text("import src.main\ndef broken(:\n")
+    (repo / "src" / "lazy.py").write_text("def go():\n    from src.main import run\n    return run()\n")
+    tree_files = ["src/main.py", "src/doc.py", "src/broken.py", "src/lazy.py"]
+
+    impacted = compute_impact_radius(repo, tree_files, changed_paths=["src/main.py"])
+
+    assert "src/lazy.py" in impacted
+    assert "src/doc.py" not in impacted
+    assert "src/broken.py" not in impacted
+
+
+def test_compute_impact_radius_skips_import_scan_without_python_changes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import ambient.impact as impact
+
+    (tmp_path / "main.py").write_text("import os\n")
+    (tmp_path / "README.md").write_text("# readme\n")
+
+    def _fail(repo_path: Path, paths: list[str]) -> dict[str, frozenset[str]]:
+        raise AssertionError("import scan should not run")
+
+    monkeypatch.setattr(impact, "_cached_imports", _fail)
+
+    impacted = compute_impact_radius(
+        tmp_path, ["main.py", "README.md"], changed_paths=["README.md", "README.md"]
+    )
+
+    assert impacted == ["README.md"]
+
+
+def test_compute_impact_radius_finds_tests_in_any_location(tmp_path: Path) -> None:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "helpers.py").write_text("def util():\n    return 1\n")
+    tree_files = [
+        "pkg/__init__.py",
+        "pkg/helpers.py",
+        "tests/unit/test_helpers.py",
+        "pkg/helpers_test.py",
+        "tests/unit/test_pkg.py",
+        "tests/unit/test_other.py",
+    ]
+
+    impacted = compute_impact_radius(tmp_path, tree_files, changed_paths=["pkg/helpers.py"])
+    assert impacted == ["pkg/helpers.py", "tests/unit/test_helpers.py", "pkg/helpers_test.py"]
+
+    impacted = compute_impact_radius(tmp_path, tree_files, changed_paths=["pkg/__init__.py"])
+    assert impacted == ["pkg/__init__.py", "tests/unit/test_pkg.py"]
+
+
+def test_compute_impact_radius_resolves_imports_to_longest_tracked_module(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "helpers.py").write_text("def util():\n    return 1\n")
+    (tmp_path / "app.py").write_text("import pkg.helpers.util\nimport os.path\n")
+    tree_files = ["pkg/__init__.py", "pkg/helpers.py", "app.py"]
+
+    impacted = compute_impact_radius(tmp_path, tree_files, changed_paths=["app.py"])
+
+    assert impacted == ["app.py", "pkg/helpers.py"]
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
+import httpx
 import pytest
 
 from ambient.config import KimiConfig
@@ -17,3 +21,312 @@ async def test_disable_network_blocks_requests(monkeypatch):
     with pytest.raises(RuntimeError, match="AMBIENT_DISABLE_NETWORK"):
         await client.chat_completion(messages=[{"role": "user", "content": "hi"}])
 
+
+
+@pytest.mark.asyncio
+async def test_requests_share_pooled_client(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "[]"}}]})
+
+    client = KimiClient(KimiConfig())
+    pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http, client._http_loop = pooled, asyncio.get_running_loop()
+
+    for _ in range(2):
+        await client.chat_completion(messages=[{"role": "user", "content": "hi"}])
+
+    assert seen == ["/v1/chat/completions"] * 2
+    assert client._client() is pooled
+
+    await client.aclose()
+    assert pooled.is_closed
+    assert client._http is None
+
+
+@pytest.mark.asyncio
+async def test_warmup_is_noop_when_network_disabled(monkeypatch):
+    monkeypatch.setenv("AMBIENT_DISABLE_NETWORK", "1")
+
+    client = KimiClient(KimiConfig())
+    await client.warmup()
+
+    assert client._http is None
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_pool(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+
+    async with KimiClient(KimiConfig()) as client:
+        pooled = client._client()
+
+    assert pooled.is_closed
+    assert client._http is None
+
+
+@pytest.mark.asyncio
+async def test_retries_sleep_with_capped_full_jitter(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    monkeypatch.setenv("AMBIENT_RETRY_MAX", "8")
+    bounds: list[tuple[float, float]] = []
+    sleeps: list[float] = []
+    statuses = iter([429, 503] * 3 + [200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        return httpx.Response(status, json={"choices": [{"message": {"content": "[]"}}]})
+
+    def uniform(low: float, high: float) -> float:
+        bounds.append((low, high))
+        return high / 2
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("ambient.kimi_client.random.uniform", uniform)
+    monkeypatch.setattr("ambient.kimi_client.asyncio.sleep", sleep)
+    monkeypatch.setattr("ambient.kimi_client._BACKOFF_CAP_SECONDS", 4.0)
+
+    client = KimiClient(KimiConfig())
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_loop = asyncio.get_running_loop()
+
+    await client.chat_completion(messages=[{"role": "user", "content": "hi"}])
+    await client.aclose()
+
+    assert bounds == [(0, 0.5), (0, 1.0), (0, 2.0), (0, 4.0), (0, 4.0), (0, 4.0)]
+    assert sleeps == [high / 2 for _, high in bounds]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_header_sets_retry_delay(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    sleeps: list[float] = []
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+            httpx.Response(429, headers={"Retry-After": "9999"}),
+            httpx.Response(200, json={"choices": [{"message": {"content": "[]"}}]}),
+        ]
+    )
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("ambient.kimi_client.random.uniform", lambda low, high: high)
+    monkeypatch.setattr("ambient.kimi_client.asyncio.sleep", sleep)
+
+    client = KimiClient(KimiConfig())
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses)))
+    client._http_loop = asyncio.get_running_loop()
+
+    await client.chat_completion(messages=[{"role": "user", "content": "hi"}])
+    await client.aclose()
+
+    assert sleeps == [3.25, 1.0, 120.25]
+
+
+@pytest.mark.asyncio
+async def test_set_max_concurrency_admits_waiting_request(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    client = KimiClient(KimiConfig(max_concurrency=1))
+    release = asyncio.Event()
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await release.wait()
+        active -= 1
+        return httpx.Response(200, json={"choices": [{"message": {"content": "[]"}}]})
+
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_loop = asyncio.get_running_loop()
+    calls = [
+        asyncio.create_task(client.chat_completion(messages=[{"role": "user", "content": "hi"}]))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    assert active == 1
+
+    assert client.set_max_concurrency(2) == 2
+    await asyncio.sleep(0.01)
+    assert active == 2
+
+    release.set()
+    await asyncio.gather(*calls)
+    await client.aclose()
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_sse_chunks_and_skips_noise(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    body = (
+        b'data: {"choices": [{"delta": {"content": "a"}}]}\n\n'
+        b": keep-alive\n\n"
+        b'data: {"choices": [{"delta": {"content": "b"}}]}\n\n'
+        b"data: [DONE]\n\n"
+        b'data: {"choices": [{"delta": {"content": "late"}}]}\n\n'
+    )
+    client = KimiClient(KimiConfig())
+    client._http = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    )
+    client._http_loop = asyncio.get_running_loop()
+
+    chunks = [
+        chunk["choices"][0]["delta"]["content"]
+        async for chunk in client.chat_completion_stream([{"role": "user", "content": "hi"}])
+    ]
+    await client.aclose()
+
+    assert chunks == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_stream_reassembles_lines_split_across_reads(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    pieces = [b'data: {"n"', b": 1}\r\n\r\ndata: {", b'"n": 2}\n', b'data: {"n": 3}']
+
+    class Pieces(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            for piece in pieces:
+                yield piece
+
+    client = KimiClient(KimiConfig())
+    client._http = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=Pieces()))
+    )
+    client._http_loop = asyncio.get_running_loop()
+
+    chunks = [c async for c in client.chat_completion_stream([{"role": "user", "content": "hi"}])]
+    await client.aclose()
+
+    assert chunks == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+
+@pytest.mark.asyncio
+async def test_retries_resend_the_same_serialized_body(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    requests: list[httpx.Request] = []
+    statuses = iter([503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(next(statuses), json={"choices": [{"message": {"content": "[]"}}]})
+
+    async def sleep(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr("ambient.kimi_client.asyncio.sleep", sleep)
+    client = KimiClient(KimiConfig(model_id="m"))
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_loop = asyncio.get_running_loop()
+
+    await client.chat_completion(messages=[{"role": "user", "content": "héllo"}], temperature=0.2)
+    await client.aclose()
+
+    assert len(requests) == 2
+    assert requests[0].content == requests[1].content
+    assert requests[0].headers["content-type"] == "application/json"
+    assert json.loads(requests[0].content) == {
+        "model": "m",
+        "messages": [{"role": "user", "content": "héllo"}],
+        "temperature": 0.2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_gateway_errors_and_dropped_connections_are_retried(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    outcomes = iter(
+        [
+            httpx.Response(500),
+            httpx.Response(502),
+            httpx.RemoteProtocolError("peer closed connection"),
+            httpx.Response(200, json={"choices": [{"message": {"content": "[]"}}]}),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def sleep(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr("ambient.kimi_client.asyncio.sleep", sleep)
+    client = KimiClient(KimiConfig())
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_loop = asyncio.get_running_loop()
+
+    response = await client.chat_completion(messages=[{"role": "user", "content": "hi"}])
+    await client.aclose()
+
+    assert response["choices"][0]["message"]["content"] == "[]"
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_request_in_background(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"choices": [{"message": {"content": "[]"}}]})
+
+    client = KimiClient(KimiConfig())
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_loop = asyncio.get_running_loop()
+
+    task = client.submit([{"role": "user", "content": "hi"}])
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    release.set()
+    response = await task
+    await client.aclose()
+    assert response["choices"][0]["message"]["content"] == "[]"
+
+
+@pytest.mark.asyncio
+async def test_chat_completions_bounds_concurrency_and_keeps_order(monkeypatch):
+    monkeypatch.delenv("AMBIENT_DISABLE_NETWORK", raising=False)
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        content = json.loads(request.content)["messages"][0]["content"]
+        await asyncio.sleep(0.01 if content == "0" else 0)
+        active -= 1
+        if content == "3":
+            return httpx.Response(400, text="bad request")
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    client = KimiClient(KimiConfig(max_concurrency=2))
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._http_loop = asyncio.get_running_loop()
+
+    results = await client.chat_completions(
+        [[{"role": "user", "content": str(i)}] for i in range(5)]
+    )
+    await client.aclose()
+
+    assert peak == 2
+    assert isinstance(results[3], RuntimeError)
+    assert [
+        r["choices"][0]["message"]["content"] for i, r in enumerate(results) if i != 3
+    ] == ["0", "1", "2", "4"]
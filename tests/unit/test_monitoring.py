@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import os
 from pathlib import Path
 
 import pytest
 from watchdog.events import FileModifiedEvent
 
+from ambient import coordinator as coordinator_module
 from ambient.config import AmbientConfig
 from ambient.coordinator import AmbientCoordinator, AmbientEventHandler
+from ambient.salvaged.telemetry import TelemetryLevel, TelemetrySink
+from ambient.types import AmbientEvent
 
 
 @pytest.mark.asyncio
@@ -36,6 +41,36 @@ async def test_event_handler_enqueues_file_change(tmp_path: Path):
     assert ev.data["rel_path"] == "foo.py"
 
 
+@pytest.mark.asyncio
+async def test_event_handler_resolves_paths_through_symlinked_root(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+
+    real = tmp_path / "real"
+    (real / "pkg").mkdir(parents=True)
+    link = tmp_path / "link"
+    link.symlink_to(real)
+    (real / "pkg" / "mod.py").write_text("x\n")
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=link,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=0,
+    )
+
+    handler.on_any_event(FileModifiedEvent(str(link / "pkg" / "mod.py")))
+    handler.on_any_event(FileModifiedEvent(str(tmp_path / "outside.py")))
+
+    ev = await asyncio.wait_for(queue.get(), timeout=1.0)
+    assert ev.data["rel_path"] == str(Path("pkg") / "mod.py")
+    assert ev.data["src_path"] == str(real / "pkg" / "mod.py")
+    await asyncio.sleep(0.05)
+    assert queue.empty()
+
+
 @pytest.mark.asyncio
 async def test_event_handler_ignores_forbidden_components(tmp_path: Path):
     queue: asyncio.Queue = asyncio.Queue(maxsize=10)
@@ -61,12 +96,138 @@ async def test_event_handler_ignores_forbidden_components(tmp_path: Path):
 
 
 @pytest.mark.asyncio
-async def test_event_handler_debounces_by_path(tmp_path: Path):
+async def test_event_handler_ignores_nested_components_but_not_lookalikes(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=0,
+    )
+
+    rels = [
+        "src/__pycache__/mod.pyc",
+        "pkg/.ambient/state.json",
+        ".pytest_cache/v/cache",
+        "src/.gitignore",
+        "src/my__pycache__x.py",
+        "src/main.py",
+    ]
+    handler.process_changes(("modified", str(tmp_path / rel)) for rel in rels)
+
+    kept = [queue.get_nowait().data["rel_path"] for _ in range(queue.qsize())]
+    assert kept == ["src/.gitignore", "src/my__pycache__x.py", "src/main.py"]
+
+
+@pytest.mark.asyncio
+async def test_event_handler_ignore_patterns_match_path_or_basename(tmp_path: Path):
     queue: asyncio.Queue = asyncio.Queue(maxsize=10)
     loop = asyncio.get_running_loop()
+    sink = TelemetrySink(enabled=True, path=tmp_path / "telemetry.jsonl")
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=["build/*", "*.log"],
+        telemetry_sink=sink,
+        debounce_seconds=0,
+    )
+
+    (tmp_path / "build").mkdir()
+    (tmp_path / "pkg").mkdir()
+    for rel in ("build/out.py", "pkg/debug.log", "pkg/keep.py"):
+        (tmp_path / rel).write_text("x\n")
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / rel)))
 
-    p = tmp_path / "bar.py"
-    p.write_text("x\n")
+    ev = await asyncio.wait_for(queue.get(), timeout=1.0)
+    assert ev.data["rel_path"] == "pkg/keep.py"
+    await asyncio.sleep(0.05)
+    assert queue.empty()
+
+    handler.flush_drop_summary()
+    sink.flush()
+    dropped = [
+        json.loads(line)["data"]
+        for line in (tmp_path / "telemetry.jsonl").read_text().splitlines()
+        if json.loads(line)["type"] == "event_dropped_summary"
+    ]
+    assert len(dropped) == 1
+    assert dropped[0]["counts"] == {"ignore_pattern": 2}
+    assert dropped[0]["sample_paths"] == {"ignore_pattern": "build/out.py"}
+
+
+@pytest.mark.asyncio
+async def test_event_handler_summarizes_drops_per_window(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+    sink = TelemetrySink(enabled=True, path=tmp_path / "telemetry.jsonl")
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=["*.log"],
+        telemetry_sink=sink,
+        debounce_seconds=0,
+        batch_window_seconds=0,
+        drop_summary_seconds=0.05,
+    )
+
+    for i in range(50):
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / f"noise-{i}.log")))
+    await asyncio.sleep(0.2)
+
+    sink.flush()
+    records = [
+        json.loads(line)
+        for line in (tmp_path / "telemetry.jsonl").read_text().splitlines()
+    ]
+    assert [r["type"] for r in records] == ["event_dropped_summary"]
+    assert records[0]["data"]["counts"] == {"ignore_pattern": 50}
+
+
+@pytest.mark.asyncio
+async def test_event_handler_counts_always_ignored_drops_at_standard_level(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+    sink = TelemetrySink(
+        enabled=True, path=tmp_path / "telemetry.jsonl", min_level=TelemetryLevel.STANDARD
+    )
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=sink,
+        debounce_seconds=0,
+        batch_window_seconds=0,
+    )
+
+    for rel in (".git/index", "pkg/__pycache__/mod.pyc"):
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / rel)))
+    await asyncio.sleep(0.05)
+
+    handler.flush_drop_summary()
+    sink.flush()
+    records = [
+        json.loads(line)
+        for line in (tmp_path / "telemetry.jsonl").read_text().splitlines()
+    ]
+    assert [r["type"] for r in records] == ["event_dropped_summary"]
+    assert records[0]["data"]["counts"] == {"always_ignore": 2}
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_event_handler_coalesces_burst_after_quiet_period(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
 
     handler = AmbientEventHandler(
         queue,
@@ -74,17 +235,189 @@ async def test_event_handler_debounces_by_path(tmp_path: Path):
         repo_root=tmp_path,
         ignore_patterns=[],
         telemetry_sink=None,
-        debounce_seconds=5,
+        debounce_seconds=0.1,
+        batch_window_seconds=0,
     )
 
-    handler.on_any_event(FileModifiedEvent(str(p)))
-    handler.on_any_event(FileModifiedEvent(str(p)))
+    handler.on_any_event(FileModifiedEvent(str(tmp_path / "bar.py")))
+    await asyncio.sleep(0.06)
+    handler.on_any_event(FileModifiedEvent(str(tmp_path / "baz.py")))
+    handler.on_any_event(FileModifiedEvent(str(tmp_path / "bar.py")))
+    await asyncio.sleep(0.06)
+    # The later saves restarted the quiet period, so nothing is emitted yet.
+    assert queue.empty()
 
     ev = await asyncio.wait_for(queue.get(), timeout=1.0)
+    assert ev.data["rel_paths"] == ["baz.py", "bar.py"]
     assert ev.data["rel_path"] == "bar.py"
+    await asyncio.sleep(0.15)
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_event_handler_skips_saves_with_unchanged_content(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=0,
+    )
+    p = tmp_path / "same.py"
 
+    def _save(text: str) -> None:
+        p.write_text(text)
+        handler.process_changes([("modified", str(p))])
+
+    _save("x = 1\n")
+    _save("x = 1\n")
+    _save("x = 2\n")
+    p.unlink()
+    handler.process_changes([("deleted", str(p))])
+
+    events = [queue.get_nowait().data["event_type"] for _ in range(queue.qsize())]
+    assert events == ["modified", "modified", "deleted"]
+
+
+@pytest.mark.asyncio
+async def test_event_dropped_on_full_queue_is_not_remembered(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    loop = asyncio.get_running_loop()
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=0,
+    )
+    (tmp_path / "other.py").write_text("y = 1\n")
+    handler.process_changes([("modified", str(tmp_path / "other.py"))])
+    p = tmp_path / "same.py"
+    p.write_text("x = 1\n")
+    handler.process_changes([("modified", str(p))])  # dropped: queue full
+
+    queue.get_nowait()
+    handler.process_changes([("modified", str(p))])
+
+    assert queue.get_nowait().data["rel_path"] == "same.py"
+
+
+@pytest.mark.asyncio
+async def test_event_handler_skips_reading_files_with_settled_stat(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=0,
+    )
+    p = tmp_path / "old.py"
+    p.write_text("x = 1\n")
+    os.utime(p, (1_000_000_000, 1_000_000_000))
+    handler.process_changes([("modified", str(p))])
+    assert queue.qsize() == 1
+
+    def _no_read(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("file should not be re-read")
+
+    monkeypatch.setattr(coordinator_module, "open", _no_read, raising=False)
+    handler.process_changes([("modified", str(p))])
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_event_handler_batches_events_into_one_loop_callback(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=0,
+        batch_window_seconds=10,
+    )
+    handed_over: list[int] = []
+    process_batch = handler._process_batch
+
+    def _spy(batch: list[tuple[str, str]]) -> None:
+        handed_over.append(len(batch))
+        process_batch(batch)
+
+    handler._process_batch = _spy  # type: ignore[method-assign]
+
+    for name in ("a.py", "b.py", "c.py"):
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / name)))
+    await asyncio.sleep(0.05)
+    assert queue.empty()
+
+    handler.flush()
+    await asyncio.sleep(0)
+    assert handed_over == [3]
+    assert [queue.get_nowait().data["rel_path"] for _ in range(3)] == ["a.py", "b.py", "c.py"]
+
+
+@pytest.mark.asyncio
+async def test_event_handler_pending_changes_are_bounded(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=5,
+        debounce_max_entries=2,
+        batch_window_seconds=0,
+    )
+
+    for name in ("a.py", "b.py", "c.py"):
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / name)))
     await asyncio.sleep(0.05)
+
+    # Hitting the bound flushes early instead of growing without limit.
+    assert queue.get_nowait().data["rel_paths"] == ["a.py", "b.py"]
     assert queue.empty()
+    assert list(handler._pending) == ["c.py"]
+
+
+@pytest.mark.asyncio
+async def test_event_handler_flushes_steady_stream_after_max_delay(tmp_path: Path):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    loop = asyncio.get_running_loop()
+
+    handler = AmbientEventHandler(
+        queue,
+        loop=loop,
+        repo_root=tmp_path,
+        ignore_patterns=[],
+        telemetry_sink=None,
+        debounce_seconds=0.05,
+        batch_window_seconds=0,
+    )
+
+    # Changes every 30ms never leave a 50ms quiet gap; the cap (3 windows) flushes anyway.
+    for _ in range(10):
+        handler.on_any_event(FileModifiedEvent(str(tmp_path / "hot.py")))
+        await asyncio.sleep(0.03)
+
+    assert not queue.empty()
 
 
 @pytest.mark.asyncio
@@ -109,3 +442,38 @@ async def test_periodic_scan_loop_enqueues(tmp_path: Path):
         task.cancel()
         with pytest.raises(asyncio.CancelledError):
             await task
+
+
+@pytest.mark.asyncio
+async def test_start_wakes_on_events_and_stops_without_polling(tmp_path: Path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    config = AmbientConfig()
+    config.monitoring.enabled = False
+    config.telemetry.enabled = False
+    config.agents.enabled = []
+
+    coord = AmbientCoordinator(repo, config)
+    loop = asyncio.get_running_loop()
+
+    def _no_signals(*_args, **_kwargs):
+        raise NotImplementedError
+
+    monkeypatch.setattr(loop, "add_signal_handler", _no_signals)
+
+    handled: list[str] = []
+
+    async def _handle(event: AmbientEvent) -> None:
+        handled.append(event.type)
+        await coord.stop()
+
+    coord._handle_event = _handle  # type: ignore[method-assign]
+
+    task = asyncio.create_task(coord.start())
+    await asyncio.sleep(0)
+    coord.event_queue.put_nowait(AmbientEvent(type="manual", data={}, task_spec={}))
+
+    # Both the event and the shutdown are observed well inside the old 1s poll.
+    await asyncio.wait_for(task, timeout=0.5)
+    assert handled == ["manual"]
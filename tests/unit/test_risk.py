@@ -7,10 +7,13 @@ from ambient.config import RiskPolicyConfig
 from ambient.risk import (
     _check_sensitive_files,
     assess_risk,
+    assess_risk_cached,
+    batch_assess_risk,
     filter_by_policy,
     generate_risk_report,
     requires_approval,
     sort_by_risk_priority,
+    trivially_auto_approves,
 )
 from ambient.types import Proposal
 
@@ -165,6 +168,106 @@ class TestAssessRisk:
         assert len(assessment["risk_factors"]) >= 4
 
 
+class TestAssessRiskCached:
+    """Tests for the memoized assess_risk variant."""
+
+    def _proposal(self, **overrides):
+        fields = {
+            "agent": "StyleEnforcer",
+            "title": "Tidy",
+            "description": "desc",
+            "diff": "+ x",
+            "risk_level": "medium",
+            "rationale": "why",
+            "files_touched": ["src/auth/login.py"],
+            "estimated_loc_change": 12,
+            "tags": ["style"],
+        }
+        fields.update(overrides)
+        return Proposal(**fields)
+
+    def test_matches_uncached_assessment(self):
+        """Cached results are identical to a fresh assessment."""
+        policy = RiskPolicyConfig()
+        proposal = self._proposal()
+
+        assert assess_risk_cached(proposal, policy) == assess_risk(proposal, policy)
+        assert assess_risk_cached(proposal, policy) == assess_risk(proposal, policy)
+
+    def test_returns_independent_copies(self):
+        """Mutating a returned assessment does not poison the cache."""
+        policy = RiskPolicyConfig()
+        proposal = self._proposal()
+
+        first = assess_risk_cached(proposal, policy)
+        first["risk_factors"].append("tampered")
+        first["run_id"] = "abc"
+
+        second = assess_risk_cached(proposal, policy)
+        assert "tampered" not in second["risk_factors"]
+        assert "run_id" not in second
+
+    def test_policy_changes_invalidate(self):
+        """Changing the policy in place yields a new assessment."""
+        policy = RiskPolicyConfig()
+        proposal = self._proposal(files_touched=["a.py", "b.py", "c.py"])
+
+        assert not assess_risk_cached(proposal, policy)["requires_approval"]
+
+        policy.file_change_limit = 2
+        assert assess_risk_cached(proposal, policy)["requires_approval"]
+
+
+    def test_batch_matches_individual_assessments(self):
+        """batch_assess_risk() agrees with assess_risk() for every proposal, in order."""
+        policy = RiskPolicyConfig()
+        proposals = [
+            self._proposal(),
+            self._proposal(files_touched=["utils.py", "src/auth/login.py"]),
+            self._proposal(files_touched=["utils.py"], tags=["Payment"]),
+            self._proposal(files_touched=[]),
+        ]
+
+        assert batch_assess_risk(proposals, policy) == [
+            assess_risk(p, policy) for p in proposals
+        ]
+
+class TestTriviallyAutoApproves:
+    """Tests for the approval fast path."""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"risk_level": "high"},
+            {"files_touched": [f"f{i}.py" for i in range(11)]},
+            {"estimated_loc_change": -501},
+            {"files_touched": ["app/.env.local"]},
+            {"tags": ["Security"]},
+            {"risk_level": "critical", "tags": ["auth"]},
+        ],
+    )
+    def test_agrees_with_full_assessment(self, overrides):
+        """The fast path never disagrees with assess_risk()."""
+        fields = {
+            "agent": "StyleEnforcer",
+            "title": "Tidy",
+            "description": "desc",
+            "diff": "+ x",
+            "risk_level": "low",
+            "rationale": "why",
+            "files_touched": ["utils.py"],
+            "estimated_loc_change": 3,
+            "tags": ["style"],
+        }
+        fields.update(overrides)
+        proposal = Proposal(**fields)
+        policy = RiskPolicyConfig()
+
+        expected = not assess_risk(proposal, policy)["requires_approval"]
+        assert trivially_auto_approves(proposal, policy) is expected
+
+
 class TestRequiresApproval:
     """Tests for requires_approval function."""
 
@@ -278,6 +381,21 @@ class TestSortByRiskPriority:
         assert sorted_proposals[2].risk_level == "medium"
         assert sorted_proposals[3].risk_level == "low"
 
+    def test_top_k_matches_prefix_of_full_sort(self):
+        """top_k returns the same proposals as slicing the full sort, ties in input order."""
+        proposals = [
+            Proposal(
+                agent="A", title=str(i), description="", diff="",
+                risk_level=level, rationale="", files_touched=[], estimated_loc_change=1
+            )
+            for i, level in enumerate(["low", "high", "critical", "high", "medium", "critical"])
+        ]
+
+        for k in range(len(proposals) + 2):
+            assert sort_by_risk_priority(proposals, top_k=k) == (
+                sort_by_risk_priority(proposals)[:k]
+            )
+
     def test_sort_empty_list(self):
         """Test sorting empty proposal list."""
         result = sort_by_risk_priority([])
@@ -113,3 +113,31 @@ class TestSafeResolve:
         """Test forbidden components in subdirectories are caught."""
         with pytest.raises(ValueError, match="Forbidden path component"):
             safe_resolve(tmp_path, "src/.env/config")
+
+    def test_forbidden_name_above_root_is_rejected(self, tmp_path):
+        """The forbidden check covers the full resolved path, not just the tail."""
+        root = tmp_path / ".env" / "repo"
+        root.mkdir(parents=True)
+        with pytest.raises(ValueError, match="Forbidden path component"):
+            safe_resolve(root, "src/main.py")
+
+    def test_retargeted_root_symlink_is_re_resolved(self, tmp_path):
+        """Pointing a symlinked root somewhere else invalidates the cached resolution."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        link = tmp_path / "repo"
+        link.symlink_to(first)
+        assert safe_resolve(link, "a.py") == first / "a.py"
+
+        link.unlink()
+        link.symlink_to(second)
+        assert safe_resolve(link, "a.py") == second / "a.py"
+
+    def test_sibling_with_root_prefix_is_escape(self, tmp_path):
+        """A sibling directory sharing the root's name prefix is outside the root."""
+        root = tmp_path / "repo"
+        root.mkdir()
+        with pytest.raises(ValueError, match="Path escapes repo root"):
+            safe_resolve(root, "../repo-other/file.py")
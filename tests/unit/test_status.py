@@ -37,3 +37,18 @@ def test_compute_status_basic(tmp_path: Path) -> None:
     assert st["queue_depth_max"] == 3
     assert st["last_cycle"]["run_id"] == "a"
 
+
+
+def test_compute_status_counts_batched_proposals(tmp_path: Path) -> None:
+    telemetry = tmp_path / "telemetry.jsonl"
+    now = time.time()
+    _write_events(
+        telemetry,
+        [
+            {"timestamp": now - 9, "run_id": "a", "type": "proposal", "data": {}},
+            {"timestamp": now - 8, "run_id": "b", "type": "proposals", "data": {"count": 3}},
+        ],
+    )
+
+    st = compute_status(telemetry, window=StatusWindow(seconds=3600))
+    assert st["proposals_per_hour"] == 4.0
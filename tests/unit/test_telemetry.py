@@ -0,0 +1,182 @@
+"""Unit tests for JSONL telemetry sinks."""
+
+import asyncio
+import json
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from ambient.approval import AlwaysRejectHandler
+from ambient.config import AmbientConfig
+from ambient.coordinator import AmbientCoordinator
+from ambient.salvaged.telemetry import (
+    TelemetryLevel,
+    TelemetrySink,
+    bind_run_id,
+    log_event,
+    prune_telemetry_file,
+)
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_sink_writes_records_in_order_after_flush(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "telemetry.jsonl"
+    sink = TelemetrySink(enabled=True, path=path)
+
+    for i in range(200):
+        sink.log("run1", "tick", {"i": i})
+    sink.flush()
+
+    events = _read(path)
+    assert [e["data"]["i"] for e in events] == list(range(200))
+    assert all(e["run_id"] == "run1" and e["type"] == "tick" for e in events)
+
+
+def test_unserializable_record_does_not_stop_writer(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(enabled=True, path=path)
+
+    payload: dict = {"n": 1}
+    sink.log("r", "bad", {(1, 2): 3})
+    sink.log("r", "snapshot", payload)
+    payload["n"] = 2
+    sink.log("r", "good", {"ok": True})
+    started = time.monotonic()
+    sink.flush()
+
+    assert time.monotonic() - started < 1.0
+    events = _read(path)
+    assert [e["type"] for e in events] == ["bad", "snapshot", "good"]
+    assert "(1, 2)" in events[0]["data"]["unserializable"]
+    assert events[1]["data"] == {"n": 1}
+
+
+def test_sink_accepts_records_from_multiple_threads(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(enabled=True, path=path)
+
+    def _produce(n: int) -> None:
+        for i in range(50):
+            sink.log(f"t{n}", "tick", {"i": i})
+
+    threads = [threading.Thread(target=_produce, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    sink.flush()
+
+    assert len(_read(path)) == 200
+
+
+def test_sinks_sharing_a_path_share_one_writer(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    first = TelemetrySink(enabled=True, path=path)
+    second = TelemetrySink(enabled=True, path=path)
+
+    first.log("run1", "a", {})
+    second.log("run1", "b", {})
+    second.flush()
+
+    assert [e["type"] for e in _read(path)] == ["a", "b"]
+
+
+def test_sink_recreates_file_after_prune(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(enabled=True, path=path)
+    sink.log("run1", "before", {})
+    sink.flush()
+
+    old = path.stat().st_mtime - 2 * 86400
+    os.utime(path, (old, old))
+    prune_telemetry_file(path, retention_days=1)
+    assert not path.exists()
+
+    sink.log("run1", "after", {})
+    sink.flush()
+
+    assert [e["type"] for e in _read(path)] == ["after"]
+
+
+def test_disabled_sink_writes_nothing(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(enabled=False, path=path)
+
+    sink.log("run1", "tick", {})
+    sink.flush()
+
+    assert not path.exists()
+
+
+def test_log_event_is_synchronous(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+
+    log_event("run1", "cycle_started", {"n": 1}, telemetry_path=path)
+
+    assert _read(path)[0]["type"] == "cycle_started"
+
+
+async def test_run_once_flushes_cycle_events(tmp_path: Path) -> None:
+    subprocess.run(["git", "init"], cwd=tmp_path, check=True, capture_output=True)
+    config = AmbientConfig()
+    config.agents.enabled = []
+    coordinator = AmbientCoordinator(tmp_path, config, AlwaysRejectHandler(config.risk_policy))
+
+    result = await coordinator.run_once()
+
+    types = [e["type"] for e in _read(coordinator.telemetry.path) if e["run_id"] == result["run_id"]]
+    assert types == ["cycle_started", "cycle_completed"]
+
+
+def test_sink_skips_events_below_min_level_without_building_payload(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(enabled=True, path=path, min_level=TelemetryLevel.STANDARD)
+    calls: list[str] = []
+
+    def _payload() -> dict:
+        calls.append("built")
+        return {"big": True}
+
+    sink.log("run1", "noise", _payload, level=TelemetryLevel.VERBOSE)
+    sink.log("run1", "signal", _payload)
+    sink.flush()
+
+    assert calls == ["built"]
+    assert [e["type"] for e in _read(path)] == ["signal"]
+    assert not sink.enabled_for(TelemetryLevel.VERBOSE)
+    assert sink.enabled_for(TelemetryLevel.CRITICAL)
+
+
+async def test_emit_uses_bound_run_id_across_tasks(tmp_path: Path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    sink = TelemetrySink(enabled=True, path=path)
+
+    async def _child() -> None:
+        sink.emit("child", {})
+
+    sink.emit("unbound", {})
+    with bind_run_id("run42"):
+        sink.emit("parent", {})
+        await asyncio.create_task(_child())
+    sink.flush()
+
+    assert [(e["type"], e["run_id"]) for e in _read(path)] == [
+        ("unbound", ""),
+        ("parent", "run42"),
+        ("child", "run42"),
+    ]
+
+
+def test_run_ids_are_ordered_short_hex() -> None:
+    from ambient.coordinator import _next_run_id
+
+    ids = [_next_run_id() for _ in range(3)]
+
+    assert all(len(i) == 12 and int(i, 16) >= 0 for i in ids)
+    assert ids == sorted(ids) and len(set(ids)) == 3
+    assert len({i[8:] for i in ids}) == 1
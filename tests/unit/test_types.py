@@ -2,7 +2,15 @@
 
 import pytest
 
-from ambient.types import AmbientEvent, ApplyResult, Proposal, RepoContext, VerificationResult
+from ambient.types import (
+    AmbientEvent,
+    ApplyOutcome,
+    ApplyResult,
+    ErrorCapture,
+    Proposal,
+    RepoContext,
+    VerificationResult,
+)
 
 
 class TestProposal:
@@ -70,6 +78,24 @@ class TestProposal:
         assert proposal.risk_level == risk_level
 
 
+    def test_rendered_commit_fields(self):
+        """files_block and tags_csv render the commit-message forms."""
+        proposal = Proposal(
+            agent="TestAgent",
+            title="Fix bug",
+            description="desc",
+            diff="",
+            risk_level="low",
+            rationale="why",
+            files_touched=["a.py", "b/c.py"],
+            estimated_loc_change=1,
+            tags=["style", "docs"],
+        )
+
+        assert proposal.files_block == "- a.py\n- b/c.py"
+        assert proposal.tags_csv == "style, docs"
+
+
 class TestRepoContext:
     """Tests for RepoContext dataclass."""
 
@@ -244,3 +270,82 @@ class TestApplyResult:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestApplyOutcome:
+    """Tests for ApplyOutcome dataclass."""
+
+    def _proposal(self):
+        return Proposal(
+            agent="TestAgent",
+            title="Fix bug",
+            description="desc",
+            diff="",
+            risk_level="low",
+            rationale="why",
+            files_touched=["file.py"],
+            estimated_loc_change=1,
+        )
+
+    def test_failed_to_dict_omits_unset_fields(self):
+        """Failure dicts keep the legacy proposal/reason/details shape."""
+        proposal = self._proposal()
+        outcome = ApplyOutcome(kind="failed", proposal=proposal, reason="patch_failed", details="")
+
+        assert outcome.to_dict() == {"proposal": proposal, "reason": "patch_failed", "details": ""}
+
+    def test_error_keeps_details_a_string(self):
+        """A captured exception fills details with its message and adds an error record."""
+        proposal = self._proposal()
+        outcome = ApplyOutcome(
+            kind="failed",
+            proposal=proposal,
+            reason="git_commit_failed",
+            error=ErrorCapture.from_exception(RuntimeError("boom")),
+        )
+
+        assert outcome.to_dict() == {
+            "proposal": proposal,
+            "reason": "git_commit_failed",
+            "details": "boom",
+            "error": {"class_name": "RuntimeError", "short_msg": "boom", "truncated": False},
+        }
+
+    def test_applied_to_dict_includes_review_fields(self):
+        """Applied dicts carry stat, verification and review outputs when set."""
+        proposal = self._proposal()
+        verification = VerificationResult(ok=True, results=[])
+        outcome = ApplyOutcome(
+            kind="applied",
+            proposal=proposal,
+            stat="1 file changed",
+            verification=verification,
+            review_branch="ambient/review/x",
+        )
+
+        assert outcome.to_dict() == {
+            "proposal": proposal,
+            "stat": "1 file changed",
+            "verification": verification,
+            "review_branch": "ambient/review/x",
+        }
+        assert not hasattr(outcome, "__dict__")
+
+
+class TestErrorCapture:
+    """Tests for ErrorCapture."""
+
+    def test_short_message_kept_verbatim(self):
+        capture = ErrorCapture.from_exception(ValueError("bad input"))
+
+        assert capture.to_dict() == {
+            "class_name": "ValueError",
+            "short_msg": "bad input",
+            "truncated": False,
+        }
+
+    def test_long_message_is_bounded(self):
+        capture = ErrorCapture.from_exception(RuntimeError("x" * 5000))
+
+        assert len(capture.short_msg) == 256
+        assert capture.truncated is True
@@ -74,6 +74,7 @@ class TestWorkspaceApplyPatch:
 
         assert result.ok is True
         assert "1 file changed" in result.stat
+        assert result.has_staged_changes is True
 
         # Verify the change
         content = (git_repo / "test.py").read_text()
@@ -104,6 +105,7 @@ class TestWorkspaceApplyPatch:
 
         assert result.ok is False
         assert len(result.stderr) > 0
+        assert result.has_staged_changes is None
 
 
 @pytest.mark.asyncio
@@ -163,6 +165,21 @@ class TestWorkspaceVerification:
         assert result.results[0]["name"] == "pytest"
         assert result.results[0]["ok"] is True
 
+    async def test_failed_verification_can_roll_back(self, git_repo, monkeypatch):
+        """rollback_on_failure restores the worktree when a check fails."""
+        monkeypatch.setenv("AMBIENT_SANDBOX_STUB", "1")
+        (git_repo / "test.py").write_text("broken\n")
+
+        workspace = Workspace(git_repo, sandbox_image="unused")
+        workspace._verification_checks = [
+            ("fail", ["python", "-c", "raise SystemExit(1)"], {}),
+        ]
+
+        result = await workspace.verify_changes(rollback_on_failure=True)
+
+        assert result.ok is False
+        assert "Hello" in (git_repo / "test.py").read_text()
+
 
 @pytest.mark.asyncio
 class TestWorkspaceBuildContext:
@@ -204,6 +221,37 @@ class TestWorkspaceBuildContext:
         assert context.task == event.task_spec
 
 
+    async def test_build_context_reuses_context_for_unchanged_state(self, git_repo):
+        """Same repo state reuses the built context; an edit or applied patch rebuilds it."""
+        workspace = Workspace(git_repo, sandbox_image="unused")
+        event = AmbientEvent(
+            type="file_change",
+            data={"src_path": str(git_repo / "test.py")},
+            task_spec={"goal": "Test goal"},
+        )
+
+        first = await workspace.build_context(event)
+        assert await workspace.build_context(event) is first
+
+        (git_repo / "test.py").write_text("def hello():\n    print('Hi')\n")
+        edited = await workspace.build_context(event)
+        assert edited is not first
+        assert "print('Hi')" in edited.current_diff
+
+        proposal = Proposal(
+            agent="Test",
+            title="Edit file",
+            description="desc",
+            diff="--- a/test.py\n+++ b/test.py\n@@ -1,2 +1,2 @@\n def hello():\n-    print('Hi')\n+    print('Hey')\n",
+            risk_level="low",
+            rationale="r",
+            files_touched=["test.py"],
+            estimated_loc_change=1,
+        )
+        assert (await workspace.apply_patch(proposal)).ok
+        assert workspace._context_cache == {}
+
+
 @pytest.mark.asyncio
 class TestWorkspaceSafePaths:
     """Test safe path resolution."""
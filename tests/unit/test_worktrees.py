@@ -39,3 +39,51 @@ def test_create_and_remove_candidate(tmp_path: Path) -> None:
     manager.remove_candidate(candidate)
 
     assert not candidate.worktree_path.exists()
+
+
+def test_pooled_candidates_reuse_slots(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo(repo)
+
+    manager = ReviewWorktreeManager(
+        repo_path=repo,
+        base_dir=repo / ".ambient" / "reviews",
+        branch_prefix="ambient/review",
+    )
+    assert manager.warm_pool(1) == 1
+
+    first = manager.create_candidate("run1", 1, "First")
+    assert first.pooled
+    (first.worktree_path / "scratch.txt").write_text("leftover\n")
+    manager.release_candidate(first, keep_branch=True)
+
+    second = manager.create_candidate("run1", 2, "Second")
+    assert second.worktree_path == first.worktree_path
+    assert not (second.worktree_path / "scratch.txt").exists()
+    head = subprocess.run(
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        cwd=second.worktree_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    assert head == second.branch
+
+    # Pool is empty while the slot is taken, so the next candidate gets its own worktree.
+    third = manager.create_candidate("run1", 3, "Third")
+    assert not third.pooled
+    assert third.worktree_path != second.worktree_path
+
+    manager.release_candidate(second, keep_branch=False)
+    manager.release_candidate(third, keep_branch=False)
+    branches = subprocess.run(
+        ["git", "branch", "--list", "ambient/review/*"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert first.branch in branches
+    assert second.branch not in branches
+    assert not third.worktree_path.exists()